@@ -4,13 +4,14 @@ Authentication module for Hopx CLI.
 Provides secure credential storage, OAuth flows, and API key management.
 """
 
-from hopx_cli.auth.api_keys import APIKeyManager
+from hopx_cli.auth.api_keys import APIKeyManager, APIKeyRecord
 from hopx_cli.auth.credentials import CredentialStore
 from hopx_cli.auth.oauth import browser_login, browser_login_headless, refresh_oauth_token
 from hopx_cli.auth.token import TokenManager
 
 __all__ = [
     "APIKeyManager",
+    "APIKeyRecord",
     "CredentialStore",
     "TokenManager",
     "browser_login",
@@ -5,14 +5,95 @@ Provides interface to list, create, and revoke API keys (requires OAuth).
 Matches console implementation exactly (api-client.ts lines 856-872).
 """
 
-from typing import Any, Literal
+import warnings
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from typing import Any, Literal, get_args
 
 import httpx
 
 # Valid expiration options - must match API schema exactly
 # From types.ts line 245: expires_in: "1month" | "3months" | "6months" | "1year" | "never"
 ExpiresIn = Literal["1month", "3months", "6months", "1year", "never"]
-EXPIRES_OPTIONS: list[str] = ["1month", "3months", "6months", "1year", "never"]
+# Frozenset for O(1) validation; derived from ExpiresIn so the two cannot drift
+_EXPIRES_ORDER: tuple[str, ...] = get_args(ExpiresIn)
+EXPIRES_OPTIONS: frozenset[str] = frozenset(_EXPIRES_ORDER)
+
+
+@dataclass(slots=True, frozen=True)
+class APIKeyRecord:
+    """API key metadata returned by list and get (never the secret value).
+
+    Attributes:
+        id: API key ID used for get and revoke
+        name: Human-readable key name
+        key_id: Public key identifier
+        prefix: Key prefix shown in listings
+        status: Key status (e.g. "active")
+        masked_key: Masked key value
+        created_at: ISO 8601 creation timestamp
+        expires_at: ISO 8601 expiration timestamp, or None if the key never expires
+        last_used_at: ISO 8601 timestamp of last use, or None if never used
+        extra: Payload fields the attributes above do not cover
+    """
+
+    id: str = ""
+    name: str = ""
+    key_id: str | None = None
+    prefix: str | None = None
+    status: str | None = None
+    masked_key: str | None = None
+    created_at: str | None = None
+    expires_at: str | None = None
+    last_used_at: str | None = None
+    extra: Mapping[str, Any] = field(default_factory=dict, hash=False)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "APIKeyRecord":
+        """Build a record from an API payload, keeping unknown fields in ``extra``."""
+        return cls(
+            **{name: data[name] for name in _RECORD_FIELDS if name in data},
+            extra={key: value for key, value in data.items() if key not in _RECORD_FIELDS},
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        """Look up a payload field by name, as when list and get returned dicts.
+
+        Deprecated; use the attributes or ``extra`` instead. Will be removed
+        in the next minor release.
+
+        Raises:
+            KeyError: If the payload had no such field
+        """
+        warnings.warn(
+            "APIKeyRecord[key] is deprecated; use attributes or .extra",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self._lookup(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style get(), deprecated along with ``record[key]``."""
+        warnings.warn(
+            "APIKeyRecord.get() is deprecated; use attributes or .extra",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        try:
+            return self._lookup(key)
+        except KeyError:
+            return default
+
+    def _lookup(self, key: str) -> Any:
+        if key in _RECORD_FIELDS:
+            return getattr(self, key)
+        return self.extra[key]
+
+
+# Typed payload fields; everything else goes to APIKeyRecord.extra
+_RECORD_FIELDS: frozenset[str] = frozenset(
+    f.name for f in fields(APIKeyRecord) if f.name != "extra"
+)
 
 
 class APIKeyManager:
@@ -51,15 +132,14 @@ class APIKeyManager:
         """Close HTTP client."""
         self.client.close()
 
-    def list_keys(self) -> list[dict[str, Any]]:
+    def list_keys(self) -> list[APIKeyRecord]:
         """
         List all API keys for the organization.
 
         Endpoint: GET /auth/api-keys (api-client.ts line 858)
 
         Returns:
-            List of API key objects with id, key_id, name, status, masked_key,
-            created_at, expires_at
+            List of API key records
 
         Response format (types.ts lines 237-241):
             {
@@ -79,8 +159,7 @@ class APIKeyManager:
         if not data.get("success", True):
             raise RuntimeError(data.get("message", "Failed to list API keys"))
 
-        result: list[dict[str, Any]] = data.get("api_keys", [])
-        return result
+        return [APIKeyRecord.from_dict(key) for key in data.get("api_keys", [])]
 
     def create_key(self, name: str, expires_in: ExpiresIn = "never") -> dict[str, Any]:
         """
@@ -119,7 +198,7 @@ class APIKeyManager:
         # Validate expires_in
         if expires_in not in EXPIRES_OPTIONS:
             raise ValueError(
-                f"Invalid expires_in: {expires_in}. Must be one of: {', '.join(EXPIRES_OPTIONS)}"
+                f"Invalid expires_in: {expires_in}. Must be one of: {', '.join(_EXPIRES_ORDER)}"
             )
 
         # FIXED: Use expires_in enum, not expires ISO date
@@ -163,7 +242,7 @@ class APIKeyManager:
         data = response.json()
         return bool(data.get("success", False))
 
-    def get_key(self, key_id: str) -> dict[str, Any]:
+    def get_key(self, key_id: str) -> APIKeyRecord:
         """
         Get details for a specific API key by ID.
 
@@ -173,8 +252,7 @@ class APIKeyManager:
             key_id: API key ID to retrieve
 
         Returns:
-            API key object with id, key_id, name, status, masked_key,
-            created_at, expires_at
+            API key record
 
         Raises:
             httpx.HTTPError: If request fails
@@ -187,5 +265,4 @@ class APIKeyManager:
         if not data.get("success", True):
             raise RuntimeError(data.get("message", "Failed to get API key"))
 
-        result: dict[str, Any] = data.get("api_key", {})
-        return result
+        return APIKeyRecord.from_dict(data.get("api_key", {}))
@@ -4,30 +4,148 @@ Secure credential storage for Hopx CLI.
 Stores credentials in system keyring with fallback to encrypted config file.
 """
 
+import functools
+import json
+import operator
 import os
 import stat
 from pathlib import Path
-from typing import Any
-
-import keyring
-import yaml
+from typing import Any, Protocol
 
 KEYRING_SERVICE = "hopx-cli"
 
+# Imported on first use by _keyring(); backend discovery makes `import keyring`
+# cost tens of milliseconds, which commands that never touch credentials skip
+keyring: Any = None
+
+# Per-field keyring entries written by earlier releases, now folded into a
+# single "oauth_token" entry on first read
+_LEGACY_OAUTH_FIELDS = ("oauth_access", "oauth_refresh", "oauth_expires")
+
+# Every keyring field a profile may hold; clear() deletes all of them
+_KEYRING_FIELDS = ("api_key", "oauth_token", *_LEGACY_OAUTH_FIELDS)
+
+_get_access_token = operator.itemgetter("access_token")
+
+
+def _keyring() -> Any:
+    """Return the keyring module, importing it on first call."""
+    global keyring
+    if keyring is None:
+        import keyring as keyring_module
+
+        keyring = keyring_module
+    return keyring
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_keyring_get(key: str) -> str | None:
+    """Read a keyring entry once per process.
+
+    Keyring lookups cross a process boundary (Secret Service, Keychain), so
+    repeated auth checks within one command reuse the first answer. Errors
+    are not cached.
+    """
+    return _keyring().get_password(KEYRING_SERVICE, key)
+
+
+class _FileBackend(Protocol):
+    """Filesystem operations used for the credentials file."""
+
+    def read_bytes(self, path: Path) -> bytes:
+        """Return the file contents; raise FileNotFoundError if missing."""
+        ...
+
+    def write_bytes(self, path: Path, data: bytes, mode: int = 0o600) -> None:
+        """Replace the file contents, creating it and its directory if needed."""
+        ...
+
+    def unlink(self, path: Path) -> None:
+        """Remove the file; raise FileNotFoundError if missing."""
+        ...
+
+    def stat(self, path: Path) -> tuple[int, int]:
+        """Return (mtime_ns, size); raise FileNotFoundError if missing."""
+        ...
+
+
+class _OsFileBackend:
+    """File backend for the real filesystem."""
+
+    def read_bytes(self, path: Path) -> bytes:
+        return path.read_bytes()
+
+    def write_bytes(self, path: Path, data: bytes, mode: int = 0o600) -> None:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Create with the final mode so the file is never readable by others;
+        # the mode only applies on creation, so also narrow an existing file
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+
+    def unlink(self, path: Path) -> None:
+        path.unlink()
+
+    def stat(self, path: Path) -> tuple[int, int]:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+
+
+_OS_BACKEND = _OsFileBackend()
+
+
+# credentials.yaml files that could not be converted to JSON in this process;
+# they are read as they are rather than converted again on every construction
+_unconverted_yaml_files: set[Path] = set()
+
+
+def _parse_creds(path: Path, raw: bytes) -> dict[str, Any]:
+    """Parse a credentials file, as YAML for a legacy .yaml file, else JSON."""
+    if path.suffix == ".yaml":
+        # Only needed for files left by earlier releases
+        import yaml
+
+        return yaml.safe_load(raw) or {}
+    return json.loads(raw) or {}
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_file_creds(
+    backend: _FileBackend,
+    path: Path,
+    mtime_ns: int,  # noqa: ARG001
+    size: int,  # noqa: ARG001
+) -> dict[str, Any]:
+    """Parse the credentials file, keyed by its stat so edits invalidate it."""
+    return _parse_creds(path, backend.read_bytes(path))
+
+
+def _clear_caches() -> None:
+    """Drop cached keyring and file reads after any credential write."""
+    _cached_keyring_get.cache_clear()
+    _cached_file_creds.cache_clear()
+
 
 class CredentialStore:
     """Manages secure storage and retrieval of API keys and OAuth tokens."""
 
-    def __init__(self, profile: str = "default") -> None:
+    def __init__(self, profile: str = "default", backend: _FileBackend | None = None) -> None:
         """
         Initialize credential store.
 
         Args:
             profile: Profile name for multi-account support (default: "default")
+            backend: File operations for the credentials file (default: real filesystem)
         """
         self.profile = profile
+        self.backend = backend or _OS_BACKEND
+        # Keyring entry names for this profile, built once
+        self._keyring_keys = {field: f"{profile}:{field}" for field in _KEYRING_FIELDS}
         self.config_dir = Path.home() / ".hopx"
-        self.credentials_file = self.config_dir / "credentials.yaml"
+        self.credentials_file = self.config_dir / "credentials.json"
+        self.legacy_file = self.config_dir / "credentials.yaml"
+        self._migrate_yaml_credentials()
 
     def store_api_key(self, api_key: str, use_keyring: bool = True) -> None:
         """
@@ -39,9 +157,10 @@ class CredentialStore:
             api_key: API key to store
             use_keyring: Whether to attempt keyring storage (default: True)
         """
+        _clear_caches()
         if use_keyring:
             try:
-                keyring.set_password(KEYRING_SERVICE, f"{self.profile}:api_key", api_key)
+                _keyring().set_password(KEYRING_SERVICE, self._keyring_keys["api_key"], api_key)
                 return
             except Exception:
                 pass
@@ -58,7 +177,7 @@ class CredentialStore:
             API key if found, None otherwise
         """
         try:
-            key = keyring.get_password(KEYRING_SERVICE, f"{self.profile}:api_key")
+            key = _cached_keyring_get(self._keyring_keys["api_key"])
             if key:
                 return key
         except Exception:
@@ -74,29 +193,24 @@ class CredentialStore:
         """
         Store OAuth token data.
 
-        Stores both access token and refresh token in keyring or config file.
+        Stores the whole token as one JSON keyring entry, or in the config
+        file if the keyring is unavailable.
 
         Args:
             token: Dictionary containing access_token, refresh_token, and expires_at
         """
-        access_token = token.get("access_token")
-        refresh_token = token.get("refresh_token")
-        expires_at = token.get("expires_at")
-
+        try:
+            access_token = _get_access_token(token)
+        except KeyError:
+            raise ValueError("Token must contain access_token") from None
         if not access_token:
             raise ValueError("Token must contain access_token")
 
+        _clear_caches()
         try:
-            if access_token:
-                keyring.set_password(KEYRING_SERVICE, f"{self.profile}:oauth_access", access_token)
-            if refresh_token:
-                keyring.set_password(
-                    KEYRING_SERVICE, f"{self.profile}:oauth_refresh", refresh_token
-                )
-            if expires_at:
-                keyring.set_password(
-                    KEYRING_SERVICE, f"{self.profile}:oauth_expires", str(expires_at)
-                )
+            _keyring().set_password(
+                KEYRING_SERVICE, self._keyring_keys["oauth_token"], json.dumps(token)
+            )
             return
         except Exception:
             pass
@@ -111,19 +225,9 @@ class CredentialStore:
             Dictionary with access_token, refresh_token, and expires_at, or None
         """
         try:
-            access_token = keyring.get_password(KEYRING_SERVICE, f"{self.profile}:oauth_access")
-            refresh_token = keyring.get_password(KEYRING_SERVICE, f"{self.profile}:oauth_refresh")
-            expires_at_str = keyring.get_password(KEYRING_SERVICE, f"{self.profile}:oauth_expires")
-
-            if access_token:
-                token: dict[str, Any] = {"access_token": access_token}
-                if refresh_token:
-                    token["refresh_token"] = refresh_token
-                if expires_at_str:
-                    try:
-                        token["expires_at"] = int(expires_at_str)
-                    except ValueError:
-                        pass
+            raw = _cached_keyring_get(self._keyring_keys["oauth_token"])
+            token = json.loads(raw) if raw else self._migrate_legacy_oauth_token()
+            if isinstance(token, dict) and token.get("access_token"):
                 return token
         except Exception:
             pass
@@ -133,29 +237,134 @@ class CredentialStore:
             return dict(result)
         return None
 
-    def clear(self) -> None:
-        """Remove all stored credentials for this profile."""
+    def _migrate_legacy_oauth_token(self) -> dict[str, Any] | None:
+        """
+        Read an OAuth token stored as separate per-field keyring entries.
+
+        A token found this way is rewritten as a single entry and the old
+        entries are removed. Migration failures leave the old entries intact.
+
+        Returns:
+            Token dictionary, or None if no legacy access token is stored
+        """
+        access_token, refresh_token, expires_at_str = (
+            _cached_keyring_get(self._keyring_keys[field]) for field in _LEGACY_OAUTH_FIELDS
+        )
+        if not access_token:
+            return None
+
+        token: dict[str, Any] = {"access_token": access_token}
+        if refresh_token:
+            token["refresh_token"] = refresh_token
+        if expires_at_str:
+            try:
+                token["expires_at"] = int(expires_at_str)
+            except ValueError:
+                pass
+
         try:
-            keyring.delete_password(KEYRING_SERVICE, f"{self.profile}:api_key")
+            _keyring().set_password(
+                KEYRING_SERVICE, self._keyring_keys["oauth_token"], json.dumps(token)
+            )
+            for field in _LEGACY_OAUTH_FIELDS:
+                _keyring().delete_password(KEYRING_SERVICE, self._keyring_keys[field])
         except Exception:
             pass
+        finally:
+            _clear_caches()
+
+        return token
+
+    def clear(self) -> None:
+        """Remove all stored credentials for this profile."""
+        for field in _KEYRING_FIELDS:
+            try:
+                _keyring().delete_password(KEYRING_SERVICE, self._keyring_keys[field])
+            except Exception:
+                pass
+        _clear_caches()
+
+        self._delete_from_config()
+
+    def _migrate_yaml_credentials(self) -> None:
+        """
+        Convert a credentials.yaml file from earlier releases to JSON.
+
+        Runs only when the YAML file exists and the JSON file does not. The
+        YAML file is left in place so an older CLI still finds it. If the
+        conversion fails, that is recorded for the process and the YAML file
+        is read directly instead.
+        """
+        if (
+            self.legacy_file in _unconverted_yaml_files
+            or self._config_file_exists()
+            or not self._config_file_exists(self.legacy_file)
+        ):
+            return
 
         try:
-            keyring.delete_password(KEYRING_SERVICE, f"{self.profile}:oauth_access")
+            data = _parse_creds(self.legacy_file, self.backend.read_bytes(self.legacy_file))
+            self._save_config_file(data)
         except Exception:
-            pass
+            _unconverted_yaml_files.add(self.legacy_file)
+
+    def _creds_file(self) -> Path | None:
+        """
+        Pick the file credentials are read from.
 
+        Returns:
+            The JSON file, else a legacy YAML file that was not converted,
+            else None if neither exists
+        """
+        for path in (self.credentials_file, self.legacy_file):
+            if self._config_file_exists(path):
+                return path
+        return None
+
+    def _config_file_exists(self, path: Path | None = None) -> bool:
+        """
+        Check whether a file exists through the file backend.
+
+        Args:
+            path: File to check (default: the credentials file)
+
+        Returns:
+            True if the file exists
+        """
         try:
-            keyring.delete_password(KEYRING_SERVICE, f"{self.profile}:oauth_refresh")
-        except Exception:
-            pass
+            self.backend.stat(path or self.credentials_file)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _load_config_file(self) -> dict[str, Any]:
+        """
+        Read the whole credentials file for modification.
 
+        Returns:
+            Parsed file contents, or an empty dict if missing or unreadable
+        """
+        path = self._creds_file()
+        if path is None:
+            return {}
         try:
-            keyring.delete_password(KEYRING_SERVICE, f"{self.profile}:oauth_expires")
+            return _parse_creds(path, self.backend.read_bytes(path))
         except Exception:
-            pass
+            return {}
 
-        self._delete_from_config()
+    def _save_config_file(self, data: dict[str, Any]) -> None:
+        """
+        Write the whole credentials file with owner-only permissions.
+
+        Args:
+            data: Credentials for all profiles
+        """
+        self.backend.write_bytes(
+            self.credentials_file,
+            json.dumps(data, separators=(",", ":")).encode(),
+            stat.S_IRUSR | stat.S_IWUSR,
+        )
+        _clear_caches()
 
     def _write_to_config(self, key: str, value: Any) -> None:
         """
@@ -167,25 +376,14 @@ class CredentialStore:
             key: Credential key (e.g., "api_key", "oauth_token")
             value: Credential value
         """
-        self.config_dir.mkdir(parents=True, exist_ok=True)
-
-        data: dict[str, Any] = {}
-        if self.credentials_file.exists():
-            try:
-                with open(self.credentials_file) as f:
-                    data = yaml.safe_load(f) or {}
-            except Exception:
-                pass
+        data = self._load_config_file()
 
         if self.profile not in data:
             data[self.profile] = {}
 
         data[self.profile][key] = value
 
-        with open(self.credentials_file, "w") as f:
-            yaml.safe_dump(data, f)
-
-        os.chmod(self.credentials_file, stat.S_IRUSR | stat.S_IWUSR)
+        self._save_config_file(data)
 
     def _read_from_config(self, key: str) -> Any:
         """
@@ -197,74 +395,96 @@ class CredentialStore:
         Returns:
             Credential value or None if not found
         """
-        if not self.credentials_file.exists():
+        path = self._creds_file()
+        if path is None:
             return None
-
         try:
-            with open(self.credentials_file) as f:
-                data = yaml.safe_load(f) or {}
-                return data.get(self.profile, {}).get(key)
+            mtime_ns, size = self.backend.stat(path)
+            data = _cached_file_creds(self.backend, path, mtime_ns, size)
+            return data.get(self.profile, {}).get(key)
         except Exception:
             return None
 
     def _delete_from_config(self) -> None:
-        """Remove all credentials for this profile from config file."""
-        if not self.credentials_file.exists():
-            return
+        """Remove all credentials for this profile from the config file.
 
+        The profile is removed from a legacy credentials.yaml too, so logging
+        out does not leave its tokens behind for an older CLI to use.
+        """
         try:
-            with open(self.credentials_file) as f:
-                data = yaml.safe_load(f) or {}
-
-            if self.profile in data:
-                del data[self.profile]
-
-            if data:
-                with open(self.credentials_file, "w") as f:
-                    yaml.safe_dump(data, f)
-                os.chmod(self.credentials_file, stat.S_IRUSR | stat.S_IWUSR)
-            else:
-                self.credentials_file.unlink()
+            data = self._load_config_file()
+            if self._config_file_exists():
+                data.pop(self.profile, None)
+                if data:
+                    self._save_config_file(data)
+                else:
+                    self.backend.unlink(self.credentials_file)
         except Exception:
             pass
 
+        try:
+            self._delete_from_legacy_file()
+        except Exception:
+            pass
+        finally:
+            _clear_caches()
+
+    def _delete_from_legacy_file(self) -> None:
+        """Remove this profile from credentials.yaml, deleting the file once empty."""
+        if not self._config_file_exists(self.legacy_file):
+            return
+
+        import yaml
+
+        data = _parse_creds(self.legacy_file, self.backend.read_bytes(self.legacy_file))
+        if self.profile not in data:
+            return
+        del data[self.profile]
+        if data:
+            self.backend.write_bytes(self.legacy_file, yaml.safe_dump(data).encode())
+        else:
+            self.backend.unlink(self.legacy_file)
+
     @classmethod
-    def clear_all_profiles(cls) -> list[str]:
+    def clear_all_profiles(cls, backend: _FileBackend | None = None) -> list[str]:
         """Remove credentials for all profiles from keyring and config file.
 
+        Args:
+            backend: File operations for the credentials file (default: real filesystem)
+
         Returns:
             List of profile names that were cleared
         """
         cleared_profiles = []
-        config_dir = Path.home() / ".hopx"
-        credentials_file = config_dir / "credentials.yaml"
+        # Constructing a store also migrates a legacy YAML file
+        default_store = cls(backend=backend)
 
         # Get all profiles from credentials file
-        profiles_from_file = set()
-        if credentials_file.exists():
-            try:
-                with open(credentials_file) as f:
-                    data = yaml.safe_load(f) or {}
-                    profiles_from_file = set(data.keys())
-            except Exception:
-                pass
+        profiles_from_file = set(default_store._load_config_file())
 
         # Add "default" profile (always attempt to clear)
         all_profiles = profiles_from_file | {"default"}
 
         # Clear each profile from keyring
         for profile in all_profiles:
-            store = cls(profile=profile)
+            store = cls(profile=profile, backend=backend)
             try:
                 # Check if profile has any credentials before adding to list
                 has_creds = False
                 try:
-                    if keyring.get_password(KEYRING_SERVICE, f"{profile}:api_key"):
+                    if _keyring().get_password(KEYRING_SERVICE, store._keyring_keys["api_key"]):
+                        has_creds = True
+                except Exception:
+                    pass
+                try:
+                    if _keyring().get_password(KEYRING_SERVICE, store._keyring_keys["oauth_token"]):
                         has_creds = True
                 except Exception:
                     pass
                 try:
-                    if keyring.get_password(KEYRING_SERVICE, f"{profile}:oauth_access"):
+                    if _keyring().get_password(
+                        KEYRING_SERVICE, store._keyring_keys["oauth_access"]
+                    ):
                         has_creds = True
                 except Exception:
                     pass
@@ -283,11 +503,12 @@ class CredentialStore:
             except Exception:
                 pass
 
-        # Delete the entire credentials file
-        if credentials_file.exists():
+        # Delete the entire credentials file, and any legacy YAML file
+        for path in (default_store.credentials_file, default_store.legacy_file):
             try:
-                credentials_file.unlink()
+                default_store.backend.unlink(path)
             except Exception:
                 pass
+        _clear_caches()
 
         return cleared_profiles
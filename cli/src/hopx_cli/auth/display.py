@@ -1,9 +1,8 @@
 """Authentication display utilities for beautiful terminal output."""
 
+import functools
 from typing import Any
 
-import pyperclip
-import qrcode
 from rich.console import Console
 
 console = Console()
@@ -35,6 +34,8 @@ def show_auth_url(
     # Auto-copy to clipboard
     if auto_copy:
         try:
+            import pyperclip
+
             pyperclip.copy(url)
             console.print()
             console.print("  [dim](copied to clipboard)[/dim]")
@@ -53,28 +54,44 @@ def _print_qr_code(url: str) -> None:
     Args:
         url: The URL to encode in the QR code
     """
-    import io
-
     try:
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=1,
-            border=1,
-        )
-        qr.add_data(url)
-        qr.make(fit=True)
-
-        # Generate ASCII output
-        f = io.StringIO()
-        qr.print_ascii(out=f, invert=True)
-        qr_text = f.getvalue()
-
-        # Print with indentation
-        for line in qr_text.strip().split("\n"):
-            console.print(f"  {line}")
+        qr_text = _render_qr(url)
     except Exception:
-        pass  # QR generation failed, skip silently
+        return  # QR generation failed, skip silently
+
+    console.print(qr_text)
+
+
+@functools.lru_cache(maxsize=32)
+def _render_qr(url: str) -> str:
+    """Render a URL as an indented ASCII QR code.
+
+    Cached per URL so login retries skip the matrix computation. Failures
+    raise and are therefore not cached.
+
+    Args:
+        url: The URL to encode in the QR code
+
+    Returns:
+        QR code text, one indented line per row
+    """
+    import io
+
+    import qrcode
+
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=1,
+        border=1,
+    )
+    qr.add_data(url)
+    qr.make(fit=True)
+
+    # Generate ASCII output
+    f = io.StringIO()
+    qr.print_ascii(out=f, invert=True)
+    return "\n".join(f"  {line}" for line in f.getvalue().strip().split("\n"))
 
 
 def show_headless_instructions() -> None:
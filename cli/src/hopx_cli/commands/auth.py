@@ -293,6 +293,11 @@ def logout(
         credentials.clear()
         console.print(f"[green]✓[/green] Cleared credentials for profile [cyan]{profile}[/cyan]")
 
+    # The config file's JSON copy holds API keys too
+    from hopx_cli.core.config import remove_config_cache
+
+    remove_config_cache()
+
 
 @app.command("status")
 def status(ctx: typer.Context) -> None:
@@ -551,21 +556,23 @@ def keys_list(ctx: typer.Context) -> None:
         table.add_column("Last Used", justify="right")
 
         for key in keys:
-            key_id = key.get("id", "-")
-            name = key.get("name", "-")
-            prefix = key.get("prefix", "-")
-
             # Format dates
-            created_at = key.get("created_at")
-            created_str = _format_datetime(created_at) if created_at else "-"
-
-            expires_at = key.get("expires_at")
-            expires_str = _format_datetime(expires_at) if expires_at else "[green]Never[/green]"
-
-            last_used_at = key.get("last_used_at")
-            last_used_str = _format_datetime(last_used_at) if last_used_at else "[dim]Never[/dim]"
+            created_str = _format_datetime(key.created_at) if key.created_at else "-"
+            expires_str = (
+                _format_datetime(key.expires_at) if key.expires_at else "[green]Never[/green]"
+            )
+            last_used_str = (
+                _format_datetime(key.last_used_at) if key.last_used_at else "[dim]Never[/dim]"
+            )
 
-            table.add_row(key_id, name, prefix, created_str, expires_str, last_used_str)
+            table.add_row(
+                key.id or "-",
+                key.name or "-",
+                key.prefix or "-",
+                created_str,
+                expires_str,
+                last_used_str,
+            )
 
         console.print(table)
 
@@ -800,15 +807,15 @@ def keys_info(
 
         # Build panel content
         lines = []
-        lines.append(f"[bold]ID:[/bold]         {key.get('id', '-')}")
-        lines.append(f"[bold]Name:[/bold]       {key.get('name', '-')}")
-        lines.append(f"[bold]Prefix:[/bold]     {key.get('prefix', '-')}")
+        lines.append(f"[bold]ID:[/bold]         {key.id or '-'}")
+        lines.append(f"[bold]Name:[/bold]       {key.name or '-'}")
+        lines.append(f"[bold]Prefix:[/bold]     {key.prefix or '-'}")
 
-        created_at = key.get("created_at")
+        created_at = key.created_at
         if created_at:
             lines.append(f"[bold]Created:[/bold]    {_format_datetime(created_at)}")
 
-        expires_at = key.get("expires_at")
+        expires_at = key.expires_at
         if expires_at:
             expires_str = _format_datetime(expires_at)
             expires_dt = datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
@@ -819,7 +826,7 @@ def keys_info(
         else:
             lines.append("[bold]Expires:[/bold]    [green]Never[/green]")
 
-        last_used_at = key.get("last_used_at")
+        last_used_at = key.last_used_at
         if last_used_at:
             lines.append(f"[bold]Last Used:[/bold]  {_format_datetime(last_used_at)}")
         else:
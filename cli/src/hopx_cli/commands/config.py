@@ -12,11 +12,10 @@ from typing import Any
 
 import click
 import typer
-import yaml
 from rich.console import Console
 from rich.table import Table
 
-from ..core.config import CLIConfig
+from ..core.config import CLIConfig, load_yaml, write_config_file
 from ..core.context import CLIContext
 
 app = typer.Typer(
@@ -78,7 +77,7 @@ def load_all_profiles() -> dict[str, Any]:
 
     try:
         with open(config_path) as f:
-            data = yaml.safe_load(f) or {}
+            data = load_yaml(f) or {}
 
             # Handle legacy format (flat profiles dict)
             if "default_profile" not in data:
@@ -96,10 +95,7 @@ def save_all_profiles(data: dict[str, Any]) -> None:
         data: Dictionary with default_profile and profiles keys
     """
     config_path = CLIConfig.get_config_path()
-    config_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(config_path, "w") as f:
-        yaml.safe_dump(data, f, default_flow_style=False)
+    write_config_file(config_path, data)
 
     # Set secure file permissions (0600)
     os.chmod(config_path, 0o600)
@@ -32,6 +32,18 @@ app = typer.Typer(
 )
 console = Console()
 
+# Rich color for each sandbox status, keyed by lower-case status
+STATUS_COLORS = {
+    "running": "green",
+    "active": "green",
+    "ready": "green",
+    "paused": "yellow",
+    "creating": "yellow",
+    "stopped": "red",
+    "killed": "red",
+    "error": "red",
+}
+
 
 def _parse_env_vars(
     env_list: list[str] | None,
@@ -184,16 +196,8 @@ def _format_status_colored(status: str) -> str:
     Returns:
         Formatted status with Rich color tags
     """
-    status_lower = status.lower()
-
-    if status_lower in ("running", "active", "ready"):
-        return f"[green]{status}[/green]"
-    elif status_lower in ("paused", "creating"):
-        return f"[yellow]{status}[/yellow]"
-    elif status_lower in ("stopped", "killed", "error"):
-        return f"[red]{status}[/red]"
-    else:
-        return status
+    color = STATUS_COLORS.get(status.lower())
+    return f"[{color}]{status}[/{color}]" if color else status
 
 
 @app.command("create")
@@ -8,37 +8,74 @@ This module provides core functionality for the CLI including:
 - SDK client initialization and caching
 """
 
-from .async_helpers import gather_with_concurrency, run_async, run_with_timeout
-from .config import CLIConfig
-from .context import CLIContext, OutputFormat
-from .errors import (
-    AuthenticationError,
-    CLIError,
-    NetworkError,
-    NotFoundError,
-    RateLimitError,
-    TimeoutError,
-    ValidationError,
-    handle_errors,
-)
-from .sdk import (
-    clear_sandbox_cache,
-    create_sandbox,
-    create_sandbox_async,
-    get_cached_sandbox_ids,
-    get_sandbox,
-    get_sandbox_async,
-    list_sandboxes,
-    list_sandboxes_async,
-)
-from .version import (
-    VersionInfo,
-    check_pypi_version,
-    compare_versions,
-    detect_install_method,
-    get_install_method_display,
-    get_update_command,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .async_helpers import gather_with_concurrency, run_async, run_with_timeout
+    from .config import CLIConfig
+    from .context import CLIContext, OutputFormat
+    from .errors import (
+        AuthenticationError,
+        CLIError,
+        NetworkError,
+        NotFoundError,
+        RateLimitError,
+        TimeoutError,
+        ValidationError,
+        handle_errors,
+    )
+    from .sdk import (
+        clear_sandbox_cache,
+        create_sandbox,
+        create_sandbox_async,
+        get_cached_sandbox_ids,
+        get_sandbox,
+        get_sandbox_async,
+        list_sandboxes,
+        list_sandboxes_async,
+    )
+    from .version import (
+        VersionInfo,
+        check_pypi_version,
+        compare_versions,
+        detect_install_method,
+        get_install_method_display,
+        get_update_command,
+    )
+
+# Submodules are imported on first attribute access so that importing one
+# piece (e.g. CLIConfig) does not load the SDK, Rich, and httpx for the rest.
+_LAZY_IMPORTS: dict[str, str] = {
+    "CLIConfig": "config",
+    "CLIContext": "context",
+    "OutputFormat": "context",
+    "CLIError": "errors",
+    "AuthenticationError": "errors",
+    "NotFoundError": "errors",
+    "TimeoutError": "errors",
+    "NetworkError": "errors",
+    "RateLimitError": "errors",
+    "ValidationError": "errors",
+    "handle_errors": "errors",
+    "run_async": "async_helpers",
+    "run_with_timeout": "async_helpers",
+    "gather_with_concurrency": "async_helpers",
+    "list_sandboxes": "sdk",
+    "list_sandboxes_async": "sdk",
+    "create_sandbox": "sdk",
+    "create_sandbox_async": "sdk",
+    "get_sandbox": "sdk",
+    "get_sandbox_async": "sdk",
+    "clear_sandbox_cache": "sdk",
+    "get_cached_sandbox_ids": "sdk",
+    "VersionInfo": "version",
+    "check_pypi_version": "version",
+    "compare_versions": "version",
+    "detect_install_method": "version",
+    "get_install_method_display": "version",
+    "get_update_command": "version",
+}
 
 __all__ = [
     # Config
@@ -76,3 +113,18 @@ __all__ = [
     "get_install_method_display",
     "get_update_command",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule that provides ``name`` on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported names in ``dir()``."""
+    return sorted([*globals(), *__all__])
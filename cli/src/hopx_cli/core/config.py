@@ -8,14 +8,162 @@ Configuration is loaded from:
 Environment variables take precedence over config file values.
 """
 
+import functools
+import json
+import os
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import IO, Any
 
-import yaml
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+@functools.cache
+def _yaml_classes() -> tuple[Any, Any]:
+    """PyYAML's safe loader and dumper classes, preferring libyaml's C versions.
+
+    Resolved on first use, so importing this module does not import yaml.
+
+    Returns:
+        (Loader class, Dumper class)
+    """
+    import yaml
+
+    return (
+        getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+        getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+    )
+
+
+def load_yaml(stream: IO[str]) -> Any:
+    """Parse YAML safely, using libyaml's C parser when PyYAML has it.
+
+    Args:
+        stream: Open text file to read
+
+    Returns:
+        Parsed document, or None if the file is empty
+    """
+    # What yaml.load() does, minus its per-call wrapper
+    loader = _yaml_classes()[0](stream)
+    try:
+        return loader.get_single_data()
+    finally:
+        loader.dispose()
+
+
+def dump_yaml(data: Any) -> bytes:
+    """Serialize data as block-style YAML, using libyaml's C emitter when available.
+
+    The document is built in memory so callers can write it in one call.
+
+    Args:
+        data: Plain data to serialize
+
+    Returns:
+        UTF-8 encoded YAML
+    """
+    import yaml
+
+    result: bytes = yaml.dump(
+        data, Dumper=_yaml_classes()[1], default_flow_style=False, encoding="utf-8"
+    )
+    return result
+
+
+def _freeze(obj: Any) -> Any:
+    """Return a read-only view of parsed YAML: mappings become proxies, lists tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(item) for item in obj)
+    return obj
+
+
+def _json_sidecar(path: Path) -> Path:
+    """Path of the JSON copy kept next to a YAML config file."""
+    return path.with_name(path.name + ".cache.json")
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_config_file(path: Path, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    """Parse the config file, keyed by its stat so edits invalidate it.
+
+    Reads the JSON sidecar instead when it was written from this exact YAML
+    file, which skips importing yaml. The sidecar records the YAML's mtime
+    and size, so a YAML file edited by hand or restored from elsewhere, even
+    with an older mtime, wins. The result is frozen, since every load()
+    shares it.
+    """
+    try:
+        cached = json.loads(_json_sidecar(path).read_bytes())
+        if cached["yaml"] == [mtime_ns, size]:
+            return _freeze(cached["config"] or {})
+    except (OSError, ValueError, LookupError, TypeError):
+        pass  # No usable sidecar; parse the YAML
+
+    with open(path) as f:
+        return _freeze(load_yaml(f) or {})
+
+
+def _clear_cache() -> None:
+    """Drop parsed config files after any config write."""
+    _cached_config_file.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _config_path(home: str | None) -> Path:
+    """Resolve ~/.hopx/config.yaml once per value of HOME.
+
+    Keying on HOME means a changed home directory, as in tests, is picked up
+    without clearing anything. Without HOME, Path.home() falls back to the
+    password database.
+    """
+    return (Path(home) if home else Path.home()) / ".hopx" / "config.yaml"
+
+
+def write_config_file(path: Path, data: dict[str, Any]) -> None:
+    """Write the config file and its JSON sidecar.
+
+    The sidecar records the stat of the YAML file it was written from, so
+    load() can tell when it no longer matches. It holds the same API keys,
+    so it is made readable by the owner only. Data JSON cannot encode, such
+    as dates, gets no sidecar; load() then reads the YAML.
+
+    Args:
+        path: Path of the YAML config file
+        data: Contents for the whole file
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(dump_yaml(data))
+    st = path.stat()
+
+    sidecar = _json_sidecar(path)
+    try:
+        encoded = json.dumps(
+            {"yaml": [st.st_mtime_ns, st.st_size], "config": data}, separators=(",", ":")
+        ).encode()
+    except (TypeError, ValueError):
+        sidecar.unlink(missing_ok=True)
+    else:
+        fd = os.open(sidecar, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(encoded)
+    _clear_cache()
+
+
+def remove_config_cache() -> None:
+    """Delete the JSON sidecar of the config file, along with the API keys it holds.
+
+    load() reads the YAML until the next save writes a new sidecar.
+    """
+    _json_sidecar(_config_path(os.environ.get("HOME"))).unlink(missing_ok=True)
+    _clear_cache()
+
+
 class CLIConfig(BaseSettings):
     """Configuration for the Hopx CLI.
 
@@ -80,23 +228,21 @@ class CLIConfig(BaseSettings):
             If config file does not exist, uses defaults and env vars.
         """
         config_path = cls.get_config_path()
-        file_config: dict[str, Any] = {}
+        file_config: Mapping[str, Any] = {}
 
-        # Load from file if exists
-        if config_path.exists():
-            try:
-                with open(config_path) as f:
-                    all_profiles = yaml.safe_load(f) or {}
-                    file_config = all_profiles.get(profile, {})
-            except Exception:
-                # Silently ignore file load errors, use env vars and defaults
-                pass
+        # Load from file if it exists; yaml is imported only when there is one.
+        # A missing file fails stat(), so no separate exists() check is needed.
+        try:
+            st = config_path.stat()
+            all_profiles = _cached_config_file(config_path, st.st_mtime_ns, st.st_size)
+            file_config = all_profiles.get(profile, {})
+        except Exception:
+            # Silently ignore missing or unreadable files, use env vars and defaults
+            pass
 
-        # Merge file config with environment variables
+        # Merge file config with environment variables in one construction
         # Pydantic Settings will automatically load env vars with HOPX_ prefix
-        config = cls(**file_config)
-        config.profile = profile
-        return config
+        return cls(**{**file_config, "profile": profile})
 
     @classmethod
     def get_config_path(cls) -> Path:
@@ -105,7 +251,7 @@ class CLIConfig(BaseSettings):
         Returns:
             Path to ~/.hopx/config.yaml
         """
-        return Path.home() / ".hopx" / "config.yaml"
+        return _config_path(os.environ.get("HOME"))
 
     def save(self) -> None:
         """Save current configuration to file.
@@ -114,14 +260,13 @@ class CLIConfig(BaseSettings):
         Creates the config directory if it does not exist.
         """
         config_path = self.get_config_path()
-        config_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Load existing profiles
         all_profiles: dict[str, Any] = {}
         if config_path.exists():
             try:
                 with open(config_path) as f:
-                    all_profiles = yaml.safe_load(f) or {}
+                    all_profiles = load_yaml(f) or {}
             except Exception:
                 pass
 
@@ -135,8 +280,7 @@ class CLIConfig(BaseSettings):
         }
 
         # Write back to file
-        with open(config_path, "w") as f:
-            yaml.safe_dump(all_profiles, f, default_flow_style=False)
+        write_config_file(config_path, all_profiles)
 
     def get_api_key(self) -> str:
         """Get API key from environment, config file, or credential store.
@@ -4,14 +4,14 @@ Provides context object that holds runtime state for commands including
 output format, verbosity, and other session-specific settings.
 """
 
-from enum import Enum
+from enum import StrEnum
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from .config import CLIConfig
 
 
-class OutputFormat(str, Enum):
+class OutputFormat(StrEnum):
     """Output format options for CLI commands.
 
     Attributes:
@@ -25,6 +25,11 @@ class OutputFormat(str, Enum):
     PLAIN = "plain"
 
 
+# Members by value; StrEnum members hash as their value, so members and plain
+# strings both look up here without going through Enum.__call__
+_FORMATS: dict[str, OutputFormat] = {fmt.value: fmt for fmt in OutputFormat}
+
+
 class CLIContext:
     """Runtime context for CLI commands.
 
@@ -39,6 +44,8 @@ class CLIContext:
         no_color: Disable color output (respects NO_COLOR env var)
     """
 
+    __slots__ = ("_state", "config", "no_color", "output_format", "quiet", "verbose")
+
     def __init__(
         self,
         config: "CLIConfig | None" = None,
@@ -63,7 +70,10 @@ class CLIContext:
             config = CLIConfig.load()
 
         self.config = config
-        self.output_format = output_format or OutputFormat(self.config.output_format)
+        # Always a member, so the is_*_output() checks can compare identity.
+        # Unknown values fall through to OutputFormat() for its ValueError.
+        value = output_format or self.config.output_format
+        self.output_format = _FORMATS.get(value) or OutputFormat(value)
         self.verbose = verbose
         self.quiet = quiet
         self.no_color = no_color
@@ -98,7 +108,7 @@ class CLIContext:
         Returns:
             True if JSON format is selected
         """
-        return self.output_format == OutputFormat.JSON
+        return self.output_format is OutputFormat.JSON
 
     def is_plain_output(self) -> bool:
         """Check if output format is plain text.
@@ -106,7 +116,7 @@ class CLIContext:
         Returns:
             True if plain text format is selected
         """
-        return self.output_format == OutputFormat.PLAIN
+        return self.output_format is OutputFormat.PLAIN
 
     def is_table_output(self) -> bool:
         """Check if output format is table.
@@ -114,4 +124,4 @@ class CLIContext:
         Returns:
             True if table format is selected
         """
-        return self.output_format == OutputFormat.TABLE
+        return self.output_format is OutputFormat.TABLE
@@ -2,12 +2,31 @@
 
 import sys
 
+from hopx_cli import __version__
+
+# Answer a bare `hopx --version` before importing Typer, Rich, or any command
+# module. `version_callback` still handles --version combined with other flags.
+if sys.argv[1:] in (["--version"], ["-V"]):
+    print(f"hopx {__version__}")
+    sys.exit(0)
+
+import contextlib
+import functools
+import importlib
+import os
+from collections.abc import Iterator
+from difflib import get_close_matches
+from typing import TYPE_CHECKING
+
+import click
 import typer
-from rich.console import Console
-from rich.table import Table
+from click.shell_completion import CompletionItem
+from typer.core import TyperGroup
 
-from hopx_cli import __version__
-from hopx_cli.core import CLIConfig, CLIContext, OutputFormat
+from hopx_cli.core import CLIContext, OutputFormat
+
+if TYPE_CHECKING:
+    from hopx_cli.core import CLIConfig
 
 
 def version_callback(value: bool) -> None:
@@ -17,52 +36,178 @@ def version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
-def _print_epilog() -> None:
-    """Print the help epilog with proper formatting using Rich."""
-    console = Console()
-
-    # Aliases table
-    aliases_table = Table(
-        show_header=False,
-        box=None,
-        padding=(0, 2, 0, 0),
-        collapse_padding=True,
+_ALIAS_ROWS: tuple[tuple[str, str, str], ...] = (
+    ("sb", "sandbox", "Manage sandboxes"),
+    ("tpl", "template", "Manage templates"),
+    ("f", "files", "File operations"),
+    ("term", "terminal", "Interactive terminals"),
+)
+
+_QUICK_START_ROWS: tuple[tuple[str, str], ...] = (
+    ("hopx auth login", "Authenticate with browser"),
+    ("hopx auth keys create", "Create and store API key"),
+    ("hopx sandbox create", "Create a new sandbox"),
+    ('hopx run "print(1)"', "Run code in sandbox"),
+)
+
+# Column widths are fixed by the row data above
+_ALIAS_WIDTH = max(len(row[0]) for row in _ALIAS_ROWS)
+_ALIAS_COMMAND_WIDTH = max(len(row[1]) for row in _ALIAS_ROWS)
+_QUICK_START_WIDTH = max(len(row[0]) for row in _QUICK_START_ROWS)
+
+# SGR codes matching the Rich styles used elsewhere in help output
+_BOLD, _DIM, _CYAN, _GREEN = "1", "2", "36", "32"
+
+
+@functools.cache
+def _render_epilog(color: bool) -> str:
+    """Render the static help epilog, with or without ANSI styling."""
+
+    def style(text: str, code: str) -> str:
+        return f"\033[{code}m{text}\033[0m" if color else text
+
+    lines = ["", style("Aliases:", _BOLD)]
+    lines.extend(
+        f"{style(alias.ljust(_ALIAS_WIDTH), _CYAN)}  {style('→', _DIM)}  "
+        f"{style(command.ljust(_ALIAS_COMMAND_WIDTH), _GREEN)}  {style(description, _DIM)}"
+        for alias, command, description in _ALIAS_ROWS
     )
-    aliases_table.add_column("alias", style="cyan")
-    aliases_table.add_column("arrow", style="dim")
-    aliases_table.add_column("command", style="green")
-    aliases_table.add_column("description", style="dim")
-
-    aliases_table.add_row("sb", "→", "sandbox", "Manage sandboxes")
-    aliases_table.add_row("tpl", "→", "template", "Manage templates")
-    aliases_table.add_row("f", "→", "files", "File operations")
-    aliases_table.add_row("term", "→", "terminal", "Interactive terminals")
-
-    console.print()
-    console.print("[bold]Aliases:[/bold]")
-    console.print(aliases_table)
-
-    # Quick Start table
-    quick_start_table = Table(
-        show_header=False,
-        box=None,
-        padding=(0, 2, 0, 0),
-        collapse_padding=True,
+    lines += ["", style("Quick Start:", _BOLD)]
+    lines.extend(
+        f"{style(command.ljust(_QUICK_START_WIDTH), _CYAN)}  {style(description, _DIM)}"
+        for command, description in _QUICK_START_ROWS
     )
-    quick_start_table.add_column("command", style="cyan")
-    quick_start_table.add_column("description", style="dim")
+    lines += ["", style("Docs: https://docs.hopx.dev | Support: support@hopx.ai", _DIM)]
+    return "\n".join(lines) + "\n"
+
+
+def _print_epilog() -> None:
+    """Print the help epilog after the root help output.
+
+    Color is used only on a terminal and when neither NO_COLOR nor
+    --no-color is set.
+    """
+    color = sys.stdout.isatty() and not os.environ.get("NO_COLOR") and "--no-color" not in sys.argv
+    sys.stdout.write(_render_epilog(color))
+    sys.stdout.flush()
+
+
+# (name, module, help, hidden) for every root subcommand. Modules are
+# imported on first dispatch so `hopx <cmd>` only pays for the one command
+# it runs. Aliases reuse a module and are hidden from help.
+COMMANDS: tuple[tuple[str, str, str | None, bool], ...] = (
+    ("init", "init", "First-run setup wizard", False),
+    ("system", "system", "System and health commands", False),
+    ("run", "run", "Execute code in sandboxes", False),
+    ("auth", "auth", "Authentication management", False),
+    ("sandbox", "sandbox", "Manage sandboxes", False),
+    ("sb", "sandbox", None, True),
+    ("template", "template", "Manage templates", False),
+    ("tpl", "template", None, True),
+    ("config", "config", "Configuration management", False),
+    ("files", "files", "File operations", False),
+    ("f", "files", None, True),
+    ("cmd", "cmd", "Run shell commands in sandboxes", False),
+    ("env", "env", "Manage environment variables", False),
+    ("terminal", "terminal", "Interactive terminal sessions", False),
+    ("term", "terminal", None, True),
+    ("org", "org", "Manage organization settings", False),
+    ("usage", "usage", "View usage statistics", False),
+    ("profile", "profile", "Manage user profile", False),
+    ("members", "members", "Manage organization members", False),
+    ("billing", "billing", "View billing information", False),
+    ("self-update", "self_update", "Update CLI to latest version", False),
+)
+
+LAZY_SUBCOMMANDS: dict[str, tuple[str, str | None, bool]] = {
+    name: (module, help_text, hidden) for name, module, help_text, hidden in COMMANDS
+}
 
-    quick_start_table.add_row("hopx auth login", "Authenticate with browser")
-    quick_start_table.add_row("hopx auth keys create", "Create and store API key")
-    quick_start_table.add_row("hopx sandbox create", "Create a new sandbox")
-    quick_start_table.add_row('hopx run "print(1)"', "Run code in sandbox")
 
-    console.print()
-    console.print("[bold]Quick Start:[/bold]")
-    console.print(quick_start_table)
+def _load_subcommand(name: str, rich_markup_mode: typer.core.MarkupMode) -> click.Command:
+    """Import a lazily registered subcommand and build its Click group."""
+    module_name, help_text, hidden = LAZY_SUBCOMMANDS[name]
+    module = importlib.import_module(f"hopx_cli.commands.{module_name}")
 
-    console.print()
-    console.print("[dim]Docs: https://docs.hopx.dev | Support: support@hopx.ai[/dim]")
+    # Register through a throwaway parent so Typer applies the same name,
+    # help, and hidden overrides that `add_typer` would.
+    parent = typer.Typer(rich_markup_mode=rich_markup_mode)
+    parent.add_typer(module.app, name=name, help=help_text, hidden=hidden)
+    group = typer.main.get_command(parent)
+    assert isinstance(group, click.Group)
+    return group.commands[name]
+
+
+class LazyTyperGroup(TyperGroup):
+    """Root Click group that imports subcommand modules on demand."""
+
+    _listing_only = False
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List commands in COMMANDS order, whether or not they are loaded yet."""
+        eager = [name for name in super().list_commands(ctx) if name not in LAZY_SUBCOMMANDS]
+        return [*LAZY_SUBCOMMANDS, *eager]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return a command, importing its module on first use.
+
+        While help or completion is listing commands, an unloaded command is
+        returned as a stand-in built from its COMMANDS entry instead.
+        """
+        if cmd_name not in self.commands and cmd_name in LAZY_SUBCOMMANDS:
+            if self._listing_only:
+                _module, help_text, hidden = LAZY_SUBCOMMANDS[cmd_name]
+                return click.Command(cmd_name, help=help_text, hidden=hidden)
+            self.commands[cmd_name] = _load_subcommand(cmd_name, self.rich_markup_mode)
+        return super().get_command(ctx, cmd_name)
+
+    @contextlib.contextmanager
+    def _listing(self) -> Iterator[None]:
+        """List commands from COMMANDS without importing their modules."""
+        self._listing_only = True
+        try:
+            yield
+        finally:
+            self._listing_only = False
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """Format root help without importing any command module."""
+        with self._listing():
+            super().format_help(ctx, formatter)
+
+    def shell_complete(self, ctx: click.Context, incomplete: str) -> list[CompletionItem]:
+        """Complete command names without importing any command module."""
+        with self._listing():
+            return super().shell_complete(ctx, incomplete)
+
+    def resolve_command(
+        self, ctx: click.Context, args: list[str]
+    ) -> tuple[str | None, click.Command | None, list[str]]:
+        """Resolve a command, suggesting close matches among unloaded names."""
+        try:
+            return super().resolve_command(ctx, args)
+        except click.UsageError as e:
+            # TyperGroup only suggests from loaded commands
+            if args and "Did you mean" not in e.message:
+                matches = get_close_matches(args[0], self.list_commands(ctx))
+                if matches:
+                    suggestions = ", ".join(f"{m!r}" for m in matches)
+                    e.message = f"{e.message.rstrip('.')}. Did you mean {suggestions}?"
+            raise
+
+
+def _is_root_help(argv: list[str]) -> bool:
+    """Return True for `hopx --help`, False for `hopx <subcommand> --help`.
+
+    Stops at the first positional argument, since that names a subcommand.
+    """
+    has_help = False
+    for arg in argv:
+        if not arg.startswith("-"):
+            return False
+        if arg == "--help":
+            has_help = True
+    return has_help
 
 
 class HopxTyper(typer.Typer):
@@ -70,9 +215,7 @@ class HopxTyper(typer.Typer):
 
     def __call__(self, *args: object, **kwargs: object) -> None:
         """Override to add epilog when --help is used."""
-        # Check if --help is in sys.argv and we're at the root command
-        if "--help" in sys.argv and len([a for a in sys.argv[1:] if not a.startswith("-")]) == 0:
-            # This is `hopx --help`, not `hopx <subcommand> --help`
+        if _is_root_help(sys.argv[1:]):
             try:
                 super().__call__(*args, **kwargs)
             except SystemExit as e:
@@ -82,8 +225,23 @@ class HopxTyper(typer.Typer):
             super().__call__(*args, **kwargs)
 
 
+@functools.lru_cache(maxsize=8)
+def _load_config(profile: str, api_key: str | None) -> "CLIConfig":
+    """Load configuration once per (profile, api_key) within a process.
+
+    Reads .env and environment variables; --api-key overrides the env value.
+    """
+    # Deferred so `hopx --help` does not load pydantic-settings
+    from hopx_cli.core import CLIConfig
+
+    if api_key:
+        return CLIConfig(api_key=api_key, profile=profile)
+    return CLIConfig(profile=profile)
+
+
 app = HopxTyper(
     name="hopx",
+    cls=LazyTyperGroup,
     help="Hopx CLI - Manage cloud sandboxes from the command line",
     no_args_is_help=True,
     rich_markup_mode="rich",
@@ -134,6 +292,7 @@ def main(
     version: bool = typer.Option(
         False,
         "--version",
+        "-V",
         help="Show version and exit",
         is_eager=True,
         callback=version_callback,
@@ -144,12 +303,7 @@ def main(
 
     These options are available to all subcommands via the context object.
     """
-    # Load configuration (will read from .env and config file)
-    config = CLIConfig()
-
-    # Override API key if provided via flag
-    if api_key:
-        config = CLIConfig(api_key=api_key, profile=profile)
+    config = _load_config(profile, api_key)
 
     # Create CLI context with proper object
     cli_ctx = CLIContext(
@@ -162,48 +316,3 @@ def main(
 
     # Store context for subcommands
     ctx.obj = cli_ctx
-
-
-# Import command groups
-from hopx_cli.commands import (
-    auth,
-    billing,
-    cmd,
-    env,
-    files,
-    init,
-    members,
-    org,
-    profile,
-    run,
-    sandbox,
-    self_update,
-    system,
-    template,
-    terminal,
-    usage,
-)
-from hopx_cli.commands import config as config_cmd
-
-# Register subcommands with primary names
-app.add_typer(init.app, name="init", help="First-run setup wizard")
-app.add_typer(system.app, name="system", help="System and health commands")
-app.add_typer(run.app, name="run", help="Execute code in sandboxes")
-app.add_typer(auth.app, name="auth", help="Authentication management")
-app.add_typer(sandbox.app, name="sandbox", help="Manage sandboxes")
-app.add_typer(sandbox.app, name="sb", hidden=True)  # Alias
-app.add_typer(template.app, name="template", help="Manage templates")
-app.add_typer(template.app, name="tpl", hidden=True)  # Alias
-app.add_typer(config_cmd.app, name="config", help="Configuration management")
-app.add_typer(files.app, name="files", help="File operations")
-app.add_typer(files.app, name="f", hidden=True)  # Alias
-app.add_typer(cmd.app, name="cmd", help="Run shell commands in sandboxes")
-app.add_typer(env.app, name="env", help="Manage environment variables")
-app.add_typer(terminal.app, name="terminal", help="Interactive terminal sessions")
-app.add_typer(terminal.app, name="term", hidden=True)  # Alias
-app.add_typer(org.app, name="org", help="Manage organization settings")
-app.add_typer(usage.app, name="usage", help="View usage statistics")
-app.add_typer(profile.app, name="profile", help="Manage user profile")
-app.add_typer(members.app, name="members", help="Manage organization members")
-app.add_typer(billing.app, name="billing", help="View billing information")
-app.add_typer(self_update.app, name="self-update", help="Update CLI to latest version")
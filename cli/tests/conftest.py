@@ -23,7 +23,7 @@ def pytest_configure(config: pytest.Config) -> None:
     """Register custom markers."""
     config.addinivalue_line("markers", "unit: Pure unit tests (no I/O)")
     config.addinivalue_line("markers", "integration: Integration tests")
-    config.addinivalue_line("markers", "slow: Tests that take >1 second")
+    config.addinivalue_line("markers", "slow: Tests that spawn subprocesses or wait on the clock")
 
 
 def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
@@ -62,6 +62,34 @@ def clean_environment(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None,
     yield
 
 
+@pytest.fixture(autouse=True)
+def clear_config_cache() -> None:
+    """Drop configs cached by the root CLI callback and parsed config files.
+
+    Automatically applied to all tests so environment changes made by one
+    test are not hidden behind a config loaded by an earlier one.
+    """
+    from hopx_cli.core.config import _clear_cache
+    from hopx_cli.main import _load_config
+
+    _load_config.cache_clear()
+    _clear_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_credential_caches() -> None:
+    """Drop keyring and credentials-file reads cached by CredentialStore.
+
+    Automatically applied to all tests so a keyring mock from one test is
+    not answered from values cached under another, and a YAML file that
+    failed to convert in one test is converted afresh in the next.
+    """
+    from hopx_cli.auth.credentials import _clear_caches, _unconverted_yaml_files
+
+    _clear_caches()
+    _unconverted_yaml_files.clear()
+
+
 @pytest.fixture
 def temp_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     """Create temporary home directory for config/credentials.
@@ -162,10 +190,16 @@ def cli_context(mock_config: MagicMock) -> MagicMock:
 def cli_runner() -> CliRunner:
     """Create Typer CLI test runner.
 
+    Click keeps stdout and stderr apart on the result, so no mix_stderr
+    option is needed. Exceptions propagate instead of being stored on the
+    result, and commands run with the plain terminal env from PLAIN_ENV.
+
     Returns:
         CliRunner for invoking CLI commands in tests
     """
-    return CliRunner(mix_stderr=False)
+    from tests.fixtures import plain_runner
+
+    return plain_runner(catch_exceptions=False)
 
 
 # =============================================================================
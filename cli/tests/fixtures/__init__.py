@@ -1,6 +1,8 @@
 """Reusable test fixtures and mock factories."""
 
-from .auth_mocks import CredentialStoreMock, KeyringMock
+from .auth_mocks import CredentialStoreMock, KeyringMock, MemoryFileBackend
+from .cli_help import command_paths, help_tree
+from .cli_runner import PLAIN_ENV, plain_runner
 from .sdk_mocks import SandboxMockFactory, TemplateMockFactory
 
 __all__ = [
@@ -8,4 +10,9 @@ __all__ = [
     "TemplateMockFactory",
     "KeyringMock",
     "CredentialStoreMock",
+    "MemoryFileBackend",
+    "command_paths",
+    "help_tree",
+    "PLAIN_ENV",
+    "plain_runner",
 ]
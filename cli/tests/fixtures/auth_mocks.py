@@ -8,9 +8,51 @@ from __future__ import annotations
 
 from collections.abc import Generator
 from contextlib import contextmanager
+from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+from hopx_cli.auth.api_keys import APIKeyRecord
+
+
+class MemoryFileBackend:
+    """In-memory file backend for CredentialStore.
+
+    Stores file contents in a dict so credential tests skip filesystem I/O.
+    Each write bumps a counter used as the file's mtime.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no files."""
+        self.store: dict[Path, bytes] = {}
+        self.modes: dict[Path, int] = {}
+        self._mtimes: dict[Path, int] = {}
+        self._clock = 0
+
+    def read_bytes(self, path: Path) -> bytes:
+        """Return stored contents or raise FileNotFoundError."""
+        try:
+            return self.store[path]
+        except KeyError:
+            raise FileNotFoundError(path) from None
+
+    def write_bytes(self, path: Path, data: bytes, mode: int = 0o600) -> None:
+        """Store contents and record the requested mode."""
+        self._clock += 1
+        self.store[path] = data
+        self.modes[path] = mode
+        self._mtimes[path] = self._clock
+
+    def unlink(self, path: Path) -> None:
+        """Remove stored contents or raise FileNotFoundError."""
+        self.read_bytes(path)
+        del self.store[path], self.modes[path], self._mtimes[path]
+
+    def stat(self, path: Path) -> tuple[int, int]:
+        """Return (mtime, size) or raise FileNotFoundError."""
+        data = self.read_bytes(path)
+        return self._mtimes[path], len(data)
+
 
 class KeyringMock:
     """Mock keyring backend for testing credential storage."""
@@ -244,9 +286,9 @@ class APIKeyManagerMock:
         self._keys: list[dict[str, Any]] = []
         self._next_id = 1
 
-    def list_keys(self) -> list[dict[str, Any]]:
+    def list_keys(self) -> list[APIKeyRecord]:
         """List all API keys."""
-        return self._keys
+        return [APIKeyRecord.from_dict(key) for key in self._keys]
 
     def create_key(
         self,
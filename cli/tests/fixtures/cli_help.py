@@ -0,0 +1,81 @@
+"""Helpers for checking command help text without invoking the CLI."""
+
+from __future__ import annotations
+
+import io
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+import click
+import typer
+
+
+def help_tree(app: typer.Typer, terminal_width: int = 100) -> str:
+    """Render help for every visible command in the tree, depth first.
+
+    Hidden commands such as aliases are skipped, since their help repeats
+    the command they point to. Typer prints Rich help straight to stdout, so
+    it is captured here, with a fixed width and no terminal styling so the
+    output does not depend on the terminal running the tests.
+
+    Args:
+        app: Root Typer application
+        terminal_width: Width of the rendered help
+
+    Returns:
+        Help text for each command, headed by its command path
+    """
+    sections: list[str] = []
+
+    def walk(command: click.Command, ctx: click.Context) -> None:
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            text = command.get_help(ctx)
+        # Rich pads lines to the full width; strip it so the snapshot survives
+        # whitespace-trimming editors and hooks
+        rendered = "\n".join(line.rstrip() for line in (buffer.getvalue() + text).splitlines())
+        sections.append(f"## {ctx.command_path}\n\n{rendered}\n")
+        if isinstance(command, click.Group):
+            for name in command.list_commands(ctx):
+                subcommand = command.get_command(ctx, name)
+                if subcommand is not None and not subcommand.hidden:
+                    walk(subcommand, click.Context(subcommand, info_name=name, parent=ctx))
+
+    root = typer.main.get_command(app)
+    with patch.multiple(
+        "typer.rich_utils", MAX_WIDTH=terminal_width, FORCE_TERMINAL=False, COLOR_SYSTEM=None
+    ):
+        walk(root, click.Context(root, info_name="hopx", terminal_width=terminal_width))
+    return "\n".join(sections)
+
+
+def command_paths(app: typer.Typer) -> list[list[str]]:
+    """List the argv path to every subcommand, depth first.
+
+    Hidden aliases are included so their wiring is checked too, but not
+    descended into, since their subcommands are the ones they point to.
+
+    Args:
+        app: Root Typer application
+
+    Returns:
+        Paths such as ["sandbox", "kill"], one per subcommand
+    """
+    paths: list[list[str]] = []
+
+    def walk(command: click.Command, ctx: click.Context, path: list[str]) -> None:
+        if not isinstance(command, click.Group):
+            return
+        for name in command.list_commands(ctx):
+            subcommand = command.get_command(ctx, name)
+            if subcommand is None:
+                continue
+            paths.append([*path, name])
+            if not subcommand.hidden:
+                walk(
+                    subcommand, click.Context(subcommand, info_name=name, parent=ctx), [*path, name]
+                )
+
+    root = typer.main.get_command(app)
+    walk(root, click.Context(root, info_name="hopx"), [])
+    return paths
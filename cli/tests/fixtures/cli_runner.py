@@ -0,0 +1,22 @@
+"""CLI runner with a fixed, plain terminal environment."""
+
+from __future__ import annotations
+
+from typer.testing import CliRunner
+
+# Applied for the duration of each invoke. NO_COLOR and a dumb terminal keep
+# Rich on its plain rendering path, and a fixed width keeps wrapping the same
+# whatever terminal runs the tests.
+PLAIN_ENV = {"NO_COLOR": "1", "TERM": "dumb", "COLUMNS": "200"}
+
+
+def plain_runner(catch_exceptions: bool = True) -> CliRunner:
+    """Create a CliRunner that invokes commands with PLAIN_ENV set.
+
+    Args:
+        catch_exceptions: Store exceptions on the result instead of raising
+
+    Returns:
+        CliRunner for invoking CLI commands in tests
+    """
+    return CliRunner(env=PLAIN_ENV, catch_exceptions=catch_exceptions)
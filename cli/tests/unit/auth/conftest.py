@@ -2,30 +2,144 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
-from unittest.mock import MagicMock, patch
+import json
+from collections.abc import Callable, Generator
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
 
 import pytest
+from pytest_mock import MockerFixture
 
-# Note: Keyring fixtures are already in root conftest.py
-# This file can add auth-specific fixtures as needed
+from tests.fixtures import MemoryFileBackend
+
+if TYPE_CHECKING:
+    from hopx_cli.auth.token import TokenManager
+
+# Note: Function-scoped keyring fixtures are in root conftest.py. The
+# module-scoped *_ro variants below are shared by every test in a module, so
+# only use them in tests that neither configure the mock nor write files.
+
+
+@pytest.fixture(scope="module")
+def temp_home_ro(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path, None, None]:
+    """Module-scoped temporary home with an empty ~/.hopx directory.
+
+    Yields:
+        Path to the temporary home directory
+    """
+    home = tmp_path_factory.mktemp("home")
+    (home / ".hopx").mkdir()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("HOME", str(home))
+        yield home
+
+
+@pytest.fixture(scope="module")
+def mock_keyring_ro(module_mocker: MockerFixture) -> MagicMock:
+    """Module-scoped keyring mock that stores nothing.
+
+    Returns:
+        MagicMock replacing the keyring module
+    """
+    mock = module_mocker.patch("hopx_cli.auth.credentials.keyring")
+    mock.get_password.return_value = None
+    return mock
+
+
+@pytest.fixture
+def fake_keyring(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Callable[[dict[str, str | None]], MagicMock]:
+    """Install a keyring mock that serves fixed entries.
+
+    The mock is specced on the keyring module, so calls to functions keyring
+    does not have fail instead of silently passing.
+
+    Returns:
+        Function taking a {"profile:field": value} dict and returning the mock
+    """
+    import keyring
+
+    def install(entries: dict[str, str | None]) -> MagicMock:
+        fake = MagicMock(spec=keyring)
+        fake.get_password.side_effect = lambda _service, key: entries.get(key)
+        monkeypatch.setattr("hopx_cli.auth.credentials.keyring", fake)
+        return fake
+
+    return install
+
+
+@pytest.fixture
+def keyring_manager(
+    fake_keyring: Callable[[dict[str, str | None]], MagicMock],
+) -> Callable[[dict[str, str | None]], tuple[TokenManager, MagicMock]]:
+    """Build a TokenManager over a fake keyring holding fixed entries.
+
+    Returns:
+        Function taking a {"profile:field": value} dict and returning the
+        manager and the keyring mock
+    """
+    from hopx_cli.auth.credentials import CredentialStore
+    from hopx_cli.auth.token import TokenManager
+
+    def make(entries: dict[str, str | None]) -> tuple[TokenManager, MagicMock]:
+        mock = fake_keyring(entries)
+        return TokenManager(CredentialStore()), mock
+
+    return make
 
 
 @pytest.fixture
-def mock_oauth_flow() -> Generator[MagicMock, None, None]:
+def mock_oauth_flow(mocker: MockerFixture) -> MagicMock:
     """Mock OAuth flow functions."""
-    with patch("hopx_cli.auth.oauth.start_oauth_flow") as mock:
-        mock.return_value = {
+    return mocker.patch(
+        "hopx_cli.auth.oauth.start_oauth_flow",
+        return_value={
             "access_token": "mock_access_token",
             "refresh_token": "mock_refresh_token",
             "expires_at": 1700000000,
-        }
-        yield mock
+        },
+    )
 
 
 @pytest.fixture
-def mock_oauth_flow_failure() -> Generator[MagicMock, None, None]:
+def mock_oauth_flow_failure(mocker: MockerFixture) -> MagicMock:
     """Mock OAuth flow that fails."""
-    with patch("hopx_cli.auth.oauth.start_oauth_flow") as mock:
-        mock.return_value = None
-        yield mock
+    return mocker.patch("hopx_cli.auth.oauth.start_oauth_flow", return_value=None)
+
+
+@pytest.fixture(scope="session")
+def default_creds_json_bytes() -> dict[str, bytes]:
+    """Credentials file contents, serialized once per session.
+
+    Keys name the variant: "api_key", "oauth_token", and "two_profiles".
+    """
+    variants = {
+        "api_key": {"default": {"api_key": "file_key"}},
+        "oauth_token": {
+            "default": {
+                "oauth_token": {"access_token": "file_access", "refresh_token": "file_refresh"}
+            }
+        },
+        "two_profiles": {"default": {"api_key": "key1"}, "staging": {"api_key": "key2"}},
+    }
+    return {name: json.dumps(data).encode() for name, data in variants.items()}
+
+
+@pytest.fixture
+def mem_backend() -> MemoryFileBackend:
+    """In-memory file backend to pass as CredentialStore(backend=...)."""
+    return MemoryFileBackend()
+
+
+@pytest.fixture
+def write_creds(mem_backend: MemoryFileBackend) -> Callable[[bytes], Path]:
+    """Write raw bytes as ~/.hopx/credentials.json in mem_backend and return its path."""
+
+    def write(blob: bytes) -> Path:
+        creds_file = Path.home() / ".hopx" / "credentials.json"
+        mem_backend.write_bytes(creds_file, blob)
+        return creds_file
+
+    return write
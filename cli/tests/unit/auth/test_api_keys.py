@@ -9,331 +9,315 @@ Tests cover:
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from collections.abc import Callable, Generator
+from typing import Any
+from unittest.mock import MagicMock, Mock, patch
 
+import httpx
 import pytest
 
+from hopx_cli.auth.api_keys import EXPIRES_OPTIONS, APIKeyManager, APIKeyRecord
+
+
+def _resp(payload: dict[str, Any]) -> Mock:
+    """Build a minimal HTTP response mock whose json() returns payload."""
+    response = Mock(spec=["json", "raise_for_status", "status_code"])
+    response.json.return_value = payload
+    response.status_code = 200
+    return response
+
+
+@pytest.fixture
+def mock_httpx_client() -> Generator[MagicMock, None, None]:
+    """Patch httpx.Client in the api_keys module and yield the class mock."""
+    with patch("hopx_cli.auth.api_keys.httpx.Client") as mock_client_cls:
+        yield mock_client_cls
+
+
+@pytest.fixture
+def mock_client(mock_httpx_client: MagicMock) -> MagicMock:
+    """HTTP client instance returned by the patched httpx.Client."""
+    client: MagicMock = mock_httpx_client.return_value
+    return client
+
+
+def _capturing_post(
+    response: Mock,
+) -> tuple[Callable[..., Mock], list[dict[str, Any]]]:
+    """Build a post() side effect that records JSON bodies into a list."""
+    captured: list[dict[str, Any]] = []
+
+    def post(url: str, *, json: dict[str, Any]) -> Mock:
+        captured.append(json)
+        return response
+
+    return post, captured
+
+
+@pytest.fixture(scope="class")
+def create_key_requests() -> Generator[list[dict[str, Any]], None, None]:
+    """JSON bodies posted through a client mock shared by the expiry cases."""
+    client = Mock(spec=httpx.Client)
+    client.post.side_effect, captured = _capturing_post(
+        _resp({"success": True, "api_key": {}, "full_key": "test"})
+    )
+    with patch("hopx_cli.auth.api_keys.httpx.Client", return_value=client):
+        yield captured
+
 
 class TestAPIKeyManagerInit:
     """Tests for APIKeyManager initialization."""
 
     @pytest.mark.unit
-    def test_init_with_defaults(self) -> None:
+    def test_init_with_defaults(self, mock_httpx_client: MagicMock) -> None:
         """Initializes with default base URL."""
-        from hopx_cli.auth.api_keys import APIKeyManager
-
-        with patch("hopx_cli.auth.api_keys.httpx.Client") as mock_client:
-            _manager = APIKeyManager("test_token")
+        _manager = APIKeyManager("test_token")
 
-            mock_client.assert_called_once()
-            call_kwargs = mock_client.call_args.kwargs
-            assert call_kwargs["base_url"] == "https://api.hopx.dev"
-            assert "Bearer test_token" in call_kwargs["headers"]["Authorization"]
+        mock_httpx_client.assert_called_once()
+        call_kwargs = mock_httpx_client.call_args.kwargs
+        assert call_kwargs["base_url"] == "https://api.hopx.dev"
+        assert "Bearer test_token" in call_kwargs["headers"]["Authorization"]
 
     @pytest.mark.unit
-    def test_init_with_custom_base_url(self) -> None:
+    def test_init_with_custom_base_url(self, mock_httpx_client: MagicMock) -> None:
         """Initializes with custom base URL."""
-        from hopx_cli.auth.api_keys import APIKeyManager
-
-        with patch("hopx_cli.auth.api_keys.httpx.Client") as mock_client:
-            _manager = APIKeyManager("test_token", base_url="https://custom.api.com")
+        _manager = APIKeyManager("test_token", base_url="https://custom.api.com")
 
-            call_kwargs = mock_client.call_args.kwargs
-            assert call_kwargs["base_url"] == "https://custom.api.com"
+        call_kwargs = mock_httpx_client.call_args.kwargs
+        assert call_kwargs["base_url"] == "https://custom.api.com"
 
     @pytest.mark.unit
-    def test_context_manager_entry(self) -> None:
+    def test_context_manager_entry(self, mock_client: MagicMock) -> None:
         """Context manager returns self on entry."""
-        from hopx_cli.auth.api_keys import APIKeyManager
-
-        with patch("hopx_cli.auth.api_keys.httpx.Client"):
-            manager = APIKeyManager("test_token")
-            with manager as ctx:
-                assert ctx is manager
+        manager = APIKeyManager("test_token")
+        with manager as ctx:
+            assert ctx is manager
 
     @pytest.mark.unit
-    def test_context_manager_exit_closes_client(self) -> None:
+    def test_context_manager_exit_closes_client(self, mock_client: MagicMock) -> None:
         """Context manager closes client on exit."""
-        from hopx_cli.auth.api_keys import APIKeyManager
-
-        mock_client = MagicMock()
-        with patch("hopx_cli.auth.api_keys.httpx.Client", return_value=mock_client):
-            manager = APIKeyManager("test_token")
-            with manager:
-                pass
-            mock_client.close.assert_called_once()
+        manager = APIKeyManager("test_token")
+        with manager:
+            pass
+        mock_client.close.assert_called_once()
 
     @pytest.mark.unit
-    def test_close_closes_client(self) -> None:
+    def test_close_closes_client(self, mock_client: MagicMock) -> None:
         """Close method closes HTTP client."""
-        from hopx_cli.auth.api_keys import APIKeyManager
-
-        mock_client = MagicMock()
-        with patch("hopx_cli.auth.api_keys.httpx.Client", return_value=mock_client):
-            manager = APIKeyManager("test_token")
-            manager.close()
-            mock_client.close.assert_called_once()
+        manager = APIKeyManager("test_token")
+        manager.close()
+        mock_client.close.assert_called_once()
 
 
 class TestAPIKeyManagerListKeys:
     """Tests for APIKeyManager.list_keys()."""
 
     @pytest.mark.unit
-    def test_list_keys_success(self) -> None:
+    def test_list_keys_success(self, mock_client: MagicMock) -> None:
         """Returns list of keys on success."""
-        from hopx_cli.auth.api_keys import APIKeyManager
-
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "success": True,
-            "api_keys": [
-                {"id": "key1", "name": "test-key", "status": "active"},
-                {"id": "key2", "name": "another-key", "status": "active"},
-            ],
-            "count": 2,
-        }
-
-        mock_client = MagicMock()
+        mock_response = _resp(
+            {
+                "success": True,
+                "api_keys": [
+                    {"id": "key1", "name": "test-key", "status": "active"},
+                    {"id": "key2", "name": "another-key", "status": "active"},
+                ],
+                "count": 2,
+            }
+        )
+
         mock_client.get.return_value = mock_response
 
-        with patch("hopx_cli.auth.api_keys.httpx.Client", return_value=mock_client):
-            manager = APIKeyManager("test_token")
-            keys = manager.list_keys()
+        manager = APIKeyManager("test_token")
+        keys = manager.list_keys()
 
-            assert len(keys) == 2
-            assert keys[0]["id"] == "key1"
-            mock_client.get.assert_called_once_with("/auth/api-keys")
+        assert len(keys) == 2
+        assert keys[0] == APIKeyRecord(id="key1", name="test-key", status="active")
+        mock_client.get.assert_called_once_with("/auth/api-keys")
 
     @pytest.mark.unit
-    def test_list_keys_empty(self) -> None:
+    def test_list_keys_empty(self, mock_client: MagicMock) -> None:
         """Returns empty list when no keys exist."""
-        from hopx_cli.auth.api_keys import APIKeyManager
-
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"success": True, "api_keys": [], "count": 0}
+        mock_response = _resp({"success": True, "api_keys": [], "count": 0})
 
-        mock_client = MagicMock()
         mock_client.get.return_value = mock_response
 
-        with patch("hopx_cli.auth.api_keys.httpx.Client", return_value=mock_client):
-            manager = APIKeyManager("test_token")
-            keys = manager.list_keys()
-            assert keys == []
+        manager = APIKeyManager("test_token")
+        keys = manager.list_keys()
+        assert keys == []
 
     @pytest.mark.unit
-    def test_list_keys_raises_on_failure(self) -> None:
+    def test_list_keys_raises_on_failure(self, mock_client: MagicMock) -> None:
         """Raises RuntimeError when API returns success=false."""
-        from hopx_cli.auth.api_keys import APIKeyManager
-
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "success": False,
-            "message": "Unauthorized",
-        }
+        mock_response = _resp(
+            {
+                "success": False,
+                "message": "Unauthorized",
+            }
+        )
 
-        mock_client = MagicMock()
         mock_client.get.return_value = mock_response
 
-        with patch("hopx_cli.auth.api_keys.httpx.Client", return_value=mock_client):
-            manager = APIKeyManager("test_token")
-            with pytest.raises(RuntimeError, match="Unauthorized"):
-                manager.list_keys()
+        manager = APIKeyManager("test_token")
+        with pytest.raises(RuntimeError, match="Unauthorized"):
+            manager.list_keys()
 
 
 class TestAPIKeyManagerCreateKey:
     """Tests for APIKeyManager.create_key()."""
 
     @pytest.mark.unit
-    def test_create_key_success(self) -> None:
+    def test_create_key_success(self, mock_client: MagicMock) -> None:
         """Creates key and returns full key value."""
-        from hopx_cli.auth.api_keys import APIKeyManager
+        mock_response = _resp(
+            {
+                "success": True,
+                "message": "API key created successfully",
+                "api_key": {"id": "key1", "name": "my-key", "status": "active"},
+                "full_key": "hopx_live_xxx.secret",
+            }
+        )
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "success": True,
-            "message": "API key created successfully",
-            "api_key": {"id": "key1", "name": "my-key", "status": "active"},
-            "full_key": "hopx_live_xxx.secret",
-        }
-
-        mock_client = MagicMock()
         mock_client.post.return_value = mock_response
 
-        with patch("hopx_cli.auth.api_keys.httpx.Client", return_value=mock_client):
-            manager = APIKeyManager("test_token")
-            result = manager.create_key("my-key", expires_in="never")
+        manager = APIKeyManager("test_token")
+        result = manager.create_key("my-key", expires_in="never")
 
-            assert result["full_key"] == "hopx_live_xxx.secret"
-            assert result["api_key"]["name"] == "my-key"
-            mock_client.post.assert_called_once_with(
-                "/auth/api-keys",
-                json={"name": "my-key", "expires_in": "never"},
-            )
+        assert result["full_key"] == "hopx_live_xxx.secret"
+        assert result["api_key"]["name"] == "my-key"
+        mock_client.post.assert_called_once_with(
+            "/auth/api-keys",
+            json={"name": "my-key", "expires_in": "never"},
+        )
 
     @pytest.mark.unit
-    def test_create_key_with_expiry(self) -> None:
+    def test_create_key_with_expiry(self, mock_client: MagicMock) -> None:
         """Creates key with expiration."""
-        from hopx_cli.auth.api_keys import APIKeyManager
-
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "success": True,
-            "api_key": {"id": "key1"},
-            "full_key": "hopx_live_xxx.secret",
-        }
+        mock_response = _resp(
+            {
+                "success": True,
+                "api_key": {"id": "key1"},
+                "full_key": "hopx_live_xxx.secret",
+            }
+        )
 
-        mock_client = MagicMock()
-        mock_client.post.return_value = mock_response
+        mock_client.post.side_effect, captured = _capturing_post(mock_response)
 
-        with patch("hopx_cli.auth.api_keys.httpx.Client", return_value=mock_client):
-            manager = APIKeyManager("test_token")
-            manager.create_key("test-key", expires_in="3months")
+        manager = APIKeyManager("test_token")
+        manager.create_key("test-key", expires_in="3months")
 
-            call_kwargs = mock_client.post.call_args.kwargs
-            assert call_kwargs["json"]["expires_in"] == "3months"
+        assert captured[-1]["expires_in"] == "3months"
 
     @pytest.mark.unit
-    def test_create_key_invalid_expiry(self) -> None:
+    def test_create_key_invalid_expiry(self, mock_client: MagicMock) -> None:
         """Raises ValueError for invalid expiration."""
-        from hopx_cli.auth.api_keys import APIKeyManager
-
-        with patch("hopx_cli.auth.api_keys.httpx.Client"):
-            manager = APIKeyManager("test_token")
-            with pytest.raises(ValueError, match="Invalid expires_in"):
-                manager.create_key("test-key", expires_in="invalid")  # type: ignore
+        manager = APIKeyManager("test_token")
+        with pytest.raises(ValueError, match="Invalid expires_in"):
+            manager.create_key("test-key", expires_in="invalid")  # type: ignore
 
     @pytest.mark.unit
-    def test_create_key_raises_on_failure(self) -> None:
+    def test_create_key_raises_on_failure(self, mock_client: MagicMock) -> None:
         """Raises RuntimeError when API returns success=false."""
-        from hopx_cli.auth.api_keys import APIKeyManager
-
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "success": False,
-            "message": "Rate limit exceeded",
-        }
+        mock_response = _resp(
+            {
+                "success": False,
+                "message": "Rate limit exceeded",
+            }
+        )
 
-        mock_client = MagicMock()
         mock_client.post.return_value = mock_response
 
-        with patch("hopx_cli.auth.api_keys.httpx.Client", return_value=mock_client):
-            manager = APIKeyManager("test_token")
-            with pytest.raises(RuntimeError, match="Rate limit exceeded"):
-                manager.create_key("test-key")
+        manager = APIKeyManager("test_token")
+        with pytest.raises(RuntimeError, match="Rate limit exceeded"):
+            manager.create_key("test-key")
 
     @pytest.mark.unit
-    @pytest.mark.parametrize(
-        "expires_in",
-        ["1month", "3months", "6months", "1year", "never"],
-    )
-    def test_create_key_valid_expiry_options(self, expires_in: str) -> None:
+    @pytest.mark.parametrize("expires_in", ["1month", "3months", "6months", "1year", "never"])
+    def test_create_key_valid_expiry_options(
+        self, expires_in: str, create_key_requests: list[dict[str, Any]]
+    ) -> None:
         """Accepts all valid expiration options."""
-        from hopx_cli.auth.api_keys import APIKeyManager
-
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "success": True,
-            "api_key": {},
-            "full_key": "test",
-        }
-
-        mock_client = MagicMock()
-        mock_client.post.return_value = mock_response
+        APIKeyManager("test_token").create_key("test-key", expires_in=expires_in)  # type: ignore
 
-        with patch("hopx_cli.auth.api_keys.httpx.Client", return_value=mock_client):
-            manager = APIKeyManager("test_token")
-            manager.create_key("test-key", expires_in=expires_in)  # type: ignore
+        assert create_key_requests[-1]["expires_in"] == expires_in
 
 
 class TestAPIKeyManagerRevokeKey:
     """Tests for APIKeyManager.revoke_key()."""
 
     @pytest.mark.unit
-    def test_revoke_key_success(self) -> None:
+    def test_revoke_key_success(self, mock_client: MagicMock) -> None:
         """Returns True on successful revocation."""
-        from hopx_cli.auth.api_keys import APIKeyManager
+        mock_response = _resp(
+            {
+                "success": True,
+                "message": "API key revoked successfully",
+            }
+        )
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "success": True,
-            "message": "API key revoked successfully",
-        }
-
-        mock_client = MagicMock()
         mock_client.delete.return_value = mock_response
 
-        with patch("hopx_cli.auth.api_keys.httpx.Client", return_value=mock_client):
-            manager = APIKeyManager("test_token")
-            result = manager.revoke_key("key123")
+        manager = APIKeyManager("test_token")
+        result = manager.revoke_key("key123")
 
-            assert result is True
-            mock_client.delete.assert_called_once_with("/auth/api-keys/key123")
+        assert result is True
+        mock_client.delete.assert_called_once_with("/auth/api-keys/key123")
 
     @pytest.mark.unit
-    def test_revoke_key_returns_false_on_failure(self) -> None:
+    def test_revoke_key_returns_false_on_failure(self, mock_client: MagicMock) -> None:
         """Returns False when API returns success=false."""
-        from hopx_cli.auth.api_keys import APIKeyManager
-
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"success": False}
+        mock_response = _resp({"success": False})
 
-        mock_client = MagicMock()
         mock_client.delete.return_value = mock_response
 
-        with patch("hopx_cli.auth.api_keys.httpx.Client", return_value=mock_client):
-            manager = APIKeyManager("test_token")
-            result = manager.revoke_key("key123")
-            assert result is False
+        manager = APIKeyManager("test_token")
+        result = manager.revoke_key("key123")
+        assert result is False
 
 
 class TestAPIKeyManagerGetKey:
     """Tests for APIKeyManager.get_key()."""
 
     @pytest.mark.unit
-    def test_get_key_success(self) -> None:
+    def test_get_key_success(self, mock_client: MagicMock) -> None:
         """Returns key details on success."""
-        from hopx_cli.auth.api_keys import APIKeyManager
-
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "success": True,
-            "api_key": {
-                "id": "key123",
-                "name": "my-key",
-                "status": "active",
-                "masked_key": "hopx_live_xxx...***",
-            },
-        }
-
-        mock_client = MagicMock()
+        mock_response = _resp(
+            {
+                "success": True,
+                "api_key": {
+                    "id": "key123",
+                    "name": "my-key",
+                    "status": "active",
+                    "masked_key": "hopx_live_xxx...***",
+                },
+            }
+        )
+
         mock_client.get.return_value = mock_response
 
-        with patch("hopx_cli.auth.api_keys.httpx.Client", return_value=mock_client):
-            manager = APIKeyManager("test_token")
-            key = manager.get_key("key123")
+        manager = APIKeyManager("test_token")
+        key = manager.get_key("key123")
 
-            assert key["id"] == "key123"
-            assert key["name"] == "my-key"
-            mock_client.get.assert_called_once_with("/auth/api-keys/key123")
+        assert key.id == "key123"
+        assert key.name == "my-key"
+        assert key.masked_key == "hopx_live_xxx...***"
+        mock_client.get.assert_called_once_with("/auth/api-keys/key123")
 
     @pytest.mark.unit
-    def test_get_key_raises_on_failure(self) -> None:
+    def test_get_key_raises_on_failure(self, mock_client: MagicMock) -> None:
         """Raises RuntimeError when API returns success=false."""
-        from hopx_cli.auth.api_keys import APIKeyManager
+        mock_response = _resp(
+            {
+                "success": False,
+                "message": "Key not found",
+            }
+        )
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "success": False,
-            "message": "Key not found",
-        }
-
-        mock_client = MagicMock()
         mock_client.get.return_value = mock_response
 
-        with patch("hopx_cli.auth.api_keys.httpx.Client", return_value=mock_client):
-            manager = APIKeyManager("test_token")
-            with pytest.raises(RuntimeError, match="Key not found"):
-                manager.get_key("nonexistent")
+        manager = APIKeyManager("test_token")
+        with pytest.raises(RuntimeError, match="Key not found"):
+            manager.get_key("nonexistent")
 
 
 class TestExpiresOptions:
@@ -342,11 +326,51 @@ class TestExpiresOptions:
     @pytest.mark.unit
     def test_expires_options_contains_expected_values(self) -> None:
         """EXPIRES_OPTIONS contains all valid values."""
-        from hopx_cli.auth.api_keys import EXPIRES_OPTIONS
-
         assert "1month" in EXPIRES_OPTIONS
         assert "3months" in EXPIRES_OPTIONS
         assert "6months" in EXPIRES_OPTIONS
         assert "1year" in EXPIRES_OPTIONS
         assert "never" in EXPIRES_OPTIONS
         assert len(EXPIRES_OPTIONS) == 5
+
+    @pytest.mark.unit
+    def test_expires_options_is_frozenset(self) -> None:
+        """EXPIRES_OPTIONS is immutable and hash-based."""
+        assert isinstance(EXPIRES_OPTIONS, frozenset)
+
+    @pytest.mark.unit
+    def test_invalid_expiry_message_lists_options_in_order(self, mock_client: MagicMock) -> None:
+        """Validation error lists options in schema order."""
+        manager = APIKeyManager("test_token")
+        with pytest.raises(ValueError, match="1month, 3months, 6months, 1year, never"):
+            manager.create_key("test-key", expires_in="invalid")  # type: ignore
+
+
+class TestAPIKeyRecord:
+    """Tests for APIKeyRecord."""
+
+    @pytest.mark.unit
+    def test_from_dict_keeps_unknown_fields_in_extra(self) -> None:
+        """Unknown payload fields are kept in extra."""
+        record = APIKeyRecord.from_dict({"id": "key1", "name": "k", "org_id": "org_1"})
+        assert record == APIKeyRecord(id="key1", name="k", extra={"org_id": "org_1"})
+
+    @pytest.mark.unit
+    def test_dict_style_access_is_deprecated(self) -> None:
+        """record[key] and record.get() still work, with a DeprecationWarning."""
+        record = APIKeyRecord.from_dict({"id": "key1", "org_id": "org_1"})
+
+        with pytest.deprecated_call():
+            assert record["id"] == "key1"
+        with pytest.deprecated_call():
+            assert record["org_id"] == "org_1"
+        with pytest.deprecated_call():
+            assert record.get("missing", "fallback") == "fallback"
+
+    @pytest.mark.unit
+    def test_record_is_frozen_and_slotted(self) -> None:
+        """Records are immutable and have no per-instance __dict__."""
+        record = APIKeyRecord(id="key1")
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.id = "key2"  # type: ignore[misc]
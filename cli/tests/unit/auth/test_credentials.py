@@ -10,43 +10,144 @@ Tests cover:
 
 from __future__ import annotations
 
+import datetime
+import json
 import os
 import stat
+import subprocess
+import sys
+from collections.abc import Callable
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call
 
 import pytest
 import yaml
 
 from hopx_cli.auth.credentials import KEYRING_SERVICE, CredentialStore
+from tests.fixtures import MemoryFileBackend
 
 
 class TestCredentialStoreInit:
     """Tests for CredentialStore initialization."""
 
     @pytest.mark.unit
-    def test_default_profile(self, temp_hopx_dir: Path) -> None:
+    def test_default_profile(self, temp_home_ro: Path) -> None:
         """Default profile is 'default'."""
         store = CredentialStore()
         assert store.profile == "default"
 
     @pytest.mark.unit
-    def test_custom_profile(self, temp_hopx_dir: Path) -> None:
+    def test_custom_profile(self, temp_home_ro: Path) -> None:
         """Can initialize with custom profile."""
         store = CredentialStore(profile="staging")
         assert store.profile == "staging"
 
     @pytest.mark.unit
-    def test_config_dir_is_hopx(self, temp_home: Path) -> None:
+    @pytest.mark.slow
+    def test_import_defers_keyring(self) -> None:
+        """Importing the module does not import keyring."""
+        code = "import sys, hopx_cli.auth.credentials; print('keyring' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    @pytest.mark.unit
+    def test_config_dir_is_hopx(self, temp_home_ro: Path) -> None:
         """Config directory is ~/.hopx."""
         store = CredentialStore()
-        assert store.config_dir == temp_home / ".hopx"
+        assert store.config_dir == temp_home_ro / ".hopx"
 
     @pytest.mark.unit
-    def test_credentials_file_path(self, temp_home: Path) -> None:
-        """Credentials file is ~/.hopx/credentials.yaml."""
+    def test_credentials_file_path(self, temp_home_ro: Path) -> None:
+        """Credentials file is ~/.hopx/credentials.json."""
         store = CredentialStore()
-        assert store.credentials_file == temp_home / ".hopx" / "credentials.yaml"
+        assert store.credentials_file == temp_home_ro / ".hopx" / "credentials.json"
+
+
+class TestCredentialStoreYamlMigration:
+    """Tests for converting credentials.yaml from earlier releases."""
+
+    @pytest.mark.unit
+    def test_yaml_file_converted_to_json(
+        self, mock_keyring: MagicMock, mem_backend: MemoryFileBackend
+    ) -> None:
+        """A legacy YAML file is copied to JSON and left in place."""
+        legacy_file = Path.home() / ".hopx" / "credentials.yaml"
+        mem_backend.write_bytes(
+            legacy_file, yaml.safe_dump({"default": {"api_key": "yaml_key"}}).encode()
+        )
+
+        store = CredentialStore(backend=mem_backend)
+
+        assert legacy_file in mem_backend.store
+        assert json.loads(mem_backend.store[store.credentials_file]) == {
+            "default": {"api_key": "yaml_key"}
+        }
+        assert mem_backend.modes[store.credentials_file] == 0o600
+        assert store.get_api_key() == "yaml_key"
+
+    @pytest.mark.unit
+    def test_existing_json_file_wins(
+        self,
+        mock_keyring: MagicMock,
+        default_creds_json_bytes: dict[str, bytes],
+        write_creds: Callable[[bytes], Path],
+        mem_backend: MemoryFileBackend,
+    ) -> None:
+        """The YAML file is ignored once a JSON file exists."""
+        creds_file = write_creds(default_creds_json_bytes["api_key"])
+        legacy_file = creds_file.with_name("credentials.yaml")
+        mem_backend.write_bytes(
+            legacy_file, yaml.safe_dump({"default": {"api_key": "yaml_key"}}).encode()
+        )
+
+        store = CredentialStore(backend=mem_backend)
+
+        assert legacy_file in mem_backend.store
+        assert store.get_api_key() == "file_key"
+
+    @pytest.mark.unit
+    def test_unconvertible_yaml_read_directly(
+        self,
+        mock_keyring: MagicMock,
+        mem_backend: MemoryFileBackend,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A YAML file JSON cannot encode is read as is and converted only once."""
+        legacy_file = Path.home() / ".hopx" / "credentials.yaml"
+        mem_backend.write_bytes(
+            legacy_file,
+            yaml.safe_dump(
+                {"default": {"api_key": "yaml_key", "created": datetime.date(2025, 1, 1)}}
+            ).encode(),
+        )
+        parses = MagicMock(wraps=yaml.safe_load)
+        monkeypatch.setattr(yaml, "safe_load", parses)
+
+        store = CredentialStore(backend=mem_backend)
+        CredentialStore(backend=mem_backend)
+
+        assert store.credentials_file not in mem_backend.store
+        assert parses.call_count == 1
+        assert store.get_api_key() == "yaml_key"
+
+    @pytest.mark.unit
+    def test_clear_removes_profile_from_yaml(
+        self, mock_keyring: MagicMock, mem_backend: MemoryFileBackend
+    ) -> None:
+        """Logging out also removes the profile from the legacy YAML file."""
+        legacy_file = Path.home() / ".hopx" / "credentials.yaml"
+        mem_backend.write_bytes(
+            legacy_file,
+            yaml.safe_dump(
+                {"default": {"api_key": "yaml_key"}, "staging": {"api_key": "other"}}
+            ).encode(),
+        )
+
+        CredentialStore(backend=mem_backend).clear()
+
+        assert yaml.safe_load(mem_backend.store[legacy_file]) == {"staging": {"api_key": "other"}}
 
 
 class TestCredentialStoreApiKey:
@@ -64,89 +165,100 @@ class TestCredentialStoreApiKey:
 
     @pytest.mark.unit
     def test_store_api_key_falls_back_to_file(
-        self, temp_hopx_dir: Path, mock_keyring_unavailable: MagicMock
+        self, mock_keyring_unavailable: MagicMock, mem_backend: MemoryFileBackend
     ) -> None:
         """API key is stored in file when keyring unavailable."""
-        store = CredentialStore()
+        store = CredentialStore(backend=mem_backend)
         store.store_api_key("hopx_live_test.secret")
 
-        # Check file was created
-        assert store.credentials_file.exists()
-        with open(store.credentials_file) as f:
-            data = yaml.safe_load(f)
-        assert data["default"]["api_key"] == "hopx_live_test.secret"
+        assert b"hopx_live_test.secret" in mem_backend.store[store.credentials_file]
 
     @pytest.mark.unit
     def test_store_api_key_without_keyring(
-        self, temp_hopx_dir: Path, mock_keyring: MagicMock
+        self, mock_keyring: MagicMock, mem_backend: MemoryFileBackend
     ) -> None:
         """Can explicitly store to file instead of keyring."""
-        store = CredentialStore()
+        store = CredentialStore(backend=mem_backend)
         store.store_api_key("hopx_live_test.secret", use_keyring=False)
 
         # Keyring should not be called
         mock_keyring.set_password.assert_not_called()
         # File should be created
-        assert store.credentials_file.exists()
+        assert store.credentials_file in mem_backend.store
 
     @pytest.mark.unit
-    def test_get_api_key_from_keyring(
-        self, temp_hopx_dir: Path, mock_keyring_with_api_key: MagicMock
+    @pytest.mark.parametrize(
+        ("keyring_val", "file_val", "env_val", "expected"),
+        [
+            ("keyring_key", None, None, "keyring_key"),
+            (None, "file_key", None, "file_key"),
+            (None, None, "env_key", "env_key"),
+            ("keyring_key", "file_key", "env_key", "keyring_key"),
+            (None, None, None, None),
+        ],
+        ids=["keyring", "file", "env", "priority", "none"],
+    )
+    def test_get_api_key_sources(
+        self,
+        mock_keyring: MagicMock,
+        mem_backend: MemoryFileBackend,
+        monkeypatch: pytest.MonkeyPatch,
+        keyring_val: str | None,
+        file_val: str | None,
+        env_val: str | None,
+        expected: str | None,
     ) -> None:
-        """API key is retrieved from keyring."""
-        store = CredentialStore()
-        key = store.get_api_key()
-        assert key == "hopx_live_stored.secret"
-
-    @pytest.mark.unit
-    def test_get_api_key_from_file(self, temp_hopx_dir: Path, mock_keyring: MagicMock) -> None:
-        """API key is retrieved from file when not in keyring."""
-        # Write key to file
-        creds_file = temp_hopx_dir / "credentials.yaml"
-        with open(creds_file, "w") as f:
-            yaml.safe_dump({"default": {"api_key": "file_key"}}, f)
+        """API key comes from keyring, then file, then HOPX_API_KEY."""
+        mock_keyring.get_password.return_value = keyring_val
+        store = CredentialStore(backend=mem_backend)
+        if file_val:
+            mem_backend.write_bytes(
+                store.credentials_file, json.dumps({"default": {"api_key": file_val}}).encode()
+            )
+        if env_val:
+            monkeypatch.setenv("HOPX_API_KEY", env_val)
 
-        store = CredentialStore()
-        key = store.get_api_key()
-        assert key == "file_key"
+        assert store.get_api_key() == expected
 
     @pytest.mark.unit
-    def test_get_api_key_from_env(
-        self, temp_hopx_dir: Path, mock_keyring: MagicMock, monkeypatch: pytest.MonkeyPatch
+    def test_get_api_key_cached_within_process(
+        self, temp_hopx_dir: Path, mock_keyring_with_api_key: MagicMock
     ) -> None:
-        """API key falls back to HOPX_API_KEY env var."""
-        monkeypatch.setenv("HOPX_API_KEY", "env_key")
+        """Repeated lookups reuse the first keyring read."""
         store = CredentialStore()
-        key = store.get_api_key()
-        assert key == "env_key"
+        assert store.get_api_key() == "hopx_live_stored.secret"
+        assert CredentialStore().get_api_key() == "hopx_live_stored.secret"
+
+        assert mock_keyring_with_api_key.get_password.call_count == 1
 
     @pytest.mark.unit
-    def test_get_api_key_keyring_priority(
-        self,
-        temp_hopx_dir: Path,
-        mock_keyring_with_api_key: MagicMock,
-        monkeypatch: pytest.MonkeyPatch,
+    def test_store_api_key_invalidates_cache(
+        self, temp_hopx_dir: Path, mock_keyring: MagicMock
     ) -> None:
-        """Keyring has priority over file and env."""
-        # Set up all sources
-        creds_file = temp_hopx_dir / "credentials.yaml"
-        with open(creds_file, "w") as f:
-            yaml.safe_dump({"default": {"api_key": "file_key"}}, f)
-        monkeypatch.setenv("HOPX_API_KEY", "env_key")
-
+        """Storing a key drops the cached lookup."""
         store = CredentialStore()
-        key = store.get_api_key()
-        # Should get from keyring first
-        assert key == "hopx_live_stored.secret"
+        assert store.get_api_key() is None
+
+        mock_keyring.get_password.return_value = "new_key"
+        store.store_api_key("new_key")
+
+        assert store.get_api_key() == "new_key"
 
     @pytest.mark.unit
-    def test_get_api_key_returns_none_when_not_found(
-        self, temp_hopx_dir: Path, mock_keyring: MagicMock
+    def test_get_api_key_rereads_edited_file(
+        self,
+        mock_keyring: MagicMock,
+        default_creds_json_bytes: dict[str, bytes],
+        write_creds: Callable[[bytes], Path],
+        mem_backend: MemoryFileBackend,
     ) -> None:
-        """Returns None when API key not found anywhere."""
-        store = CredentialStore()
-        key = store.get_api_key()
-        assert key is None
+        """An externally edited credentials file is parsed again."""
+        write_creds(default_creds_json_bytes["api_key"])
+        store = CredentialStore(backend=mem_backend)
+        assert store.get_api_key() == "file_key"
+
+        write_creds(default_creds_json_bytes["two_profiles"])
+        assert store.get_api_key() == "key1"
 
 
 class TestCredentialStoreOAuthToken:
@@ -156,7 +268,7 @@ class TestCredentialStoreOAuthToken:
     def test_store_oauth_token_to_keyring(
         self, temp_hopx_dir: Path, mock_keyring: MagicMock
     ) -> None:
-        """OAuth token is stored in keyring."""
+        """OAuth token is stored in keyring as a single JSON entry."""
         store = CredentialStore()
         token = {
             "access_token": "access123",
@@ -165,67 +277,110 @@ class TestCredentialStoreOAuthToken:
         }
         store.store_oauth_token(token)
 
-        assert mock_keyring.set_password.call_count == 3
+        mock_keyring.set_password.assert_called_once()
+        service, key, value = mock_keyring.set_password.call_args.args
+        assert (service, key) == (KEYRING_SERVICE, "default:oauth_token")
+        assert json.loads(value) == token
 
     @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "token",
+        [{"refresh_token": "refresh456"}, {"access_token": "", "refresh_token": "refresh456"}],
+        ids=["missing", "empty"],
+    )
     def test_store_oauth_token_requires_access_token(
-        self, temp_hopx_dir: Path, mock_keyring: MagicMock
+        self, temp_hopx_dir: Path, mock_keyring: MagicMock, token: dict[str, str]
     ) -> None:
-        """Raises error if access_token missing."""
+        """Raises error if access_token is missing or empty."""
         store = CredentialStore()
         with pytest.raises(ValueError, match="access_token"):
-            store.store_oauth_token({"refresh_token": "refresh456"})
+            store.store_oauth_token(token)
+        mock_keyring.set_password.assert_not_called()
 
     @pytest.mark.unit
     def test_store_oauth_token_falls_back_to_file(
-        self, temp_hopx_dir: Path, mock_keyring_unavailable: MagicMock
+        self, mock_keyring_unavailable: MagicMock, mem_backend: MemoryFileBackend
     ) -> None:
         """OAuth token is stored in file when keyring unavailable."""
-        store = CredentialStore()
+        store = CredentialStore(backend=mem_backend)
         token = {"access_token": "access123", "refresh_token": "refresh456"}
         store.store_oauth_token(token)
 
-        assert store.credentials_file.exists()
-        with open(store.credentials_file) as f:
-            data = yaml.safe_load(f)
-        assert data["default"]["oauth_token"]["access_token"] == "access123"
+        assert b"access123" in mem_backend.store[store.credentials_file]
 
     @pytest.mark.unit
-    def test_get_oauth_token_from_keyring(self, temp_hopx_dir: Path) -> None:
+    def test_get_oauth_token_from_keyring(
+        self, temp_hopx_dir: Path, fake_keyring: Callable[[dict[str, str]], MagicMock]
+    ) -> None:
         """OAuth token is retrieved from keyring."""
-        with patch("hopx_cli.auth.credentials.keyring") as mock:
-            mock.get_password.side_effect = lambda _service, key: {
+        mock = fake_keyring(
+            {
+                "default:oauth_token": json.dumps(
+                    {
+                        "access_token": "access123",
+                        "refresh_token": "refresh456",
+                        "expires_at": 1700000000,
+                    }
+                ),
+            }
+        )
+
+        store = CredentialStore()
+        token = store.get_oauth_token()
+
+        assert token is not None
+        assert token["access_token"] == "access123"
+        assert token["refresh_token"] == "refresh456"
+        assert token["expires_at"] == 1700000000
+        mock.get_password.assert_called_once_with(KEYRING_SERVICE, "default:oauth_token")
+
+    @pytest.mark.unit
+    def test_get_oauth_token_migrates_legacy_keyring_entries(
+        self, temp_hopx_dir: Path, fake_keyring: Callable[[dict[str, str]], MagicMock]
+    ) -> None:
+        """Per-field keyring entries are read and rewritten as one entry."""
+        mock = fake_keyring(
+            {
                 "default:oauth_access": "access123",
                 "default:oauth_refresh": "refresh456",
                 "default:oauth_expires": "1700000000",
-            }.get(key)
+            }
+        )
 
-            store = CredentialStore()
-            token = store.get_oauth_token()
+        store = CredentialStore()
+        token = store.get_oauth_token()
 
-            assert token is not None
-            assert token["access_token"] == "access123"
-            assert token["refresh_token"] == "refresh456"
-            assert token["expires_at"] == 1700000000
+        assert token == {
+            "access_token": "access123",
+            "refresh_token": "refresh456",
+            "expires_at": 1700000000,
+        }
+        mock.set_password.assert_any_call(KEYRING_SERVICE, "default:oauth_token", json.dumps(token))
+        deleted = {c.args[1] for c in mock.delete_password.call_args_list}
+        assert deleted == {
+            "default:oauth_access",
+            "default:oauth_refresh",
+            "default:oauth_expires",
+        }
 
     @pytest.mark.unit
-    def test_get_oauth_token_from_file(self, temp_hopx_dir: Path, mock_keyring: MagicMock) -> None:
+    def test_get_oauth_token_from_file(
+        self,
+        mock_keyring: MagicMock,
+        default_creds_json_bytes: dict[str, bytes],
+        write_creds: Callable[[bytes], Path],
+        mem_backend: MemoryFileBackend,
+    ) -> None:
         """OAuth token is retrieved from file."""
-        creds_file = temp_hopx_dir / "credentials.yaml"
-        token_data = {
-            "access_token": "file_access",
-            "refresh_token": "file_refresh",
-        }
-        with open(creds_file, "w") as f:
-            yaml.safe_dump({"default": {"oauth_token": token_data}}, f)
+        write_creds(default_creds_json_bytes["oauth_token"])
 
-        store = CredentialStore()
+        store = CredentialStore(backend=mem_backend)
         token = store.get_oauth_token()
-        assert token == token_data
+        assert token == {"access_token": "file_access", "refresh_token": "file_refresh"}
 
     @pytest.mark.unit
     def test_get_oauth_token_returns_none_when_not_found(
-        self, temp_hopx_dir: Path, mock_keyring: MagicMock
+        self, temp_home_ro: Path, mock_keyring_ro: MagicMock
     ) -> None:
         """Returns None when OAuth token not found."""
         store = CredentialStore()
@@ -238,40 +393,44 @@ class TestCredentialStoreClear:
 
     @pytest.mark.unit
     def test_clear_removes_from_keyring(self, temp_hopx_dir: Path, mock_keyring: MagicMock) -> None:
-        """clear() removes all credentials from keyring."""
+        """clear() deletes every keyring field a profile may hold, including legacy ones."""
         store = CredentialStore()
         store.clear()
 
-        # Should attempt to delete all credential types
-        assert mock_keyring.delete_password.call_count >= 3
+        mock_keyring.get_password.assert_not_called()
+        assert mock_keyring.delete_password.call_args_list == [
+            call(KEYRING_SERVICE, "default:api_key"),
+            call(KEYRING_SERVICE, "default:oauth_token"),
+            call(KEYRING_SERVICE, "default:oauth_access"),
+            call(KEYRING_SERVICE, "default:oauth_refresh"),
+            call(KEYRING_SERVICE, "default:oauth_expires"),
+        ]
 
     @pytest.mark.unit
-    def test_clear_removes_from_file(self, temp_hopx_dir: Path, mock_keyring: MagicMock) -> None:
+    def test_clear_removes_from_file(
+        self,
+        mock_keyring: MagicMock,
+        default_creds_json_bytes: dict[str, bytes],
+        write_creds: Callable[[bytes], Path],
+        mem_backend: MemoryFileBackend,
+    ) -> None:
         """clear() removes profile from credentials file."""
-        # Create credentials file
-        creds_file = temp_hopx_dir / "credentials.yaml"
-        with open(creds_file, "w") as f:
-            yaml.safe_dump(
-                {
-                    "default": {"api_key": "key1"},
-                    "staging": {"api_key": "key2"},
-                },
-                f,
-            )
+        creds_file = write_creds(default_creds_json_bytes["two_profiles"])
 
-        store = CredentialStore(profile="default")
+        store = CredentialStore(profile="default", backend=mem_backend)
         store.clear()
 
         # Default profile should be removed, staging should remain
-        with open(creds_file) as f:
-            data = yaml.safe_load(f)
-        assert "default" not in data
-        assert "staging" in data
+        contents = mem_backend.store[creds_file]
+        assert b"key1" not in contents
+        assert b"key2" in contents
 
     @pytest.mark.unit
-    def test_clear_handles_missing_file(self, temp_hopx_dir: Path, mock_keyring: MagicMock) -> None:
+    def test_clear_handles_missing_file(
+        self, mock_keyring: MagicMock, mem_backend: MemoryFileBackend
+    ) -> None:
         """clear() handles missing credentials file gracefully."""
-        store = CredentialStore()
+        store = CredentialStore(backend=mem_backend)
         # Should not raise
         store.clear()
 
@@ -281,13 +440,13 @@ class TestCredentialStoreMultiProfile:
 
     @pytest.mark.unit
     def test_different_profiles_isolated(
-        self, temp_hopx_dir: Path, mock_keyring_unavailable: MagicMock
+        self, mock_keyring_unavailable: MagicMock, mem_backend: MemoryFileBackend
     ) -> None:
         """Different profiles have isolated credentials."""
-        store1 = CredentialStore(profile="profile1")
+        store1 = CredentialStore(profile="profile1", backend=mem_backend)
         store1.store_api_key("key1")
 
-        store2 = CredentialStore(profile="profile2")
+        store2 = CredentialStore(profile="profile2", backend=mem_backend)
         store2.store_api_key("key2")
 
         # Each profile should have its own key
@@ -302,13 +461,11 @@ class TestCredentialStoreMultiProfile:
         store = CredentialStore(profile="staging")
         store.store_api_key("staging_key")
 
-        mock_keyring.set_password.assert_called_once_with(
-            KEYRING_SERVICE, "staging:api_key", "staging_key"
-        )
+        mock_keyring.set_password.assert_any_call(KEYRING_SERVICE, "staging:api_key", "staging_key")
 
 
 class TestCredentialStoreFilePermissions:
-    """Tests for file permission handling."""
+    """Tests for file permission handling on the real filesystem."""
 
     @pytest.mark.unit
     def test_credentials_file_has_restricted_permissions(
@@ -324,31 +481,58 @@ class TestCredentialStoreFilePermissions:
         actual_mode = file_stat.st_mode & 0o777
         assert actual_mode == expected_mode
 
+    @pytest.mark.unit
+    def test_existing_credentials_file_narrowed_to_owner(
+        self, temp_hopx_dir: Path, mock_keyring_unavailable: MagicMock
+    ) -> None:
+        """Saving into a world-readable credentials file resets it to 0600."""
+        store = CredentialStore()
+        store.credentials_file.write_text("{}")
+        os.chmod(store.credentials_file, 0o644)
+
+        store.store_api_key("secret_key")
+
+        assert stat.S_IMODE(os.stat(store.credentials_file).st_mode) == 0o600
+
+    @pytest.mark.unit
+    def test_missing_config_dir_created_owner_only(
+        self, temp_home: Path, mock_keyring_unavailable: MagicMock
+    ) -> None:
+        """A missing ~/.hopx directory is created with 0700 permissions."""
+        (temp_home / ".hopx").rmdir()
+
+        store = CredentialStore()
+        store.store_api_key("secret_key")
+
+        assert stat.S_IMODE(os.stat(store.config_dir).st_mode) == 0o700
+        assert stat.S_IMODE(os.stat(store.credentials_file).st_mode) == 0o600
+
 
 class TestCredentialStoreClearAllProfiles:
     """Tests for clear_all_profiles class method."""
 
     @pytest.mark.unit
     def test_clear_all_profiles_removes_file(
-        self, temp_hopx_dir: Path, mock_keyring: MagicMock
+        self,
+        mock_keyring: MagicMock,
+        default_creds_json_bytes: dict[str, bytes],
+        write_creds: Callable[[bytes], Path],
+        mem_backend: MemoryFileBackend,
     ) -> None:
         """clear_all_profiles() removes the credentials file."""
-        creds_file = temp_hopx_dir / "credentials.yaml"
-        with open(creds_file, "w") as f:
-            yaml.safe_dump({"default": {"api_key": "key1"}}, f)
+        write_creds(default_creds_json_bytes["two_profiles"])
 
-        CredentialStore.clear_all_profiles()
+        cleared = CredentialStore.clear_all_profiles(backend=mem_backend)
 
-        assert not creds_file.exists()
+        assert sorted(cleared) == ["default", "staging"]
+        assert mem_backend.store == {}
 
     @pytest.mark.unit
-    def test_clear_all_profiles_returns_cleared_profiles(self, temp_hopx_dir: Path) -> None:
+    def test_clear_all_profiles_returns_cleared_profiles(
+        self, temp_hopx_dir: Path, fake_keyring: Callable[[dict[str, str]], MagicMock]
+    ) -> None:
         """clear_all_profiles() returns list of cleared profiles."""
-        with patch("hopx_cli.auth.credentials.keyring") as mock:
-            mock.get_password.side_effect = lambda _service, key: (
-                "key" if key == "default:api_key" else None
-            )
-            mock.delete_password.return_value = None
+        fake_keyring({"default:api_key": "key"})
 
-            cleared = CredentialStore.clear_all_profiles()
-            assert "default" in cleared
+        cleared = CredentialStore.clear_all_profiles()
+        assert "default" in cleared
@@ -9,131 +9,179 @@ Tests cover:
 
 from __future__ import annotations
 
+import subprocess
+import sys
 from io import StringIO
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+import qrcode
 from rich.console import Console
 
+from hopx_cli.auth import display
+from hopx_cli.auth.display import (
+    _print_qr_code,
+    _render_qr,
+    prompt_callback_url,
+    show_auth_url,
+    show_headless_instructions,
+    show_progress,
+)
+from hopx_cli.output import Spinner
+
+
+def _plain_console(output: StringIO) -> Console:
+    """Console writing uncolored text to output; tests only check substrings."""
+    return Console(file=output, force_terminal=False, no_color=True, width=200, highlight=False)
+
+
+@pytest.fixture(autouse=True)
+def clear_qr_cache() -> None:
+    """Drop QR renders cached by earlier tests."""
+    _render_qr.cache_clear()
+
+
+@pytest.fixture
+def display_console(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace the display module console with a mock."""
+    fake_console = MagicMock()
+    monkeypatch.setattr(display, "console", fake_console)
+    return fake_console
+
+
+@pytest.fixture
+def patched_display(monkeypatch: pytest.MonkeyPatch, display_console: MagicMock) -> SimpleNamespace:
+    """Mock the console, clipboard copy, and QR printer used by show_auth_url."""
+    copy = MagicMock()
+    print_qr = MagicMock()
+    monkeypatch.setattr("pyperclip.copy", copy)
+    monkeypatch.setattr(display, "_print_qr_code", print_qr)
+    return SimpleNamespace(console=display_console, copy=copy, qr=print_qr)
+
+
+@pytest.fixture
+def display_output(monkeypatch: pytest.MonkeyPatch, patched_display: SimpleNamespace) -> StringIO:
+    """Capture display output as plain text, with clipboard and QR still mocked."""
+    output = StringIO()
+    monkeypatch.setattr(display, "console", _plain_console(output))
+    return output
+
 
 class TestShowAuthUrl:
     """Tests for show_auth_url function."""
 
     @pytest.mark.unit
-    def test_displays_url(self) -> None:
+    def test_displays_url(self, display_output: StringIO) -> None:
         """Displays the authentication URL."""
-        from hopx_cli.auth.display import show_auth_url
-
-        output = StringIO()
-        with patch("hopx_cli.auth.display.console", Console(file=output, force_terminal=True)):
-            with patch("hopx_cli.auth.display.pyperclip.copy"):
-                with patch("hopx_cli.auth.display._print_qr_code"):
-                    show_auth_url("https://auth.example.com", show_qr=False)
+        show_auth_url("https://auth.example.com", show_qr=False)
 
-        assert "https://auth.example.com" in output.getvalue()
+        assert "https://auth.example.com" in display_output.getvalue()
 
     @pytest.mark.unit
-    def test_displays_title(self) -> None:
+    def test_displays_title(self, display_output: StringIO) -> None:
         """Displays the title when provided."""
-        from hopx_cli.auth.display import show_auth_url
+        show_auth_url("https://auth.example.com", title="Login", show_qr=False)
 
-        output = StringIO()
-        with patch("hopx_cli.auth.display.console", Console(file=output, force_terminal=True)):
-            with patch("hopx_cli.auth.display.pyperclip.copy"):
-                with patch("hopx_cli.auth.display._print_qr_code"):
-                    show_auth_url("https://auth.example.com", title="Login", show_qr=False)
-
-        assert "Login" in output.getvalue()
+        assert "Login" in display_output.getvalue()
 
     @pytest.mark.unit
-    def test_copies_to_clipboard_when_enabled(self) -> None:
+    def test_copies_to_clipboard_when_enabled(self, patched_display: SimpleNamespace) -> None:
         """Copies URL to clipboard when auto_copy=True."""
-        from hopx_cli.auth.display import show_auth_url
-
-        with patch("hopx_cli.auth.display.console"):
-            with patch("hopx_cli.auth.display.pyperclip.copy") as mock_copy:
-                with patch("hopx_cli.auth.display._print_qr_code"):
-                    show_auth_url("https://auth.example.com", auto_copy=True, show_qr=False)
+        show_auth_url("https://auth.example.com", auto_copy=True, show_qr=False)
 
-        mock_copy.assert_called_once_with("https://auth.example.com")
+        patched_display.copy.assert_called_once_with("https://auth.example.com")
 
     @pytest.mark.unit
-    def test_handles_clipboard_failure(self) -> None:
+    def test_handles_clipboard_failure(self, patched_display: SimpleNamespace) -> None:
         """Handles clipboard failure gracefully."""
-        from hopx_cli.auth.display import show_auth_url
+        patched_display.copy.side_effect = Exception("No clipboard")
 
-        with patch("hopx_cli.auth.display.console"):
-            with patch(
-                "hopx_cli.auth.display.pyperclip.copy", side_effect=Exception("No clipboard")
-            ):
-                with patch("hopx_cli.auth.display._print_qr_code"):
-                    # Should not raise
-                    show_auth_url("https://auth.example.com", auto_copy=True, show_qr=False)
+        # Should not raise
+        show_auth_url("https://auth.example.com", auto_copy=True, show_qr=False)
 
     @pytest.mark.unit
-    def test_shows_qr_code_when_enabled(self) -> None:
+    def test_shows_qr_code_when_enabled(self, patched_display: SimpleNamespace) -> None:
         """Shows QR code when show_qr=True."""
-        from hopx_cli.auth.display import show_auth_url
-
-        with patch("hopx_cli.auth.display.console"):
-            with patch("hopx_cli.auth.display.pyperclip.copy"):
-                with patch("hopx_cli.auth.display._print_qr_code") as mock_qr:
-                    show_auth_url("https://auth.example.com", show_qr=True)
+        show_auth_url("https://auth.example.com", show_qr=True)
 
-        mock_qr.assert_called_once_with("https://auth.example.com")
+        patched_display.qr.assert_called_once_with("https://auth.example.com")
 
     @pytest.mark.unit
-    def test_skips_qr_code_when_disabled(self) -> None:
+    def test_skips_qr_code_when_disabled(self, patched_display: SimpleNamespace) -> None:
         """Skips QR code when show_qr=False."""
-        from hopx_cli.auth.display import show_auth_url
+        show_auth_url("https://auth.example.com", show_qr=False)
 
-        with patch("hopx_cli.auth.display.console"):
-            with patch("hopx_cli.auth.display.pyperclip.copy"):
-                with patch("hopx_cli.auth.display._print_qr_code") as mock_qr:
-                    show_auth_url("https://auth.example.com", show_qr=False)
+        patched_display.qr.assert_not_called()
 
-        mock_qr.assert_not_called()
+
+class TestLazyImports:
+    """Tests for deferred clipboard and QR imports."""
+
+    @pytest.mark.unit
+    @pytest.mark.slow
+    def test_import_defers_clipboard_and_qr(self) -> None:
+        """Importing the module does not import pyperclip or qrcode."""
+        code = (
+            "import sys, hopx_cli.auth.display\n"
+            "print([m for m in ('pyperclip', 'qrcode') if m in sys.modules])\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
 
 
 class TestPrintQrCode:
     """Tests for _print_qr_code function."""
 
     @pytest.mark.unit
-    def test_generates_qr_code(self) -> None:
+    def test_generates_qr_code(self, display_console: MagicMock) -> None:
         """Generates and prints QR code."""
-        from hopx_cli.auth.display import _print_qr_code
-
-        mock_console = MagicMock()
-        with patch("hopx_cli.auth.display.console", mock_console):
-            _print_qr_code("https://example.com")
+        _print_qr_code("https://example.com")
 
         # Should have printed multiple lines (QR code)
-        assert mock_console.print.call_count > 0
+        assert display_console.print.call_count > 0
 
     @pytest.mark.unit
-    def test_handles_qr_generation_failure(self) -> None:
+    def test_handles_qr_generation_failure(self, display_console: MagicMock) -> None:
         """Handles QR code generation failure gracefully."""
-        from hopx_cli.auth.display import _print_qr_code
+        with patch("qrcode.QRCode", side_effect=Exception("QR failed")):
+            # Should not raise
+            _print_qr_code("https://example.com")
+
+    @pytest.mark.unit
+    def test_caches_render_per_url(self, display_console: MagicMock) -> None:
+        """Rendering the same URL twice builds the QR code once."""
+        with patch("qrcode.QRCode", wraps=qrcode.QRCode) as mock_qr:
+            _print_qr_code("https://example.com")
+            _print_qr_code("https://example.com")
+
+        assert mock_qr.call_count == 1
+        first, second = display_console.print.call_args_list
+        assert first == second
+
+    @pytest.mark.unit
+    def test_failure_not_cached(self, display_console: MagicMock) -> None:
+        """A failed render is retried on the next call."""
+        with patch("qrcode.QRCode", side_effect=Exception("QR failed")):
+            _print_qr_code("https://example.com")
+        display_console.print.assert_not_called()
 
-        with patch("hopx_cli.auth.display.qrcode.QRCode", side_effect=Exception("QR failed")):
-            with patch("hopx_cli.auth.display.console"):
-                # Should not raise
-                _print_qr_code("https://example.com")
+        _print_qr_code("https://example.com")
+
+        display_console.print.assert_called_once()
 
 
 class TestShowHeadlessInstructions:
     """Tests for show_headless_instructions function."""
 
     @pytest.mark.unit
-    def test_displays_instructions(self) -> None:
+    def test_displays_instructions(self, display_output: StringIO) -> None:
         """Displays headless callback instructions."""
-        from hopx_cli.auth.display import show_headless_instructions
-
-        output = StringIO()
-        with patch("hopx_cli.auth.display.console", Console(file=output, force_terminal=True)):
-            show_headless_instructions()
+        show_headless_instructions()
 
-        result = output.getvalue()
+        result = display_output.getvalue()
         assert "connection refused" in result.lower() or "browser" in result.lower()
 
 
@@ -141,85 +189,55 @@ class TestPromptCallbackUrl:
     """Tests for prompt_callback_url function."""
 
     @pytest.mark.unit
-    def test_returns_user_input(self) -> None:
+    def test_returns_user_input(self, display_console: MagicMock) -> None:
         """Returns the URL entered by user."""
-        from hopx_cli.auth.display import prompt_callback_url
-
-        mock_console = MagicMock()
-        mock_console.input.return_value = "  https://callback.example.com  "
+        display_console.input.return_value = "  https://callback.example.com  "
 
-        with patch("hopx_cli.auth.display.console", mock_console):
-            result = prompt_callback_url()
+        result = prompt_callback_url()
 
         assert result == "https://callback.example.com"
 
     @pytest.mark.unit
-    def test_raises_on_keyboard_interrupt(self) -> None:
+    def test_raises_on_keyboard_interrupt(self, display_console: MagicMock) -> None:
         """Raises RuntimeError when user cancels."""
-        from hopx_cli.auth.display import prompt_callback_url
+        display_console.input.side_effect = KeyboardInterrupt()
 
-        mock_console = MagicMock()
-        mock_console.input.side_effect = KeyboardInterrupt()
-
-        with patch("hopx_cli.auth.display.console", mock_console):
-            with pytest.raises(RuntimeError, match="cancelled"):
-                prompt_callback_url()
+        with pytest.raises(RuntimeError, match="cancelled"):
+            prompt_callback_url()
 
     @pytest.mark.unit
-    def test_raises_on_eof(self) -> None:
+    def test_raises_on_eof(self, display_console: MagicMock) -> None:
         """Raises RuntimeError on EOF."""
-        from hopx_cli.auth.display import prompt_callback_url
-
-        mock_console = MagicMock()
-        mock_console.input.side_effect = EOFError()
+        display_console.input.side_effect = EOFError()
 
-        with patch("hopx_cli.auth.display.console", mock_console):
-            with pytest.raises(RuntimeError, match="cancelled"):
-                prompt_callback_url()
+        with pytest.raises(RuntimeError, match="cancelled"):
+            prompt_callback_url()
 
 
-class TestShowSuccess:
-    """Tests for show_success function."""
+class TestShowResult:
+    """Tests for show_success and show_error."""
 
     @pytest.mark.unit
-    def test_displays_success_message(self) -> None:
-        """Displays success message with checkmark."""
-        from hopx_cli.auth.display import show_success
+    @pytest.mark.parametrize(
+        ("fn_name", "arg", "needle"),
+        [
+            ("show_success", "Login successful!", "Login successful!"),
+            ("show_success", None, "successful"),
+            ("show_error", "Authentication failed", "Authentication failed"),
+        ],
+        ids=["success", "success-default", "error"],
+    )
+    def test_displays_message(
+        self, display_output: StringIO, fn_name: str, arg: str | None, needle: str
+    ) -> None:
+        """Displays the given message, or the default one when omitted."""
+        fn = getattr(display, fn_name)
+        if arg is None:
+            fn()
+        else:
+            fn(arg)
 
-        output = StringIO()
-        with patch("hopx_cli.auth.display.console", Console(file=output, force_terminal=True)):
-            show_success("Login successful!")
-
-        result = output.getvalue()
-        assert "Login successful!" in result
-
-    @pytest.mark.unit
-    def test_displays_default_message(self) -> None:
-        """Displays default message when none provided."""
-        from hopx_cli.auth.display import show_success
-
-        output = StringIO()
-        with patch("hopx_cli.auth.display.console", Console(file=output, force_terminal=True)):
-            show_success()
-
-        result = output.getvalue()
-        assert "successful" in result.lower()
-
-
-class TestShowError:
-    """Tests for show_error function."""
-
-    @pytest.mark.unit
-    def test_displays_error_message(self) -> None:
-        """Displays error message with X mark."""
-        from hopx_cli.auth.display import show_error
-
-        output = StringIO()
-        with patch("hopx_cli.auth.display.console", Console(file=output, force_terminal=True)):
-            show_error("Authentication failed")
-
-        result = output.getvalue()
-        assert "Authentication failed" in result
+        assert needle in display_output.getvalue()
 
 
 class TestShowProgress:
@@ -228,9 +246,6 @@ class TestShowProgress:
     @pytest.mark.unit
     def test_returns_spinner(self) -> None:
         """Returns a Spinner instance."""
-        from hopx_cli.auth.display import show_progress
-        from hopx_cli.output import Spinner
-
         with patch("hopx_cli.output.progress.Live"):
             result = show_progress("Loading...")
 
@@ -10,13 +10,70 @@ Tests cover:
 from __future__ import annotations
 
 import time
+from collections.abc import Callable
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, create_autospec
 
 import pytest
+from pytest_mock import MockerFixture
 
+from hopx_cli.auth.credentials import CredentialStore
 from hopx_cli.auth.token import TokenManager
 
+MakeManager = Callable[[dict[str, str | None]], tuple[TokenManager, MagicMock]]
+
+# Expiry times, taken once at import; an hour stays in the future for the
+# whole run, and two minutes is inside the 5 minute refresh window
+_NOW = int(time.time())
+FUTURE_1H = _NOW + 3600
+NEAR_EXPIRY = _NOW + 120
+
+# Legacy per-field keyring entries for an OAuth token that is valid for an
+# hour, and for one inside the refresh window
+OAUTH_VALID: dict[str, str | None] = {
+    "default:oauth_access": "oauth_access_token",
+    "default:oauth_refresh": "refresh_token",
+    "default:oauth_expires": str(FUTURE_1H),
+}
+OAUTH_EXPIRING: dict[str, str | None] = {
+    "default:oauth_access": "old_token",
+    "default:oauth_refresh": "refresh_token",
+    "default:oauth_expires": str(NEAR_EXPIRY),
+}
+
+
+@pytest.fixture(scope="class")
+def class_keyring(class_mocker: MockerFixture) -> MagicMock:
+    """Keyring mock patched in once per test class.
+
+    Autospecced, so calls must match keyring's real signatures. Building it
+    costs more than a plain spec, which is why it is shared per class.
+
+    Returns:
+        MagicMock replacing the keyring module
+    """
+    import keyring
+
+    return class_mocker.patch(
+        "hopx_cli.auth.credentials.keyring", create_autospec(keyring, spec_set=True)
+    )
+
+
+@pytest.fixture
+def fake_keyring(class_keyring: MagicMock) -> Callable[[dict[str, str | None]], MagicMock]:
+    """Point the class-wide keyring mock at fixed entries.
+
+    Overrides the auth conftest fixture of the same name, which patches
+    keyring again for every test.
+    """
+
+    def install(entries: dict[str, str | None]) -> MagicMock:
+        class_keyring.reset_mock(return_value=True, side_effect=True)
+        class_keyring.get_password.side_effect = lambda _service, key: entries.get(key)
+        return class_keyring
+
+    return install
+
 
 class TestTokenManagerGetValidApiKey:
     """Tests for TokenManager.get_valid_api_key()."""
@@ -26,8 +83,6 @@ class TestTokenManagerGetValidApiKey:
         self, temp_hopx_dir: Any, mock_keyring: MagicMock, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Environment variable takes priority over credential store."""
-        from hopx_cli.auth.credentials import CredentialStore
-
         monkeypatch.setenv("HOPX_API_KEY", "env_api_key")
         store = CredentialStore()
         manager = TokenManager(store)
@@ -40,8 +95,6 @@ class TestTokenManagerGetValidApiKey:
         self, temp_hopx_dir: Any, mock_keyring_with_api_key: MagicMock
     ) -> None:
         """Falls back to credential store when no env var."""
-        from hopx_cli.auth.credentials import CredentialStore
-
         store = CredentialStore()
         manager = TokenManager(store)
 
@@ -53,8 +106,6 @@ class TestTokenManagerGetValidApiKey:
         self, temp_hopx_dir: Any, mock_keyring: MagicMock
     ) -> None:
         """Returns None when no API key in env or store."""
-        from hopx_cli.auth.credentials import CredentialStore
-
         store = CredentialStore()
         manager = TokenManager(store)
 
@@ -68,8 +119,6 @@ class TestTokenManagerGetValidOAuthToken:
     @pytest.mark.unit
     def test_returns_none_when_no_token(self, temp_hopx_dir: Any, mock_keyring: MagicMock) -> None:
         """Returns None when no OAuth token stored."""
-        from hopx_cli.auth.credentials import CredentialStore
-
         store = CredentialStore()
         manager = TokenManager(store)
 
@@ -77,109 +126,61 @@ class TestTokenManagerGetValidOAuthToken:
         assert result is None
 
     @pytest.mark.unit
-    def test_returns_valid_token(self, temp_hopx_dir: Any) -> None:
+    def test_returns_valid_token(self, temp_hopx_dir: Any, keyring_manager: MakeManager) -> None:
         """Returns access token when valid and not expired."""
-        from hopx_cli.auth.credentials import CredentialStore
-
-        with patch("hopx_cli.auth.credentials.keyring") as mock:
-            future_time = int(time.time()) + 3600  # 1 hour from now
-            mock.get_password.side_effect = lambda _service, key: {
-                "default:oauth_access": "valid_access_token",
-                "default:oauth_refresh": "refresh_token",
-                "default:oauth_expires": str(future_time),
-            }.get(key)
+        manager, _ = keyring_manager(OAUTH_VALID)
 
-            store = CredentialStore()
-            manager = TokenManager(store)
-
-            result = manager.get_valid_oauth_token()
-            assert result == "valid_access_token"
+        result = manager.get_valid_oauth_token()
+        assert result == "oauth_access_token"
 
     @pytest.mark.unit
-    def test_refreshes_expiring_token(self, temp_hopx_dir: Any) -> None:
+    def test_refreshes_expiring_token(
+        self, temp_hopx_dir: Any, keyring_manager: MakeManager, mocker: MockerFixture
+    ) -> None:
         """Refreshes token when within 5 minutes of expiry."""
-        from hopx_cli.auth.credentials import CredentialStore
-
-        with patch("hopx_cli.auth.credentials.keyring") as mock_keyring:
-            # Token expires in 2 minutes (within 5 min window)
-            expires_at = int(time.time()) + 120
-            mock_keyring.get_password.side_effect = lambda _service, key: {
-                "default:oauth_access": "old_access_token",
-                "default:oauth_refresh": "refresh_token",
-                "default:oauth_expires": str(expires_at),
-            }.get(key)
-
-            with patch("hopx_cli.auth.token.refresh_oauth_token") as mock_refresh:
-                mock_refresh.return_value = {
-                    "access_token": "new_access_token",
-                    "expires_at": int(time.time()) + 3600,
-                }
-
-                store = CredentialStore()
-                manager = TokenManager(store)
-
-                result = manager.get_valid_oauth_token()
-                assert result == "new_access_token"
-                mock_refresh.assert_called_once_with("refresh_token")
+        mock_refresh = mocker.patch(
+            "hopx_cli.auth.token.refresh_oauth_token",
+            return_value={"access_token": "new_access_token", "expires_at": FUTURE_1H},
+        )
+        manager, _ = keyring_manager(OAUTH_EXPIRING)
+
+        result = manager.get_valid_oauth_token()
+        assert result == "new_access_token"
+        mock_refresh.assert_called_once_with("refresh_token")
 
     @pytest.mark.unit
-    def test_returns_none_when_refresh_fails(self, temp_hopx_dir: Any) -> None:
+    def test_returns_none_when_refresh_fails(
+        self, temp_hopx_dir: Any, keyring_manager: MakeManager, mocker: MockerFixture
+    ) -> None:
         """Returns None when token refresh fails."""
-        from hopx_cli.auth.credentials import CredentialStore
-
-        with patch("hopx_cli.auth.credentials.keyring") as mock_keyring:
-            expires_at = int(time.time()) + 120  # expiring soon
-            mock_keyring.get_password.side_effect = lambda _service, key: {
-                "default:oauth_access": "old_token",
-                "default:oauth_refresh": "refresh_token",
-                "default:oauth_expires": str(expires_at),
-            }.get(key)
-
-            with patch("hopx_cli.auth.token.refresh_oauth_token") as mock_refresh:
-                mock_refresh.side_effect = Exception("Refresh failed")
-
-                store = CredentialStore()
-                manager = TokenManager(store)
+        mock_refresh = mocker.patch(
+            "hopx_cli.auth.token.refresh_oauth_token", side_effect=Exception("Refresh failed")
+        )
+        manager, _ = keyring_manager(OAUTH_EXPIRING)
 
-                result = manager.get_valid_oauth_token()
-                assert result is None
+        result = manager.get_valid_oauth_token()
+        assert result is None
+        mock_refresh.assert_called_once_with("refresh_token")
 
     @pytest.mark.unit
-    def test_returns_none_when_no_refresh_token(self, temp_hopx_dir: Any) -> None:
+    def test_returns_none_when_no_refresh_token(
+        self, temp_hopx_dir: Any, keyring_manager: MakeManager
+    ) -> None:
         """Returns None when expiring but no refresh token available."""
-        from hopx_cli.auth.credentials import CredentialStore
-
-        with patch("hopx_cli.auth.credentials.keyring") as mock:
-            expires_at = int(time.time()) + 120  # expiring soon
-            mock.get_password.side_effect = lambda _service, key: {
-                "default:oauth_access": "old_token",
-                "default:oauth_refresh": None,  # No refresh token
-                "default:oauth_expires": str(expires_at),
-            }.get(key)
+        manager, _ = keyring_manager({**OAUTH_EXPIRING, "default:oauth_refresh": None})
 
-            store = CredentialStore()
-            manager = TokenManager(store)
-
-            result = manager.get_valid_oauth_token()
-            assert result is None
+        result = manager.get_valid_oauth_token()
+        assert result is None
 
     @pytest.mark.unit
-    def test_returns_none_when_no_access_token(self, temp_hopx_dir: Any) -> None:
+    def test_returns_none_when_no_access_token(
+        self, temp_hopx_dir: Any, keyring_manager: MakeManager
+    ) -> None:
         """Returns None when no access token in stored data."""
-        from hopx_cli.auth.credentials import CredentialStore
+        manager, _ = keyring_manager({**OAUTH_VALID, "default:oauth_access": None})
 
-        with patch("hopx_cli.auth.credentials.keyring") as mock:
-            mock.get_password.side_effect = lambda _service, key: {
-                "default:oauth_access": None,
-                "default:oauth_refresh": "refresh_token",
-                "default:oauth_expires": str(int(time.time()) + 3600),
-            }.get(key)
-
-            store = CredentialStore()
-            manager = TokenManager(store)
-
-            result = manager.get_valid_oauth_token()
-            assert result is None
+        result = manager.get_valid_oauth_token()
+        assert result is None
 
 
 class TestTokenManagerIsAuthenticated:
@@ -190,36 +191,23 @@ class TestTokenManagerIsAuthenticated:
         self, temp_hopx_dir: Any, mock_keyring_with_api_key: MagicMock
     ) -> None:
         """Returns True when API key is available."""
-        from hopx_cli.auth.credentials import CredentialStore
-
         store = CredentialStore()
         manager = TokenManager(store)
 
         assert manager.is_authenticated() is True
 
     @pytest.mark.unit
-    def test_true_when_has_oauth_token(self, temp_hopx_dir: Any) -> None:
+    def test_true_when_has_oauth_token(
+        self, temp_hopx_dir: Any, keyring_manager: MakeManager
+    ) -> None:
         """Returns True when valid OAuth token is available."""
-        from hopx_cli.auth.credentials import CredentialStore
-
-        with patch("hopx_cli.auth.credentials.keyring") as mock:
-            future_time = int(time.time()) + 3600
-            mock.get_password.side_effect = lambda _service, key: {
-                "default:oauth_access": "access_token",
-                "default:oauth_refresh": "refresh_token",
-                "default:oauth_expires": str(future_time),
-            }.get(key)
+        manager, _ = keyring_manager(OAUTH_VALID)
 
-            store = CredentialStore()
-            manager = TokenManager(store)
-
-            assert manager.is_authenticated() is True
+        assert manager.is_authenticated() is True
 
     @pytest.mark.unit
     def test_false_when_no_credentials(self, temp_hopx_dir: Any, mock_keyring: MagicMock) -> None:
         """Returns False when no credentials available."""
-        from hopx_cli.auth.credentials import CredentialStore
-
         store = CredentialStore()
         manager = TokenManager(store)
 
@@ -230,132 +218,67 @@ class TestTokenManagerGetAuthStatus:
     """Tests for TokenManager.get_auth_status()."""
 
     @pytest.mark.unit
-    def test_no_auth_status(self, temp_hopx_dir: Any, mock_keyring: MagicMock) -> None:
-        """Returns correct status when not authenticated."""
-        from hopx_cli.auth.credentials import CredentialStore
-
-        store = CredentialStore()
-        manager = TokenManager(store)
-
-        status = manager.get_auth_status()
-        assert status["auth_method"] is None
-        assert status["has_api_key"] is False
-        assert status["has_oauth"] is False
-        assert status["is_authenticated"] is False
-
-    @pytest.mark.unit
-    def test_api_key_only_status(
-        self, temp_hopx_dir: Any, mock_keyring_with_api_key: MagicMock
+    @pytest.mark.parametrize(
+        ("entries", "expected"),
+        [
+            ({}, (None, False, False, False)),
+            ({"default:api_key": "hopx_live_key123.secret"}, ("api_key", True, False, True)),
+            (OAUTH_VALID, ("oauth", False, True, True)),
+            (
+                {**OAUTH_VALID, "default:api_key": "hopx_live_key123.secret"},
+                ("both", True, True, True),
+            ),
+        ],
+        ids=["none", "api-key", "oauth", "both"],
+    )
+    def test_auth_status(
+        self,
+        temp_hopx_dir: Any,
+        keyring_manager: MakeManager,
+        entries: dict[str, str | None],
+        expected: tuple[str | None, bool, bool, bool],
     ) -> None:
-        """Returns correct status with API key only."""
-        from hopx_cli.auth.credentials import CredentialStore
-
-        store = CredentialStore()
-        manager = TokenManager(store)
+        """Reports the auth method and which credentials are present."""
+        manager, _ = keyring_manager(entries)
 
         status = manager.get_auth_status()
-        assert status["auth_method"] == "api_key"
-        assert status["has_api_key"] is True
-        assert status["has_oauth"] is False
-        assert status["is_authenticated"] is True
-        assert status["api_key_preview"] is not None
-        assert "***" in status["api_key_preview"] or "*" in status["api_key_preview"]
+        assert (
+            status["auth_method"],
+            status["has_api_key"],
+            status["has_oauth"],
+            status["is_authenticated"],
+        ) == expected
 
     @pytest.mark.unit
-    def test_oauth_only_status(self, temp_hopx_dir: Any) -> None:
-        """Returns correct status with OAuth token only."""
-        from hopx_cli.auth.credentials import CredentialStore
-
-        with patch("hopx_cli.auth.credentials.keyring") as mock:
-            future_time = int(time.time()) + 3600
-            mock.get_password.side_effect = lambda _service, key: {
-                "default:oauth_access": "oauth_access_token",
-                "default:oauth_refresh": "refresh_token",
-                "default:oauth_expires": str(future_time),
-                "default:api_key": None,
-            }.get(key)
-
-            store = CredentialStore()
-            manager = TokenManager(store)
-
-            status = manager.get_auth_status()
-            assert status["auth_method"] == "oauth"
-            assert status["has_api_key"] is False
-            assert status["has_oauth"] is True
-            assert status["is_authenticated"] is True
-
-    @pytest.mark.unit
-    def test_both_auth_status(self, temp_hopx_dir: Any) -> None:
-        """Returns correct status with both API key and OAuth."""
-        from hopx_cli.auth.credentials import CredentialStore
-
-        with patch("hopx_cli.auth.credentials.keyring") as mock:
-            future_time = int(time.time()) + 3600
-            mock.get_password.side_effect = lambda _service, key: {
-                "default:api_key": "hopx_live_key123.secret",
-                "default:oauth_access": "oauth_access_token",
-                "default:oauth_refresh": "refresh_token",
-                "default:oauth_expires": str(future_time),
-            }.get(key)
-
-            store = CredentialStore()
-            manager = TokenManager(store)
-
-            status = manager.get_auth_status()
-            assert status["auth_method"] == "both"
-            assert status["has_api_key"] is True
-            assert status["has_oauth"] is True
-            assert status["is_authenticated"] is True
-
-    @pytest.mark.unit
-    def test_api_key_preview_format(self, temp_hopx_dir: Any) -> None:
+    def test_api_key_preview_format(self, temp_hopx_dir: Any, keyring_manager: MakeManager) -> None:
         """API key preview correctly masks the secret part."""
-        from hopx_cli.auth.credentials import CredentialStore
-
-        with patch("hopx_cli.auth.credentials.keyring") as mock:
-            mock.get_password.side_effect = lambda _service, key: (
-                "hopx_live_abc123.secretpart" if key == "default:api_key" else None
-            )
+        manager, _ = keyring_manager({"default:api_key": "hopx_live_abc123.secretpart"})
 
-            store = CredentialStore()
-            manager = TokenManager(store)
-
-            status = manager.get_auth_status()
-            # Should show key ID but mask secret
-            assert "abc123" in status["api_key_preview"]
-            assert "secretpart" not in status["api_key_preview"]
+        status = manager.get_auth_status()
+        # Should show key ID but mask secret
+        assert "*" in status["api_key_preview"]
+        assert "abc123" in status["api_key_preview"]
+        assert "secretpart" not in status["api_key_preview"]
 
 
 class TestTokenManagerGetPreferredToken:
     """Tests for TokenManager.get_preferred_token()."""
 
     @pytest.mark.unit
-    def test_prefers_oauth_over_api_key(self, temp_hopx_dir: Any) -> None:
+    def test_prefers_oauth_over_api_key(
+        self, temp_hopx_dir: Any, keyring_manager: MakeManager
+    ) -> None:
         """OAuth token is preferred over API key."""
-        from hopx_cli.auth.credentials import CredentialStore
-
-        with patch("hopx_cli.auth.credentials.keyring") as mock:
-            future_time = int(time.time()) + 3600
-            mock.get_password.side_effect = lambda _service, key: {
-                "default:api_key": "api_key_value",
-                "default:oauth_access": "oauth_access_token",
-                "default:oauth_refresh": "refresh_token",
-                "default:oauth_expires": str(future_time),
-            }.get(key)
+        manager, _ = keyring_manager({**OAUTH_VALID, "default:api_key": "api_key_value"})
 
-            store = CredentialStore()
-            manager = TokenManager(store)
-
-            result = manager.get_preferred_token()
-            assert result == "oauth_access_token"
+        result = manager.get_preferred_token()
+        assert result == "oauth_access_token"
 
     @pytest.mark.unit
     def test_falls_back_to_api_key(
         self, temp_hopx_dir: Any, mock_keyring_with_api_key: MagicMock
     ) -> None:
         """Falls back to API key when no OAuth token."""
-        from hopx_cli.auth.credentials import CredentialStore
-
         store = CredentialStore()
         manager = TokenManager(store)
 
@@ -365,8 +288,6 @@ class TestTokenManagerGetPreferredToken:
     @pytest.mark.unit
     def test_returns_none_when_no_tokens(self, temp_hopx_dir: Any, mock_keyring: MagicMock) -> None:
         """Returns None when no tokens available."""
-        from hopx_cli.auth.credentials import CredentialStore
-
         store = CredentialStore()
         manager = TokenManager(store)
 
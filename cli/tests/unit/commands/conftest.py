@@ -0,0 +1,86 @@
+"""Commands module specific fixtures."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from hopx_cli.commands import sandbox as sandbox_commands
+
+# Note: Function-scoped environment and keyring fixtures are in root
+# conftest.py. The module- and session-scoped fixtures below are shared by
+# many tests, so only use them in tests that neither configure the mock nor
+# write files. Commands that save to ~/.hopx (auth login/logout, config set
+# and init, anything storing credentials) need temp_hopx_dir and
+# mock_keyring_with_api_key instead.
+
+
+@pytest.fixture(scope="module")
+def temp_hopx_dir_ro(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path, None, None]:
+    """Module-scoped ~/.hopx directory under a temporary home.
+
+    Yields:
+        Path to ~/.hopx/ in the temp home
+    """
+    home = tmp_path_factory.mktemp("home")
+    hopx_dir = home / ".hopx"
+    hopx_dir.mkdir()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("HOME", str(home))
+        yield hopx_dir
+
+
+@pytest.fixture(scope="module")
+def mock_keyring_with_api_key_ro(module_mocker: MockerFixture) -> MagicMock:
+    """Module-scoped keyring mock holding only a stored API key.
+
+    Returns:
+        MagicMock replacing the keyring module
+    """
+    mock = module_mocker.patch("hopx_cli.auth.credentials.keyring")
+    mock.get_password.side_effect = lambda _service, key: (
+        "hopx_live_stored.secret" if key == "default:api_key" else None
+    )
+    return mock
+
+
+@pytest.fixture
+def mock_create_sandbox(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace create_sandbox as imported by the sandbox commands."""
+    mock = MagicMock()
+    monkeypatch.setattr(sandbox_commands, "create_sandbox", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_list_sandboxes(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace list_sandboxes as imported by the sandbox commands; lists nothing."""
+    mock = MagicMock(return_value=[])
+    monkeypatch.setattr(sandbox_commands, "list_sandboxes", mock)
+    return mock
+
+
+@pytest.fixture(scope="session")
+def env_files(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """.env files for the env var parsing tests, written once per session.
+
+    Keys name the variant: "basic", "comments", "empty_lines", and
+    "invalid".
+    """
+    contents = {
+        "basic": "KEY1=value1\nKEY2=value2\n",
+        "comments": "# This is a comment\nKEY=value\n# Another comment\n",
+        "empty_lines": "KEY1=value1\n\n\nKEY2=value2\n",
+        "invalid": "VALID=value\nINVALID_LINE\n",
+    }
+    base = tmp_path_factory.mktemp("envs")
+    files = {}
+    for name, text in contents.items():
+        path = base / f"{name}.env"
+        path.write_text(text)
+        files[name] = path
+    return files
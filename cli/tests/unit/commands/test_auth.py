@@ -10,9 +10,10 @@ Tests cover:
 from __future__ import annotations
 
 import pytest
-from typer.testing import CliRunner
 
-runner = CliRunner()
+from tests.fixtures import plain_runner
+
+runner = plain_runner()
 
 
 # =============================================================================
@@ -0,0 +1,59 @@
+"""Help tests for every command.
+
+Tests cover:
+- Help output for the root group, every command group, and every subcommand
+- `--help` exiting cleanly through the CLI for every command and alias
+
+The expected output lives in tests/fixtures/help_tree.txt. After changing
+command help, regenerate it with:
+
+    HOPX_UPDATE_HELP_SNAPSHOT=1 pytest tests/unit/commands/test_help.py
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from hopx_cli.main import app as main_app
+from tests.fixtures import command_paths, help_tree, plain_runner
+
+SNAPSHOT = Path(__file__).parents[2] / "fixtures" / "help_tree.txt"
+
+runner = plain_runner()
+
+# `run` takes an optional CODE argument ahead of its subcommands, so Click
+# reads "ps" or "kill" as the code to run and never reaches the subcommand
+SHADOWED_BY_ARGUMENT = {("run", "ps"), ("run", "kill")}
+HELP_PATHS = [
+    pytest.param(
+        path,
+        id=" ".join(path),
+        marks=pytest.mark.xfail(reason="shadowed by run's CODE argument", strict=True)
+        if tuple(path) in SHADOWED_BY_ARGUMENT
+        else (),
+    )
+    for path in command_paths(main_app)
+]
+
+
+@pytest.mark.unit
+def test_help_tree_matches_snapshot() -> None:
+    """Help for the whole command tree matches the stored snapshot."""
+    rendered = help_tree(main_app)
+
+    if os.environ.get("HOPX_UPDATE_HELP_SNAPSHOT"):
+        SNAPSHOT.write_text(rendered)
+
+    assert rendered == SNAPSHOT.read_text()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("path", HELP_PATHS)
+def test_every_command_has_help(path: list[str]) -> None:
+    """`hopx <path> --help` exits cleanly and prints that command's usage."""
+    result = runner.invoke(main_app, [*path, "--help"])
+    assert result.exit_code == 0
+    assert f"Usage: hopx {' '.join(path)} " in result.output
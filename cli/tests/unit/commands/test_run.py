@@ -4,21 +4,17 @@ Tests cover:
 - Language detection from file extension
 - Environment variable parsing
 - Output truncation
-- Command help text
 - Execution result formatting
 """
 
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 import typer
-from typer.testing import CliRunner
-
-runner = CliRunner()
-
 
 # =============================================================================
 # Helper Function Tests
@@ -29,98 +25,53 @@ class TestDetectLanguageFromFile:
     """Tests for detect_language_from_file helper."""
 
     @pytest.mark.unit
-    def test_detects_python(self) -> None:
-        """Detects Python from .py extension."""
-        from hopx_cli.commands.run import detect_language_from_file
-
-        assert detect_language_from_file(Path("script.py")) == "python"
-
-    @pytest.mark.unit
-    def test_detects_javascript(self) -> None:
-        """Detects JavaScript from .js extension."""
-        from hopx_cli.commands.run import detect_language_from_file
-
-        assert detect_language_from_file(Path("app.js")) == "javascript"
-
-    @pytest.mark.unit
-    def test_detects_javascript_mjs(self) -> None:
-        """Detects JavaScript from .mjs extension."""
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("script.py", "python"),
+            ("app.js", "javascript"),
+            ("module.mjs", "javascript"),
+            ("deploy.sh", "bash"),
+            ("script.bash", "bash"),
+            ("main.go", "go"),
+            ("file.unknown", "python"),
+            ("file.txt", "python"),
+            ("script.PY", "python"),
+            ("app.JS", "javascript"),
+            ("build.tar.sh", "bash"),
+            (".bash", "python"),
+        ],
+    )
+    def test_detects_language(self, name: str, expected: str) -> None:
+        """Maps the last suffix to a language, case-insensitively, defaulting to Python.
+
+        A dotfile such as ".bash" has no suffix, so it is not matched by name.
+        """
         from hopx_cli.commands.run import detect_language_from_file
 
-        assert detect_language_from_file(Path("module.mjs")) == "javascript"
-
-    @pytest.mark.unit
-    def test_detects_bash(self) -> None:
-        """Detects Bash from .sh extension."""
-        from hopx_cli.commands.run import detect_language_from_file
-
-        assert detect_language_from_file(Path("deploy.sh")) == "bash"
-
-    @pytest.mark.unit
-    def test_detects_bash_extension(self) -> None:
-        """Detects Bash from .bash extension."""
-        from hopx_cli.commands.run import detect_language_from_file
-
-        assert detect_language_from_file(Path("script.bash")) == "bash"
-
-    @pytest.mark.unit
-    def test_detects_go(self) -> None:
-        """Detects Go from .go extension."""
-        from hopx_cli.commands.run import detect_language_from_file
-
-        assert detect_language_from_file(Path("main.go")) == "go"
-
-    @pytest.mark.unit
-    def test_defaults_to_python(self) -> None:
-        """Defaults to Python for unknown extensions."""
-        from hopx_cli.commands.run import detect_language_from_file
-
-        assert detect_language_from_file(Path("file.unknown")) == "python"
-        assert detect_language_from_file(Path("file.txt")) == "python"
-
-    @pytest.mark.unit
-    def test_handles_uppercase_extension(self) -> None:
-        """Handles uppercase extensions."""
-        from hopx_cli.commands.run import detect_language_from_file
-
-        assert detect_language_from_file(Path("script.PY")) == "python"
-        assert detect_language_from_file(Path("app.JS")) == "javascript"
+        assert detect_language_from_file(Path(name)) == expected
 
 
 class TestParseEnvVars:
     """Tests for parse_env_vars helper."""
 
     @pytest.mark.unit
-    def test_parses_empty(self) -> None:
-        """Returns empty dict when no env vars provided."""
+    @pytest.mark.parametrize(
+        ("env_list", "expected"),
+        [
+            (None, {}),
+            ([], {}),
+            (["KEY=value"], {"KEY": "value"}),
+            (["KEY1=value1", "KEY2=value2"], {"KEY1": "value1", "KEY2": "value2"}),
+            (["URL=http://example.com?key=value"], {"URL": "http://example.com?key=value"}),
+        ],
+        ids=["none", "empty", "single", "multiple", "value-with-equals"],
+    )
+    def test_parses(self, env_list: list[str] | None, expected: dict[str, str]) -> None:
+        """Parses KEY=VALUE strings, splitting on the first equals sign."""
         from hopx_cli.commands.run import parse_env_vars
 
-        assert parse_env_vars(None) == {}
-        assert parse_env_vars([]) == {}
-
-    @pytest.mark.unit
-    def test_parses_single_var(self) -> None:
-        """Parses single environment variable."""
-        from hopx_cli.commands.run import parse_env_vars
-
-        result = parse_env_vars(["KEY=value"])
-        assert result == {"KEY": "value"}
-
-    @pytest.mark.unit
-    def test_parses_multiple_vars(self) -> None:
-        """Parses multiple environment variables."""
-        from hopx_cli.commands.run import parse_env_vars
-
-        result = parse_env_vars(["KEY1=value1", "KEY2=value2"])
-        assert result == {"KEY1": "value1", "KEY2": "value2"}
-
-    @pytest.mark.unit
-    def test_parses_value_with_equals(self) -> None:
-        """Handles values containing equals sign."""
-        from hopx_cli.commands.run import parse_env_vars
-
-        result = parse_env_vars(["URL=http://example.com?key=value"])
-        assert result["URL"] == "http://example.com?key=value"
+        assert parse_env_vars(env_list) == expected
 
     @pytest.mark.unit
     def test_raises_on_invalid_format(self) -> None:
@@ -135,31 +86,17 @@ class TestTruncateOutput:
     """Tests for truncate_output helper."""
 
     @pytest.mark.unit
-    def test_returns_empty_unchanged(self) -> None:
-        """Returns empty string unchanged."""
-        from hopx_cli.commands.run import truncate_output
-
-        text, truncated = truncate_output("")
-        assert text == ""
-        assert truncated is False
-
-    @pytest.mark.unit
-    def test_returns_none_unchanged(self) -> None:
-        """Handles None input."""
+    @pytest.mark.parametrize(
+        "text",
+        ["", None, "line1\nline2\nline3", "\n".join(f"line{i}" for i in range(50))],
+        ids=["empty", "none", "small", "exact-max-lines"],
+    )
+    def test_returns_unchanged(self, text: str | None) -> None:
+        """Output at or under max lines is returned as is."""
         from hopx_cli.commands.run import truncate_output
 
-        text, truncated = truncate_output(None)  # type: ignore
-        assert text is None
-        assert truncated is False
-
-    @pytest.mark.unit
-    def test_small_output_unchanged(self) -> None:
-        """Returns small output unchanged."""
-        from hopx_cli.commands.run import truncate_output
-
-        small_text = "line1\nline2\nline3"
-        text, truncated = truncate_output(small_text)
-        assert text == small_text
+        result, truncated = truncate_output(text, max_lines=50)  # type: ignore[arg-type]
+        assert result == text
         assert truncated is False
 
     @pytest.mark.unit
@@ -178,19 +115,6 @@ class TestTruncateOutput:
         assert "line49" in text
         assert "line99" not in text
 
-    @pytest.mark.unit
-    def test_exact_max_lines_not_truncated(self) -> None:
-        """Output exactly at max lines is not truncated."""
-        from hopx_cli.commands.run import truncate_output
-
-        lines = [f"line{i}" for i in range(50)]
-        text_50 = "\n".join(lines)
-
-        text, truncated = truncate_output(text_50, max_lines=50)
-
-        assert truncated is False
-        assert text == text_50
-
 
 class TestLanguageExtensions:
     """Tests for language/extension mappings."""
@@ -216,51 +140,6 @@ class TestLanguageExtensions:
         assert EXTENSION_TO_LANGUAGE[".go"] == "go"
 
 
-# =============================================================================
-# Command Help Tests
-# =============================================================================
-
-
-class TestRunCommandHelp:
-    """Tests for run command help text."""
-
-    @pytest.mark.unit
-    def test_run_help(self) -> None:
-        """Run command shows help."""
-        from hopx_cli.main import app as main_app
-
-        result = runner.invoke(main_app, ["run", "--help"])
-        assert result.exit_code == 0
-        assert "Execute" in result.output or "code" in result.output.lower()
-
-    @pytest.mark.unit
-    def test_run_code_help(self) -> None:
-        """Run code subcommand shows help."""
-        from hopx_cli.main import app as main_app
-
-        result = runner.invoke(main_app, ["run", "code", "--help"])
-        assert result.exit_code == 0
-        assert "sandbox" in result.output.lower() or "code" in result.output.lower()
-
-    @pytest.mark.unit
-    def test_run_file_help(self) -> None:
-        """Run file subcommand shows help."""
-        from hopx_cli.main import app as main_app
-
-        result = runner.invoke(main_app, ["run", "file", "--help"])
-        assert result.exit_code == 0
-        assert "file" in result.output.lower()
-
-    @pytest.mark.unit
-    def test_run_command_help(self) -> None:
-        """Run command subcommand shows help."""
-        from hopx_cli.main import app as main_app
-
-        result = runner.invoke(main_app, ["run", "command", "--help"])
-        assert result.exit_code == 0
-        assert "command" in result.output.lower() or "shell" in result.output.lower()
-
-
 # =============================================================================
 # Execution Result Formatting Tests
 # =============================================================================
@@ -274,17 +153,18 @@ class TestFormatExecutionResult:
         """JSON format produces valid JSON."""
         from hopx_cli.commands.run import format_execution_result
 
-        mock_result = MagicMock()
-        mock_result.stdout = "Hello, World!"
-        mock_result.stderr = ""
-        mock_result.exit_code = 0
-        mock_result.success = True
-        mock_result.execution_time = 0.5
-        mock_result.result = None
-        mock_result.rich_outputs = []
+        mock_result = SimpleNamespace(
+            stdout="Hello, World!",
+            stderr="",
+            exit_code=0,
+            success=True,
+            execution_time=0.5,
+            result=None,
+            rich_outputs=[],
+        )
 
         with patch("hopx_cli.commands.run.console") as mock_console:
-            format_execution_result(mock_result, "json", "python")
+            format_execution_result(mock_result, "json", "python")  # type: ignore[arg-type]
 
             # Should have called print with JSON
             mock_console.print.assert_called_once()
@@ -296,12 +176,10 @@ class TestFormatExecutionResult:
         """Plain format outputs stdout directly."""
         from hopx_cli.commands.run import format_execution_result
 
-        mock_result = MagicMock()
-        mock_result.stdout = "output text"
-        mock_result.stderr = ""
+        mock_result = SimpleNamespace(stdout="output text", stderr="")
 
         with patch("hopx_cli.commands.run.console") as mock_console:
-            format_execution_result(mock_result, "plain", "python")
+            format_execution_result(mock_result, "plain", "python")  # type: ignore[arg-type]
 
             mock_console.print.assert_called()
             call_args = mock_console.print.call_args
@@ -3,29 +3,31 @@
 Tests cover:
 - Sandbox create command
 - Sandbox list command
-- Sandbox info command
-- Sandbox lifecycle commands (kill, pause, resume)
-- Sandbox utility commands (health, timeout, url, token, expiry)
 - Helper functions
+
+Help for every sandbox subcommand is covered in test_help.py.
 """
 
 from __future__ import annotations
 
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 import typer
-from typer.testing import CliRunner
 
 from hopx_cli.commands.sandbox import (
+    STATUS_COLORS,
     _format_status_colored,
     _format_time_remaining,
     _parse_env_vars,
 )
+from hopx_cli.main import app as main_app
+from tests.fixtures import plain_runner
 
-runner = CliRunner()
+runner = plain_runner()
 
 
 # =============================================================================
@@ -37,115 +39,94 @@ class TestParseEnvVars:
     """Tests for _parse_env_vars helper."""
 
     @pytest.mark.unit
-    def test_parses_empty(self) -> None:
-        """Returns empty dict when no env vars provided."""
-        result = _parse_env_vars(None, None)
-        assert result == {}
-
-    @pytest.mark.unit
-    def test_parses_env_list(self) -> None:
-        """Parses KEY=VALUE from list."""
-        env_list = ["KEY1=value1", "KEY2=value2"]
-        result = _parse_env_vars(env_list, None)
-        assert result == {"KEY1": "value1", "KEY2": "value2"}
-
-    @pytest.mark.unit
-    def test_parses_env_with_equals_in_value(self) -> None:
-        """Handles values containing equals sign."""
-        env_list = ["URL=http://example.com?key=value"]
-        result = _parse_env_vars(env_list, None)
-        assert result["URL"] == "http://example.com?key=value"
+    @pytest.mark.parametrize(
+        ("env_list", "expected"),
+        [
+            (None, {}),
+            (["KEY1=value1", "KEY2=value2"], {"KEY1": "value1", "KEY2": "value2"}),
+            (["URL=http://example.com?key=value"], {"URL": "http://example.com?key=value"}),
+        ],
+        ids=["none", "multiple", "value-with-equals"],
+    )
+    def test_parses(self, env_list: list[str] | None, expected: dict[str, str]) -> None:
+        """Parses KEY=VALUE strings, splitting on the first equals sign."""
+        assert _parse_env_vars(env_list, None) == expected
 
     @pytest.mark.unit
-    def test_raises_on_invalid_format(self) -> None:
-        """Raises error for invalid format."""
-        env_list = ["INVALID_NO_EQUALS"]
-        with pytest.raises(typer.BadParameter, match="Invalid env var format"):
-            _parse_env_vars(env_list, None)
+    @pytest.mark.parametrize(
+        ("env_list", "env_file", "needle"),
+        [
+            (["INVALID_NO_EQUALS"], None, r"Invalid env var format: INVALID_NO_EQUALS"),
+            (None, "/nonexistent/.env", r"Environment file not found: /nonexistent/\.env"),
+            (None, "invalid", r"Invalid env var format in .*invalid\.env:2"),
+        ],
+        ids=["list-no-equals", "file-missing", "file-line-no-equals"],
+    )
+    def test_raises_bad_parameter(
+        self,
+        env_files: dict[str, Path],
+        env_list: list[str] | None,
+        env_file: str | None,
+        needle: str,
+    ) -> None:
+        """Raises BadParameter naming the bad entry, or the file and line.
+
+        An env_file naming an env_files variant is replaced by that file.
+        """
+        if env_file in env_files:
+            env_file = str(env_files[env_file])
+        with pytest.raises(typer.BadParameter, match=needle):
+            _parse_env_vars(env_list, env_file)
 
     @pytest.mark.unit
-    def test_parses_env_file(self, tmp_path: Path) -> None:
-        """Parses environment variables from file."""
-        env_file = tmp_path / ".env"
-        env_file.write_text("KEY1=value1\nKEY2=value2\n")
-
-        result = _parse_env_vars(None, str(env_file))
-        assert result == {"KEY1": "value1", "KEY2": "value2"}
+    @pytest.mark.parametrize(
+        ("env_list", "expected"),
+        [
+            (None, {"KEY1": "value1", "KEY2": "value2"}),
+            (["KEY1=cli_value"], {"KEY1": "cli_value", "KEY2": "value2"}),
+            (["KEY3=value3"], {"KEY1": "value1", "KEY2": "value2", "KEY3": "value3"}),
+        ],
+        ids=["file-only", "list-overrides-file", "list-adds-to-file"],
+    )
+    def test_parses_env_file(
+        self, env_files: dict[str, Path], env_list: list[str] | None, expected: dict[str, str]
+    ) -> None:
+        """Reads the file first, then lets --env entries add or override keys."""
+        assert _parse_env_vars(env_list, str(env_files["basic"])) == expected
 
     @pytest.mark.unit
-    def test_env_file_skips_comments(self, tmp_path: Path) -> None:
+    def test_env_file_skips_comments(self, env_files: dict[str, Path]) -> None:
         """Skips comments in env file."""
-        env_file = tmp_path / ".env"
-        env_file.write_text("# This is a comment\nKEY=value\n# Another comment\n")
-
-        result = _parse_env_vars(None, str(env_file))
+        result = _parse_env_vars(None, str(env_files["comments"]))
         assert result == {"KEY": "value"}
 
     @pytest.mark.unit
-    def test_env_file_skips_empty_lines(self, tmp_path: Path) -> None:
+    def test_env_file_skips_empty_lines(self, env_files: dict[str, Path]) -> None:
         """Skips empty lines in env file."""
-        env_file = tmp_path / ".env"
-        env_file.write_text("KEY1=value1\n\n\nKEY2=value2\n")
-
-        result = _parse_env_vars(None, str(env_file))
+        result = _parse_env_vars(None, str(env_files["empty_lines"]))
         assert result == {"KEY1": "value1", "KEY2": "value2"}
 
-    @pytest.mark.unit
-    def test_env_file_not_found(self) -> None:
-        """Raises error when env file not found."""
-        with pytest.raises(typer.BadParameter, match="not found"):
-            _parse_env_vars(None, "/nonexistent/.env")
-
-    @pytest.mark.unit
-    def test_env_file_invalid_line(self, tmp_path: Path) -> None:
-        """Raises error for invalid line in env file."""
-        env_file = tmp_path / ".env"
-        env_file.write_text("VALID=value\nINVALID_LINE\n")
-
-        with pytest.raises(typer.BadParameter, match="Invalid env var format"):
-            _parse_env_vars(None, str(env_file))
-
-    @pytest.mark.unit
-    def test_env_list_overrides_file(self, tmp_path: Path) -> None:
-        """CLI args override env file."""
-        env_file = tmp_path / ".env"
-        env_file.write_text("KEY=file_value\n")
-
-        env_list = ["KEY=cli_value"]
-        result = _parse_env_vars(env_list, str(env_file))
-        assert result["KEY"] == "cli_value"
-
 
 class TestFormatTimeRemaining:
     """Tests for _format_time_remaining helper."""
 
     @pytest.mark.unit
-    def test_formats_none(self) -> None:
-        """None returns 'never'."""
-        assert _format_time_remaining(None) == "never"
-
-    @pytest.mark.unit
-    def test_formats_zero(self) -> None:
-        """Zero returns 'never'."""
-        assert _format_time_remaining(0) == "never"
-
-    @pytest.mark.unit
-    def test_formats_negative(self) -> None:
-        """Negative returns 'never'."""
-        assert _format_time_remaining(-100) == "never"
-
-    @pytest.mark.unit
-    def test_formats_minutes(self) -> None:
-        """Formats minutes only."""
-        assert _format_time_remaining(300) == "5m"
-        assert _format_time_remaining(1800) == "30m"
-
-    @pytest.mark.unit
-    def test_formats_hours_and_minutes(self) -> None:
-        """Formats hours and minutes."""
-        assert _format_time_remaining(3600) == "1h 0m"
-        assert _format_time_remaining(5400) == "1h 30m"
-        assert _format_time_remaining(7200) == "2h 0m"
+    @pytest.mark.parametrize(
+        ("seconds", "expected"),
+        [
+            (None, "never"),
+            (0, "never"),
+            (-100, "never"),
+            (300, "5m"),
+            (1800, "30m"),
+            (3600, "1h 0m"),
+            (5400, "1h 30m"),
+            (7200, "2h 0m"),
+        ],
+    )
+    def test_formats(self, seconds: int | None, expected: str) -> None:
+        """Formats as hours and minutes, or 'never' when not positive."""
+        assert _format_time_remaining(seconds) == expected
 
 
 class TestFormatStatusColored:
@@ -153,36 +134,12 @@ class TestFormatStatusColored:
 
     @pytest.mark.unit
     @pytest.mark.parametrize(
-        "status",
-        ["running", "active", "ready"],
-    )
-    def test_green_statuses(self, status: str) -> None:
-        """Running/active/ready statuses are green."""
-        result = _format_status_colored(status)
-        assert "green" in result
-        assert status in result
-
-    @pytest.mark.unit
-    @pytest.mark.parametrize(
-        "status",
-        ["paused", "creating"],
+        ("status", "color"),
+        [*STATUS_COLORS.items(), ("RUNNING", "green")],
     )
-    def test_yellow_statuses(self, status: str) -> None:
-        """Paused/creating statuses are yellow."""
-        result = _format_status_colored(status)
-        assert "yellow" in result
-        assert status in result
-
-    @pytest.mark.unit
-    @pytest.mark.parametrize(
-        "status",
-        ["stopped", "killed", "error"],
-    )
-    def test_red_statuses(self, status: str) -> None:
-        """Stopped/killed/error statuses are red."""
-        result = _format_status_colored(status)
-        assert "red" in result
-        assert status in result
+    def test_status_color(self, status: str, color: str) -> None:
+        """Known statuses are wrapped in their color tag, matched case-insensitively."""
+        assert _format_status_colored(status) == f"[{color}]{status}[/{color}]"
 
     @pytest.mark.unit
     def test_unknown_status_no_color(self) -> None:
@@ -199,214 +156,75 @@ class TestFormatStatusColored:
 # =============================================================================
 
 
-def _create_mock_sandbox_info() -> MagicMock:
-    """Create a mock SandboxInfo with required attributes."""
-    mock_info = MagicMock()
-    mock_info.sandbox_id = "sb_test123"
-    mock_info.template_name = "python"
-    mock_info.template_id = None
-    mock_info.status = "running"
-    mock_info.region = "us-east-1"
-    mock_info.public_host = "https://sb_test123.vms.hopx.dev"
-    mock_info.timeout_seconds = 3600
-    mock_info.expires_at = None
-    mock_info.created_at = None
-    mock_info.resources = None
-    mock_info.internet_access = True
-    mock_info.model_dump.return_value = {
-        "sandbox_id": "sb_test123",
-        "template_name": "python",
-        "status": "running",
-        "region": "us-east-1",
-    }
-    return mock_info
+# What the stand-in SandboxInfo returns from model_dump(); tests must not mutate it
+_SANDBOX_INFO_DUMP = {
+    "sandbox_id": "sb_test123",
+    "template_name": "python",
+    "status": "running",
+    "region": "us-east-1",
+}
+
+
+def _create_mock_sandbox_info() -> SimpleNamespace:
+    """Create a stand-in SandboxInfo with required attributes."""
+    return SimpleNamespace(
+        sandbox_id="sb_test123",
+        template_name="python",
+        template_id=None,
+        status="running",
+        region="us-east-1",
+        public_host="https://sb_test123.vms.hopx.dev",
+        timeout_seconds=3600,
+        expires_at=None,
+        created_at=None,
+        resources=None,
+        internet_access=True,
+        model_dump=lambda: _SANDBOX_INFO_DUMP,
+    )
 
 
 class TestSandboxCreateCommand:
     """Tests for sandbox create command via main app."""
 
     @pytest.mark.unit
-    def test_create_basic(self, temp_hopx_dir: Path, mock_keyring_with_api_key: Any) -> None:
+    def test_create_basic(
+        self,
+        temp_hopx_dir_ro: Path,
+        mock_keyring_with_api_key_ro: Any,
+        mock_create_sandbox: MagicMock,
+    ) -> None:
         """Basic create command succeeds."""
-        from hopx_cli.main import app as main_app
-
         mock_sandbox = MagicMock()
         mock_sandbox.get_info.return_value = _create_mock_sandbox_info()
+        mock_create_sandbox.return_value = mock_sandbox
 
-        with patch("hopx_cli.commands.sandbox.create_sandbox") as mock_create:
-            mock_create.return_value = mock_sandbox
-
-            result = runner.invoke(main_app, ["sandbox", "create", "-t", "python"])
+        result = runner.invoke(main_app, ["sandbox", "create", "-t", "python"])
 
-            # Check create was called (command may fail on output but SDK interaction works)
-            if result.exit_code != 0:
-                # Print debug info
-                print(f"Output: {result.output}")
-                print(f"Exception: {result.exception}")
+        # Check create was called (command may fail on output but SDK interaction works)
+        if result.exit_code != 0:
+            # Print debug info
+            print(f"Output: {result.output}")
+            print(f"Exception: {result.exception}")
 
-            # Either success or an error we can understand
-            assert mock_create.called or result.exit_code != 0
-
-    @pytest.mark.unit
-    def test_create_help(self) -> None:
-        """Create command shows help."""
-        from hopx_cli.main import app as main_app
-
-        result = runner.invoke(main_app, ["sandbox", "create", "--help"])
-        assert result.exit_code == 0
-        assert "Create a new sandbox" in result.output
+        # Either success or an error we can understand
+        assert mock_create_sandbox.called or result.exit_code != 0
 
 
 class TestSandboxListCommand:
     """Tests for sandbox list command."""
 
     @pytest.mark.unit
-    def test_list_help(self) -> None:
-        """List command shows help."""
-        from hopx_cli.main import app as main_app
-
-        result = runner.invoke(main_app, ["sandbox", "list", "--help"])
-        assert result.exit_code == 0
-        assert "List all sandboxes" in result.output
-
-    @pytest.mark.unit
-    def test_list_empty(self, temp_hopx_dir: Path, mock_keyring_with_api_key: Any) -> None:
+    def test_list_empty(
+        self,
+        temp_hopx_dir_ro: Path,
+        mock_keyring_with_api_key_ro: Any,
+        mock_list_sandboxes: MagicMock,
+    ) -> None:
         """List with no sandboxes."""
-        from hopx_cli.main import app as main_app
-
-        with patch("hopx_cli.commands.sandbox.list_sandboxes") as mock_list:
-            mock_list.return_value = []
-
-            runner.invoke(main_app, ["sandbox", "list"])
-
-            # Should succeed with empty result
-            mock_list.assert_called_once()
+        runner.invoke(main_app, ["sandbox", "list"])
 
-
-class TestSandboxInfoCommand:
-    """Tests for sandbox info command."""
-
-    @pytest.mark.unit
-    def test_info_help(self) -> None:
-        """Info command shows help."""
-        from hopx_cli.main import app as main_app
-
-        result = runner.invoke(main_app, ["sandbox", "info", "--help"])
-        assert result.exit_code == 0
-        assert "detailed information" in result.output.lower()
-
-
-class TestSandboxKillCommand:
-    """Tests for sandbox kill command."""
-
-    @pytest.mark.unit
-    def test_kill_help(self) -> None:
-        """Kill command shows help."""
-        from hopx_cli.main import app as main_app
-
-        result = runner.invoke(main_app, ["sandbox", "kill", "--help"])
-        assert result.exit_code == 0
-        assert "Terminate" in result.output or "kill" in result.output.lower()
-
-
-class TestSandboxPauseResumeCommands:
-    """Tests for sandbox pause/resume commands."""
-
-    @pytest.mark.unit
-    def test_pause_help(self) -> None:
-        """Pause command shows help."""
-        from hopx_cli.main import app as main_app
-
-        result = runner.invoke(main_app, ["sandbox", "pause", "--help"])
-        assert result.exit_code == 0
-        assert "Pause" in result.output
-
-    @pytest.mark.unit
-    def test_resume_help(self) -> None:
-        """Resume command shows help."""
-        from hopx_cli.main import app as main_app
-
-        result = runner.invoke(main_app, ["sandbox", "resume", "--help"])
-        assert result.exit_code == 0
-        assert "Resume" in result.output
-
-
-class TestSandboxTimeoutCommand:
-    """Tests for sandbox timeout command."""
-
-    @pytest.mark.unit
-    def test_timeout_help(self) -> None:
-        """Timeout command shows help."""
-        from hopx_cli.main import app as main_app
-
-        result = runner.invoke(main_app, ["sandbox", "timeout", "--help"])
-        assert result.exit_code == 0
-        assert "timeout" in result.output.lower()
-
-
-class TestSandboxHealthCommand:
-    """Tests for sandbox health command."""
-
-    @pytest.mark.unit
-    def test_health_help(self) -> None:
-        """Health command shows help."""
-        from hopx_cli.main import app as main_app
-
-        result = runner.invoke(main_app, ["sandbox", "health", "--help"])
-        assert result.exit_code == 0
-        assert "health" in result.output.lower()
-
-
-class TestSandboxUrlCommand:
-    """Tests for sandbox url command."""
-
-    @pytest.mark.unit
-    def test_url_help(self) -> None:
-        """URL command shows help."""
-        from hopx_cli.main import app as main_app
-
-        result = runner.invoke(main_app, ["sandbox", "url", "--help"])
-        assert result.exit_code == 0
-        assert "URL" in result.output or "url" in result.output.lower()
-
-
-class TestSandboxExpiryCommand:
-    """Tests for sandbox expiry command."""
-
-    @pytest.mark.unit
-    def test_expiry_help(self) -> None:
-        """Expiry command shows help."""
-        from hopx_cli.main import app as main_app
-
-        result = runner.invoke(main_app, ["sandbox", "expiry", "--help"])
-        assert result.exit_code == 0
-        assert "expir" in result.output.lower()
-
-
-class TestSandboxConnectCommand:
-    """Tests for sandbox connect command."""
-
-    @pytest.mark.unit
-    def test_connect_help(self) -> None:
-        """Connect command shows help."""
-        from hopx_cli.main import app as main_app
-
-        result = runner.invoke(main_app, ["sandbox", "connect", "--help"])
-        assert result.exit_code == 0
-        assert "Connect" in result.output or "connect" in result.output.lower()
-
-
-class TestSandboxTokenCommand:
-    """Tests for sandbox token command."""
-
-    @pytest.mark.unit
-    def test_token_help(self) -> None:
-        """Token command shows help."""
-        from hopx_cli.main import app as main_app
-
-        result = runner.invoke(main_app, ["sandbox", "token", "--help"])
-        assert result.exit_code == 0
-        assert "token" in result.output.lower()
+        # Should succeed with empty result
+        mock_list_sandboxes.assert_called_once()
 
 
 # =============================================================================
@@ -418,44 +236,16 @@ class TestSandboxCommandsIntegration:
     """Integration tests for sandbox commands with full mocking."""
 
     @pytest.mark.unit
-    def test_sandbox_app_help(self) -> None:
-        """Sandbox command with --help shows help."""
-        from hopx_cli.main import app as main_app
-
-        result = runner.invoke(main_app, ["sandbox", "--help"])
-        assert result.exit_code == 0
-        assert "Manage" in result.output or "sandbox" in result.output.lower()
-
-    @pytest.mark.unit
-    def test_sandbox_alias_sb_works(self) -> None:
-        """sb alias works for sandbox."""
-        from hopx_cli.main import app as main_app
-
-        result = runner.invoke(main_app, ["sb", "--help"])
-        assert result.exit_code == 0
-
-    @pytest.mark.unit
-    def test_list_with_limit(self, temp_hopx_dir: Path, mock_keyring_with_api_key: Any) -> None:
+    def test_list_with_limit(
+        self,
+        temp_hopx_dir_ro: Path,
+        mock_keyring_with_api_key_ro: Any,
+        mock_list_sandboxes: MagicMock,
+    ) -> None:
         """List command accepts --limit parameter."""
-        from hopx_cli.main import app as main_app
-
-        with patch("hopx_cli.commands.sandbox.list_sandboxes") as mock_list:
-            mock_list.return_value = []
-
-            runner.invoke(main_app, ["sandbox", "list", "--limit", "10"])
-
-            # Check limit was passed
-            if mock_list.called:
-                call_kwargs = mock_list.call_args.kwargs
-                assert call_kwargs.get("limit") == 10
-
-    @pytest.mark.unit
-    def test_list_help_shows_filter_options(self) -> None:
-        """List command help shows expected content."""
-        from hopx_cli.main import app as main_app
-
-        result = runner.invoke(main_app, ["sandbox", "list", "--help"])
+        runner.invoke(main_app, ["sandbox", "list", "--limit", "10"])
 
-        assert result.exit_code == 0
-        # Check for expected content in the help text
-        assert "list" in result.output.lower() or "List" in result.output
+        # Check limit was passed
+        if mock_list_sandboxes.called:
+            call_kwargs = mock_list_sandboxes.call_args.kwargs
+            assert call_kwargs.get("limit") == 10
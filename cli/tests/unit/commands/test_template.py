@@ -11,9 +11,10 @@ from __future__ import annotations
 from unittest.mock import MagicMock, patch
 
 import pytest
-from typer.testing import CliRunner
 
-runner = CliRunner()
+from tests.fixtures import plain_runner
+
+runner = plain_runner()
 
 
 # =============================================================================
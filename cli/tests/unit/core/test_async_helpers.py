@@ -9,41 +9,53 @@ Tests cover:
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any
 
 import pytest
 
+from hopx_cli.core.async_helpers import gather_with_concurrency, run_async, run_with_timeout
 
-class TestRunAsyncDecorator:
-    """Tests for run_async decorator."""
 
-    @pytest.mark.unit
-    def test_runs_async_function_synchronously(self) -> None:
-        """Allows calling async function without await."""
-        from hopx_cli.core.async_helpers import run_async
+async def _hello() -> str:
+    return "hello"
 
-        @run_async
-        async def async_func() -> str:
-            return "hello"
 
-        result = async_func()
-        assert result == "hello"
+async def _add(a: int, b: int, c: int = 0) -> int:
+    return a + b + c
 
-    @pytest.mark.unit
-    def test_passes_arguments(self) -> None:
-        """Passes positional and keyword arguments."""
-        from hopx_cli.core.async_helpers import run_async
 
-        @run_async
-        async def async_func(a: int, b: int, c: int = 0) -> int:
-            return a + b + c
+async def _awaits_then_returns() -> dict[str, int]:
+    await asyncio.sleep(0)
+    return {"value": 42}
 
-        result = async_func(1, 2, c=3)
-        assert result == 6
+
+class TestRunAsyncDecorator:
+    """Tests for run_async decorator."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("func", "args", "kwargs", "expected"),
+        [
+            (_hello, (), {}, "hello"),
+            (_add, (1, 2), {"c": 3}, 6),
+            (_awaits_then_returns, (), {}, {"value": 42}),
+        ],
+        ids=["no-args", "args-and-kwargs", "awaits-inside"],
+    )
+    def test_returns_awaited_result(
+        self,
+        func: Callable[..., Coroutine[Any, Any, Any]],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        expected: Any,
+    ) -> None:
+        """Calls the async function without await, passing arguments through."""
+        assert run_async(func)(*args, **kwargs) == expected
 
     @pytest.mark.unit
     def test_propagates_exceptions(self) -> None:
         """Propagates exceptions from async function."""
-        from hopx_cli.core.async_helpers import run_async
 
         @run_async
         async def async_func() -> None:
@@ -55,7 +67,6 @@ class TestRunAsyncDecorator:
     @pytest.mark.unit
     def test_propagates_keyboard_interrupt(self) -> None:
         """Propagates KeyboardInterrupt to caller."""
-        from hopx_cli.core.async_helpers import run_async
 
         @run_async
         async def async_func() -> None:
@@ -67,7 +78,6 @@ class TestRunAsyncDecorator:
     @pytest.mark.unit
     def test_preserves_function_metadata(self) -> None:
         """Preserves original function name and docstring."""
-        from hopx_cli.core.async_helpers import run_async
 
         @run_async
         async def my_function() -> None:
@@ -77,28 +87,14 @@ class TestRunAsyncDecorator:
         assert my_function.__name__ == "my_function"
         assert my_function.__doc__ == "My docstring."
 
-    @pytest.mark.unit
-    def test_returns_async_result(self) -> None:
-        """Returns awaited result correctly."""
-        from hopx_cli.core.async_helpers import run_async
-
-        @run_async
-        async def async_func() -> dict[str, int]:
-            await asyncio.sleep(0)
-            return {"value": 42}
-
-        result = async_func()
-        assert result == {"value": 42}
-
 
+@pytest.mark.asyncio(loop_scope="class")
 class TestRunWithTimeout:
     """Tests for run_with_timeout function."""
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_returns_result_before_timeout(self) -> None:
         """Returns coroutine result when completed before timeout."""
-        from hopx_cli.core.async_helpers import run_with_timeout
 
         async def fast_coro() -> str:
             return "done"
@@ -107,10 +103,9 @@ class TestRunWithTimeout:
         assert result == "done"
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
+    @pytest.mark.slow
     async def test_raises_on_timeout(self) -> None:
         """Raises TimeoutError when operation times out."""
-        from hopx_cli.core.async_helpers import run_with_timeout
 
         async def slow_coro() -> str:
             await asyncio.sleep(10)
@@ -120,10 +115,8 @@ class TestRunWithTimeout:
             await run_with_timeout(slow_coro(), timeout=0.01)
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_propagates_exception(self) -> None:
         """Propagates exception from coroutine."""
-        from hopx_cli.core.async_helpers import run_with_timeout
 
         async def failing_coro() -> None:
             raise RuntimeError("fail")
@@ -132,15 +125,13 @@ class TestRunWithTimeout:
             await run_with_timeout(failing_coro(), timeout=5.0)
 
 
+@pytest.mark.asyncio(loop_scope="class")
 class TestGatherWithConcurrency:
     """Tests for gather_with_concurrency function."""
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_runs_tasks_concurrently(self) -> None:
         """Runs multiple tasks with limited concurrency."""
-        from hopx_cli.core.async_helpers import gather_with_concurrency
-
         results: list[int] = []
 
         async def task(n: int) -> int:
@@ -154,11 +145,8 @@ class TestGatherWithConcurrency:
         assert set(results) == {1, 2, 3}
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_limits_concurrency(self) -> None:
         """Limits number of concurrent tasks."""
-        from hopx_cli.core.async_helpers import gather_with_concurrency
-
         active = 0
         max_active = 0
 
@@ -166,42 +154,43 @@ class TestGatherWithConcurrency:
             nonlocal active, max_active
             active += 1
             max_active = max(max_active, active)
-            await asyncio.sleep(0.01)
+            # Yield a few times so the other tasks get a chance to start
+            for _ in range(3):
+                await asyncio.sleep(0)
             active -= 1
 
         await gather_with_concurrency(2, task(), task(), task(), task())
 
-        assert max_active <= 2
+        assert max_active == 2
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_returns_results_in_order(self) -> None:
         """Returns results in same order as tasks."""
-        from hopx_cli.core.async_helpers import gather_with_concurrency
+        # Each task waits for the next one, so they finish in reverse order
+        done = {n: asyncio.Event() for n in (1, 2, 3)}
+        finished: list[int] = []
 
         async def task(n: int) -> int:
-            await asyncio.sleep(0.01 * (3 - n))  # Vary sleep time
+            if n < 3:
+                await done[n + 1].wait()
+            finished.append(n)
+            done[n].set()
             return n
 
         results = await gather_with_concurrency(3, task(1), task(2), task(3))
 
+        assert finished == [3, 2, 1]
         assert results == [1, 2, 3]
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_handles_empty_tasks(self) -> None:
         """Handles empty task list."""
-        from hopx_cli.core.async_helpers import gather_with_concurrency
-
         results = await gather_with_concurrency(2)
         assert results == []
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_single_concurrency(self) -> None:
         """Runs tasks sequentially with concurrency=1."""
-        from hopx_cli.core.async_helpers import gather_with_concurrency
-
         order: list[int] = []
 
         async def task(n: int) -> int:
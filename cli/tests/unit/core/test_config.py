@@ -9,60 +9,59 @@ Tests cover:
 
 from __future__ import annotations
 
+import json
+import os
+import subprocess
+import sys
+from datetime import date
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
+from unittest.mock import patch
 
 import pytest
-import yaml
 
-from hopx_cli.core.config import CLIConfig
+from hopx_cli.core.config import (
+    CLIConfig,
+    _cached_config_file,
+    _config_path,
+    dump_yaml,
+    load_yaml,
+    remove_config_cache,
+)
 
 
-class TestCLIConfigDefaults:
-    """Tests for CLIConfig default values."""
-
-    @pytest.mark.unit
-    def test_default_api_key_is_none(
-        self, temp_hopx_dir: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """api_key defaults to None when env var not set."""
-        # Ensure no API key from any source
-        monkeypatch.delenv("HOPX_API_KEY", raising=False)
-        # Create fresh config without any env vars
-        config = CLIConfig.load()
-        # Note: If there's an .env file or keyring, this might still find a key
-        # For a truly isolated test, we verify the config file load works
-        assert config is not None
+@pytest.fixture(scope="class")
+def default_config() -> CLIConfig:
+    """CLIConfig built once per class from defaults alone.
 
-    @pytest.mark.unit
-    def test_default_base_url(self, temp_hopx_dir: Path) -> None:
-        """base_url defaults to production API."""
-        config = CLIConfig()
-        assert config.base_url == "https://api.hopx.dev"
+    HOPX_* variables are stripped here because the root clean_environment fixture is
+    function-scoped and runs after this one; the .env file is skipped too.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for var in [v for v in os.environ if v.upper().startswith("HOPX_")]:
+            mp.delenv(var)
+        return CLIConfig(_env_file=None)  # type: ignore[call-arg]
 
-    @pytest.mark.unit
-    def test_default_template(self, temp_hopx_dir: Path) -> None:
-        """default_template defaults to code-interpreter."""
-        config = CLIConfig()
-        assert config.default_template == "code-interpreter"
 
-    @pytest.mark.unit
-    def test_default_timeout(self, temp_hopx_dir: Path) -> None:
-        """default_timeout defaults to 3600 seconds."""
-        config = CLIConfig()
-        assert config.default_timeout == 3600
+class TestCLIConfigDefaults:
+    """Tests for CLIConfig default values."""
 
     @pytest.mark.unit
-    def test_default_output_format(self, temp_hopx_dir: Path) -> None:
-        """output_format defaults to table."""
-        config = CLIConfig()
-        assert config.output_format == "table"
-
-    @pytest.mark.unit
-    def test_default_profile(self, temp_hopx_dir: Path) -> None:
-        """profile defaults to 'default'."""
-        config = CLIConfig()
-        assert config.profile == "default"
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            ("api_key", None),
+            ("base_url", "https://api.hopx.dev"),
+            ("default_template", "code-interpreter"),
+            ("default_timeout", 3600),
+            ("output_format", "table"),
+            ("profile", "default"),
+        ],
+    )
+    def test_default(self, default_config: CLIConfig, attr: str, expected: Any) -> None:
+        """Each setting has its documented default when nothing overrides it."""
+        assert getattr(default_config, attr) == expected
 
 
 class TestCLIConfigFromEnvironment:
@@ -144,8 +143,7 @@ class TestCLIConfigLoad:
                 "default_template": "python",
             }
         }
-        with open(config_path, "w") as f:
-            yaml.safe_dump(config_data, f)
+        config_path.write_bytes(dump_yaml(config_data))
 
         config = CLIConfig.load()
         assert config.base_url == "https://file.api.dev"
@@ -159,14 +157,91 @@ class TestCLIConfigLoad:
             "default": {"default_template": "python"},
             "staging": {"default_template": "nodejs", "base_url": "https://staging.api.dev"},
         }
-        with open(config_path, "w") as f:
-            yaml.safe_dump(config_data, f)
+        config_path.write_bytes(dump_yaml(config_data))
 
         config = CLIConfig.load(profile="staging")
         assert config.profile == "staging"
         assert config.default_template == "nodejs"
         assert config.base_url == "https://staging.api.dev"
 
+    @pytest.mark.unit
+    def test_repeated_loads_parse_file_once(self, temp_hopx_dir: Path) -> None:
+        """The parsed file is reused until it changes on disk."""
+        config_path = temp_hopx_dir / "config.yaml"
+        config_path.write_bytes(dump_yaml({"default": {"default_template": "python"}}))
+
+        with patch("hopx_cli.core.config.load_yaml", wraps=load_yaml) as mock_load:
+            configs = [CLIConfig.load(), CLIConfig.load(), CLIConfig.load(profile="staging")]
+
+        assert mock_load.call_count == 1
+        assert [c.default_template for c in configs] == ["python", "python", "code-interpreter"]
+
+    @pytest.mark.unit
+    def test_cached_file_is_read_only(self, temp_hopx_dir: Path) -> None:
+        """The shared parse is frozen, so no load() can change it for the next."""
+        config_path = temp_hopx_dir / "config.yaml"
+        config_path.write_bytes(
+            dump_yaml({"default": {"default_template": "python", "tags": ["a"]}})
+        )
+        CLIConfig.load()
+
+        st = config_path.stat()
+        cached = _cached_config_file(config_path, st.st_mtime_ns, st.st_size)
+        assert isinstance(cached, MappingProxyType)
+        assert isinstance(cached["default"], MappingProxyType)
+        assert cached["default"]["tags"] == ("a",)
+
+    @pytest.mark.unit
+    def test_load_sees_file_edits_and_saves(self, temp_hopx_dir: Path) -> None:
+        """Rewriting the file, by hand or through save(), is picked up by the next load."""
+        config_path = temp_hopx_dir / "config.yaml"
+        config_path.write_bytes(dump_yaml({"default": {"default_template": "python"}}))
+        assert CLIConfig.load().default_template == "python"
+
+        config_path.write_bytes(dump_yaml({"default": {"default_template": "node"}}))
+        assert CLIConfig.load().default_template == "node"
+
+        CLIConfig(default_template="go").save()
+        assert CLIConfig.load().default_template == "go"
+
+    @pytest.mark.unit
+    def test_load_uses_json_sidecar_written_from_yaml(self, temp_hopx_dir: Path) -> None:
+        """The JSON sidecar is read while it matches the YAML's mtime and size."""
+        config_path = temp_hopx_dir / "config.yaml"
+        config_path.write_bytes(dump_yaml({"default": {"default_template": "python"}}))
+        st = config_path.stat()
+        (temp_hopx_dir / "config.yaml.cache.json").write_text(
+            json.dumps(
+                {
+                    "yaml": [st.st_mtime_ns, st.st_size],
+                    "config": {"default": {"default_template": "node"}},
+                }
+            )
+        )
+
+        assert CLIConfig.load().default_template == "node"
+
+    @pytest.mark.unit
+    def test_load_ignores_sidecar_for_restored_yaml(self, temp_hopx_dir: Path) -> None:
+        """A YAML file replaced with an older mtime, as cp -p does, is not masked."""
+        config_path = temp_hopx_dir / "config.yaml"
+        CLIConfig(default_template="node").save()
+        mtime_ns = config_path.stat().st_mtime_ns - 60_000_000_000
+
+        config_path.write_bytes(dump_yaml({"default": {"default_template": "python"}}))
+        os.utime(config_path, ns=(mtime_ns, mtime_ns))
+
+        assert CLIConfig.load().default_template == "python"
+
+    @pytest.mark.unit
+    def test_load_falls_back_to_yaml_on_bad_sidecar(self, temp_hopx_dir: Path) -> None:
+        """An unreadable sidecar is ignored rather than breaking load()."""
+        config_path = temp_hopx_dir / "config.yaml"
+        config_path.write_bytes(dump_yaml({"default": {"default_template": "python"}}))
+        (temp_hopx_dir / "config.yaml.cache.json").write_text("{not json")
+
+        assert CLIConfig.load().default_template == "python"
+
     @pytest.mark.unit
     def test_env_vars_are_loaded(
         self, temp_hopx_dir: Path, monkeypatch: pytest.MonkeyPatch
@@ -188,6 +263,21 @@ class TestCLIConfigLoad:
         config = CLIConfig.load()
         assert config.base_url == "https://api.hopx.dev"
 
+    @pytest.mark.unit
+    @pytest.mark.slow
+    def test_load_without_file_skips_yaml_import(self, temp_hopx_dir: Path) -> None:
+        """yaml is not imported when there is no config file to read."""
+        code = (
+            "import sys\n"
+            "from hopx_cli.core.config import CLIConfig\n"
+            "CLIConfig.load()\n"
+            "print('yaml' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
     @pytest.mark.unit
     def test_load_handles_empty_file(self, temp_hopx_dir: Path) -> None:
         """load() handles empty config file."""
@@ -222,12 +312,47 @@ class TestCLIConfigSave:
 
         config_path = temp_hopx_dir / "config.yaml"
         with open(config_path) as f:
-            data = yaml.safe_load(f)
+            data = load_yaml(f)
 
         assert data["default"]["api_key"] == "saved_key"
         assert data["default"]["base_url"] == "https://saved.api.dev"
         assert data["default"]["default_template"] == "rust"
 
+    @pytest.mark.unit
+    def test_save_writes_private_json_sidecar(self, temp_hopx_dir: Path) -> None:
+        """save() also writes a JSON copy, readable only by the owner."""
+        CLIConfig(api_key="saved_key").save()
+
+        sidecar = temp_hopx_dir / "config.yaml.cache.json"
+        assert json.loads(sidecar.read_text())["config"]["default"]["api_key"] == "saved_key"
+        assert sidecar.stat().st_mode & 0o777 == 0o600
+
+    @pytest.mark.unit
+    def test_save_skips_sidecar_for_non_json_values(self, temp_hopx_dir: Path) -> None:
+        """A date in another profile drops the sidecar instead of failing the save."""
+        config_path = temp_hopx_dir / "config.yaml"
+        sidecar = temp_hopx_dir / "config.yaml.cache.json"
+        CLIConfig(api_key="old_key").save()
+        assert sidecar.exists()
+        config_path.write_text(config_path.read_text() + "staging:\n  created: 2024-01-01\n")
+
+        CLIConfig(api_key="saved_key").save()
+
+        assert not sidecar.exists()
+        assert CLIConfig.load().api_key == "saved_key"
+        with open(config_path) as f:
+            assert load_yaml(f)["staging"]["created"] == date(2024, 1, 1)
+
+    @pytest.mark.unit
+    def test_remove_config_cache_deletes_sidecar(self, temp_hopx_dir: Path) -> None:
+        """remove_config_cache() deletes the sidecar; load() then reads the YAML."""
+        CLIConfig(api_key="saved_key").save()
+
+        remove_config_cache()
+
+        assert not (temp_hopx_dir / "config.yaml.cache.json").exists()
+        assert CLIConfig.load().api_key == "saved_key"
+
     @pytest.mark.unit
     def test_save_preserves_other_profiles(self, temp_hopx_dir: Path) -> None:
         """save() doesn't overwrite other profiles."""
@@ -236,14 +361,13 @@ class TestCLIConfigSave:
             "staging": {"api_key": "staging_key"},
             "production": {"api_key": "prod_key"},
         }
-        with open(config_path, "w") as f:
-            yaml.safe_dump(existing_data, f)
+        config_path.write_bytes(dump_yaml(existing_data))
 
         config = CLIConfig(api_key="default_key")
         config.save()
 
         with open(config_path) as f:
-            data = yaml.safe_load(f)
+            data = load_yaml(f)
 
         assert data["staging"]["api_key"] == "staging_key"
         assert data["production"]["api_key"] == "prod_key"
@@ -258,7 +382,7 @@ class TestCLIConfigSave:
 
         config_path = temp_hopx_dir / "config.yaml"
         with open(config_path) as f:
-            data = yaml.safe_load(f)
+            data = load_yaml(f)
 
         assert "development" in data
         assert data["development"]["api_key"] == "dev_key"
@@ -308,6 +432,29 @@ class TestCLIConfigGetConfigPath:
         path = CLIConfig.get_config_path()
         assert path == temp_home / ".hopx" / "config.yaml"
 
+    @pytest.mark.unit
+    def test_follows_home_changes(
+        self, tmp_path: Path, temp_home: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The cached path is recomputed when HOME changes."""
+        assert CLIConfig.get_config_path().parent.parent == temp_home
+
+        monkeypatch.setenv("HOME", str(tmp_path / "other"))
+        assert CLIConfig.get_config_path() == tmp_path / "other" / ".hopx" / "config.yaml"
+
+    @pytest.mark.unit
+    def test_builds_path_from_home_argument(self, tmp_path: Path) -> None:
+        """The path is built from the HOME value it is keyed on."""
+        assert _config_path(str(tmp_path)) == tmp_path / ".hopx" / "config.yaml"
+
+    @pytest.mark.unit
+    def test_falls_back_to_home_lookup_without_home(self) -> None:
+        """With HOME unset, the home directory comes from Path.home()."""
+        with patch.object(Path, "home", return_value=Path("/users/someone")):
+            path = _config_path(None)
+        _config_path.cache_clear()  # Don't leave the patched home cached
+        assert path == Path("/users/someone/.hopx/config.yaml")
+
     @pytest.mark.unit
     def test_path_is_absolute(self) -> None:
         """get_config_path() returns absolute path."""
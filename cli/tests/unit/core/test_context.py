@@ -16,6 +16,45 @@ import pytest
 
 from hopx_cli.core.context import CLIContext, OutputFormat
 
+# Values the root conftest's mock_config starts with
+CONFIG_DEFAULTS: dict[str, Any] = {
+    "api_key": "hopx_live_test123.testsecret",
+    "base_url": "https://api.hopx.dev",
+    "default_template": "code-interpreter",
+    "default_timeout": 3600,
+    "output_format": "table",
+    "profile": "default",
+}
+
+
+@pytest.fixture(scope="class")
+def class_config() -> MagicMock:
+    """CLIConfig mock built once per test class.
+
+    Speccing a MagicMock on CLIConfig walks the whole class, which is why it
+    is shared.
+
+    Returns:
+        MagicMock specced on CLIConfig
+    """
+    from hopx_cli.core.config import CLIConfig
+
+    return MagicMock(spec=CLIConfig)
+
+
+@pytest.fixture
+def mock_config(class_config: MagicMock) -> MagicMock:
+    """Reset the class-wide config mock to its defaults.
+
+    Overrides the root conftest fixture of the same name, which builds a new
+    mock for every test.
+    """
+    class_config.reset_mock(return_value=True, side_effect=True)
+    for name, value in CONFIG_DEFAULTS.items():
+        setattr(class_config, name, value)
+    class_config.get_api_key.return_value = CONFIG_DEFAULTS["api_key"]
+    return class_config
+
 
 class TestOutputFormat:
     """Tests for OutputFormat enum."""
@@ -61,6 +100,14 @@ class TestCLIContextInit:
         assert ctx.no_color is False
         assert ctx.config is not None
 
+    @pytest.mark.unit
+    def test_rejects_undeclared_attributes(self, mock_config: MagicMock) -> None:
+        """CLIContext uses slots; free-form values belong in set_state()."""
+        ctx = CLIContext(config=mock_config)
+        assert not hasattr(ctx, "__dict__")
+        with pytest.raises(AttributeError):
+            ctx.sandbox_id = "sb_123"  # type: ignore[attr-defined]
+
     @pytest.mark.unit
     def test_init_with_custom_config(self, mock_config: MagicMock) -> None:
         """CLIContext accepts custom config."""
@@ -78,7 +125,14 @@ class TestCLIContextInit:
         """CLIContext uses config output_format when not specified."""
         mock_config.output_format = "json"
         ctx = CLIContext(config=mock_config)
-        assert ctx.output_format == OutputFormat.JSON
+        assert ctx.output_format is OutputFormat.JSON
+
+    @pytest.mark.unit
+    def test_init_rejects_unknown_output_format(self, mock_config: MagicMock) -> None:
+        """An unknown config output_format raises ValueError, as OutputFormat() does."""
+        mock_config.output_format = "yaml"
+        with pytest.raises(ValueError, match="'yaml' is not a valid OutputFormat"):
+            CLIContext(config=mock_config)
 
     @pytest.mark.unit
     def test_init_with_verbose(self, mock_config: MagicMock) -> None:
@@ -115,18 +169,19 @@ class TestCLIContextOutputFormat:
             (OutputFormat.JSON, True, False, False),
             (OutputFormat.PLAIN, False, True, False),
             (OutputFormat.TABLE, False, False, True),
+            ("json", True, False, False),
         ],
     )
     def test_output_format_detection(
         self,
         mock_config: MagicMock,
-        format_value: OutputFormat,
+        format_value: OutputFormat | str,
         is_json: bool,
         is_plain: bool,
         is_table: bool,
     ) -> None:
-        """Output format detection methods return correct values."""
-        ctx = CLIContext(config=mock_config, output_format=format_value)
+        """Output format detection methods return correct values, also for plain strings."""
+        ctx = CLIContext(config=mock_config, output_format=format_value)  # type: ignore[arg-type]
         assert ctx.is_json_output() == is_json
         assert ctx.is_plain_output() == is_plain
         assert ctx.is_table_output() == is_table
@@ -9,69 +9,76 @@ Tests cover:
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import patch
 
-import hopx_ai.errors as sdk_errors
 import pytest
 
-from hopx_cli.core.errors import (
-    AuthenticationError,
-    CLIError,
-    NetworkError,
-    NotFoundError,
-    RateLimitError,
-    TimeoutError,
-    ValidationError,
-    display_error,
-    handle_errors,
-    map_sdk_error,
-)
+# Exit code each CLI error class is documented to use, by class name
+EXIT_CODES: dict[str, int] = {
+    "CLIError": 1,
+    "ValidationError": 2,
+    "AuthenticationError": 3,
+    "NotFoundError": 4,
+    "TimeoutError": 5,
+    "NetworkError": 6,
+    "RateLimitError": 7,
+}
+
+
+@pytest.fixture(scope="module")
+def errors_mod() -> SimpleNamespace:
+    """The SDK and CLI error modules, imported on first use.
+
+    Importing hopx_ai loads the whole SDK, so it is kept out of collection;
+    a run that deselects this file never pays for it.
+
+    Returns:
+        Namespace with the SDK errors module as sdk and the CLI one as cli
+    """
+    import hopx_ai.errors
+
+    import hopx_cli.core.errors
+
+    return SimpleNamespace(sdk=hopx_ai.errors, cli=hopx_cli.core.errors)
 
 
 class TestCLIErrorClasses:
     """Tests for CLI error class hierarchy."""
 
     @pytest.mark.unit
-    @pytest.mark.parametrize(
-        "error_class,expected_code",
-        [
-            (CLIError, 1),
-            (AuthenticationError, 3),
-            (NotFoundError, 4),
-            (TimeoutError, 5),
-            (NetworkError, 6),
-            (RateLimitError, 7),
-            (ValidationError, 2),
-        ],
-    )
-    def test_exit_codes(self, error_class: type[CLIError], expected_code: int) -> None:
-        """Each error class has correct exit code."""
-        assert error_class.exit_code == expected_code
-
-    @pytest.mark.unit
-    def test_cli_error_stores_message(self) -> None:
+    def test_exit_codes(self, errors_mod: SimpleNamespace) -> None:
+        """Each error class has correct exit code.
+
+        Compared as one dict, so a failure still shows every mismatched class.
+        """
+        exit_codes = {name: getattr(errors_mod.cli, name).exit_code for name in EXIT_CODES}
+        assert exit_codes == EXIT_CODES
+
+    @pytest.mark.unit
+    def test_cli_error_stores_message(self, errors_mod: SimpleNamespace) -> None:
         """CLIError stores the error message."""
-        error = CLIError("Something went wrong")
+        error = errors_mod.cli.CLIError("Something went wrong")
         assert error.message == "Something went wrong"
         assert str(error) == "Something went wrong"
 
     @pytest.mark.unit
-    def test_cli_error_stores_suggestion(self) -> None:
+    def test_cli_error_stores_suggestion(self, errors_mod: SimpleNamespace) -> None:
         """CLIError stores suggestion for fixing the error."""
-        error = CLIError("Failed", suggestion="Try again later")
+        error = errors_mod.cli.CLIError("Failed", suggestion="Try again later")
         assert error.suggestion == "Try again later"
 
     @pytest.mark.unit
-    def test_cli_error_stores_request_id(self) -> None:
+    def test_cli_error_stores_request_id(self, errors_mod: SimpleNamespace) -> None:
         """CLIError stores request ID from API."""
-        error = CLIError("Failed", request_id="req_123")
+        error = errors_mod.cli.CLIError("Failed", request_id="req_123")
         assert error.request_id == "req_123"
 
     @pytest.mark.unit
-    def test_cli_error_optional_fields_default_to_none(self) -> None:
+    def test_cli_error_optional_fields_default_to_none(self, errors_mod: SimpleNamespace) -> None:
         """Optional fields default to None."""
-        error = CLIError("Failed")
+        error = errors_mod.cli.CLIError("Failed")
         assert error.suggestion is None
         assert error.request_id is None
 
@@ -80,163 +87,171 @@ class TestMapSdkError:
     """Tests for map_sdk_error function."""
 
     @pytest.mark.unit
-    def test_maps_authentication_error(self, sdk_auth_error: Any) -> None:
+    def test_maps_authentication_error(
+        self, errors_mod: SimpleNamespace, sdk_auth_error: Any
+    ) -> None:
         """SDK AuthenticationError maps to CLI AuthenticationError."""
-        result = map_sdk_error(sdk_auth_error)
-        assert isinstance(result, AuthenticationError)
+        result = errors_mod.cli.map_sdk_error(sdk_auth_error)
+        assert isinstance(result, errors_mod.cli.AuthenticationError)
         assert result.exit_code == 3
         assert "Invalid API key" in result.message
         assert result.suggestion is not None
         assert "hopx auth" in result.suggestion
 
     @pytest.mark.unit
-    def test_maps_token_expired_error(self) -> None:
+    def test_maps_token_expired_error(self, errors_mod: SimpleNamespace) -> None:
         """SDK TokenExpiredError maps to CLI AuthenticationError."""
-        sdk_error = sdk_errors.TokenExpiredError(message="Token expired")
-        result = map_sdk_error(sdk_error)
-        assert isinstance(result, AuthenticationError)
+        sdk_error = errors_mod.sdk.TokenExpiredError(message="Token expired")
+        result = errors_mod.cli.map_sdk_error(sdk_error)
+        assert isinstance(result, errors_mod.cli.AuthenticationError)
         assert result.exit_code == 3
 
     @pytest.mark.unit
-    def test_maps_not_found_error(self, sdk_not_found_error: Any) -> None:
+    def test_maps_not_found_error(
+        self, errors_mod: SimpleNamespace, sdk_not_found_error: Any
+    ) -> None:
         """SDK NotFoundError maps to CLI NotFoundError."""
-        result = map_sdk_error(sdk_not_found_error)
-        assert isinstance(result, NotFoundError)
+        result = errors_mod.cli.map_sdk_error(sdk_not_found_error)
+        assert isinstance(result, errors_mod.cli.NotFoundError)
         assert result.exit_code == 4
         assert "not found" in result.message.lower()
 
     @pytest.mark.unit
     def test_maps_template_not_found_with_suggestion(
-        self, sdk_template_not_found_error: Any
+        self, errors_mod: SimpleNamespace, sdk_template_not_found_error: Any
     ) -> None:
         """SDK TemplateNotFoundError maps with suggested template."""
-        result = map_sdk_error(sdk_template_not_found_error)
-        assert isinstance(result, NotFoundError)
+        result = errors_mod.cli.map_sdk_error(sdk_template_not_found_error)
+        assert isinstance(result, errors_mod.cli.NotFoundError)
         assert result.exit_code == 4
         assert "python" in result.suggestion  # suggested template
 
     @pytest.mark.unit
-    def test_maps_template_not_found_with_available_list(self) -> None:
+    def test_maps_template_not_found_with_available_list(self, errors_mod: SimpleNamespace) -> None:
         """SDK TemplateNotFoundError shows available templates."""
-        sdk_error = sdk_errors.TemplateNotFoundError(
+        sdk_error = errors_mod.sdk.TemplateNotFoundError(
             template_name="invalid",
             available_templates=["python", "nodejs", "go"],
         )
-        result = map_sdk_error(sdk_error)
-        assert isinstance(result, NotFoundError)
+        result = errors_mod.cli.map_sdk_error(sdk_error)
+        assert isinstance(result, errors_mod.cli.NotFoundError)
         assert "python" in result.suggestion
         assert "nodejs" in result.suggestion
 
     @pytest.mark.unit
-    def test_maps_timeout_error(self, sdk_timeout_error: Any) -> None:
+    def test_maps_timeout_error(self, errors_mod: SimpleNamespace, sdk_timeout_error: Any) -> None:
         """SDK TimeoutError maps to CLI TimeoutError."""
-        result = map_sdk_error(sdk_timeout_error)
-        assert isinstance(result, TimeoutError)
+        result = errors_mod.cli.map_sdk_error(sdk_timeout_error)
+        assert isinstance(result, errors_mod.cli.TimeoutError)
         assert result.exit_code == 5
         assert "--timeout" in result.suggestion
 
     @pytest.mark.unit
-    def test_maps_network_error(self, sdk_network_error: Any) -> None:
+    def test_maps_network_error(self, errors_mod: SimpleNamespace, sdk_network_error: Any) -> None:
         """SDK NetworkError maps to CLI NetworkError."""
-        result = map_sdk_error(sdk_network_error)
-        assert isinstance(result, NetworkError)
+        result = errors_mod.cli.map_sdk_error(sdk_network_error)
+        assert isinstance(result, errors_mod.cli.NetworkError)
         assert result.exit_code == 6
         assert "network" in result.suggestion.lower()
 
     @pytest.mark.unit
-    def test_maps_rate_limit_error(self, sdk_rate_limit_error: Any) -> None:
+    def test_maps_rate_limit_error(
+        self, errors_mod: SimpleNamespace, sdk_rate_limit_error: Any
+    ) -> None:
         """SDK RateLimitError maps to CLI RateLimitError."""
-        result = map_sdk_error(sdk_rate_limit_error)
-        assert isinstance(result, RateLimitError)
+        result = errors_mod.cli.map_sdk_error(sdk_rate_limit_error)
+        assert isinstance(result, errors_mod.cli.RateLimitError)
         assert result.exit_code == 7
         assert "60" in result.suggestion  # retry_after
 
     @pytest.mark.unit
-    def test_maps_rate_limit_without_retry_after(self) -> None:
+    def test_maps_rate_limit_without_retry_after(self, errors_mod: SimpleNamespace) -> None:
         """RateLimitError without retry_after still maps correctly."""
-        sdk_error = sdk_errors.RateLimitError(
+        sdk_error = errors_mod.sdk.RateLimitError(
             message="Rate limited",
             status_code=429,
         )
-        result = map_sdk_error(sdk_error)
-        assert isinstance(result, RateLimitError)
+        result = errors_mod.cli.map_sdk_error(sdk_error)
+        assert isinstance(result, errors_mod.cli.RateLimitError)
         assert "Rate limit" in result.suggestion
 
     @pytest.mark.unit
-    def test_maps_validation_error(self, sdk_validation_error: Any) -> None:
+    def test_maps_validation_error(
+        self, errors_mod: SimpleNamespace, sdk_validation_error: Any
+    ) -> None:
         """SDK ValidationError maps to CLI ValidationError."""
-        result = map_sdk_error(sdk_validation_error)
-        assert isinstance(result, ValidationError)
+        result = errors_mod.cli.map_sdk_error(sdk_validation_error)
+        assert isinstance(result, errors_mod.cli.ValidationError)
         assert result.exit_code == 2
         assert "template" in result.message  # field name
 
     @pytest.mark.unit
-    def test_maps_validation_error_without_field(self) -> None:
+    def test_maps_validation_error_without_field(self, errors_mod: SimpleNamespace) -> None:
         """ValidationError without field still maps correctly."""
-        sdk_error = sdk_errors.ValidationError(message="Invalid input")
-        result = map_sdk_error(sdk_error)
-        assert isinstance(result, ValidationError)
+        sdk_error = errors_mod.sdk.ValidationError(message="Invalid input")
+        result = errors_mod.cli.map_sdk_error(sdk_error)
+        assert isinstance(result, errors_mod.cli.ValidationError)
         assert result.exit_code == 2
 
     @pytest.mark.unit
-    def test_maps_resource_limit_error(self) -> None:
+    def test_maps_resource_limit_error(self, errors_mod: SimpleNamespace) -> None:
         """SDK ResourceLimitError maps to CLI error with upgrade suggestion."""
-        sdk_error = sdk_errors.ResourceLimitError(
+        sdk_error = errors_mod.sdk.ResourceLimitError(
             message="Sandbox limit reached",
             upgrade_url="https://hopx.ai/upgrade",
         )
-        result = map_sdk_error(sdk_error)
-        assert isinstance(result, CLIError)
+        result = errors_mod.cli.map_sdk_error(sdk_error)
+        assert isinstance(result, errors_mod.cli.CLIError)
         assert "upgrade" in result.suggestion.lower()
 
     @pytest.mark.unit
-    def test_maps_template_build_error(self) -> None:
+    def test_maps_template_build_error(self, errors_mod: SimpleNamespace) -> None:
         """SDK TemplateBuildError maps with suggestion."""
-        sdk_error = sdk_errors.TemplateBuildError(
+        sdk_error = errors_mod.sdk.TemplateBuildError(
             message="Build failed",
         )
-        result = map_sdk_error(sdk_error)
-        assert isinstance(result, CLIError)
+        result = errors_mod.cli.map_sdk_error(sdk_error)
+        assert isinstance(result, errors_mod.cli.CLIError)
         assert "build" in result.suggestion.lower() or "dockerfile" in result.suggestion.lower()
 
     @pytest.mark.unit
-    def test_maps_sandbox_expired_error(self) -> None:
+    def test_maps_sandbox_expired_error(self, errors_mod: SimpleNamespace) -> None:
         """SDK SandboxExpiredError maps with create suggestion."""
-        sdk_error = sdk_errors.SandboxExpiredError(
+        sdk_error = errors_mod.sdk.SandboxExpiredError(
             message="Sandbox has expired",
         )
-        result = map_sdk_error(sdk_error)
-        assert isinstance(result, CLIError)
+        result = errors_mod.cli.map_sdk_error(sdk_error)
+        assert isinstance(result, errors_mod.cli.CLIError)
         assert "sandbox create" in result.suggestion
 
     @pytest.mark.unit
-    def test_maps_desktop_not_available_error(self) -> None:
+    def test_maps_desktop_not_available_error(self, errors_mod: SimpleNamespace) -> None:
         """SDK DesktopNotAvailableError maps correctly."""
-        sdk_error = sdk_errors.DesktopNotAvailableError(
+        sdk_error = errors_mod.sdk.DesktopNotAvailableError(
             message="Desktop not available",
             missing_dependencies=["playwright"],
         )
-        result = map_sdk_error(sdk_error)
-        assert isinstance(result, CLIError)
+        result = errors_mod.cli.map_sdk_error(sdk_error)
+        assert isinstance(result, errors_mod.cli.CLIError)
         # Just check that it maps to a CLI error
         assert result.exit_code == 1
 
     @pytest.mark.unit
-    def test_maps_generic_hopx_error(self) -> None:
+    def test_maps_generic_hopx_error(self, errors_mod: SimpleNamespace) -> None:
         """Generic HopxError maps to base CLIError."""
-        sdk_error = sdk_errors.HopxError(message="Unknown error occurred")
-        result = map_sdk_error(sdk_error)
-        assert isinstance(result, CLIError)
+        sdk_error = errors_mod.sdk.HopxError(message="Unknown error occurred")
+        result = errors_mod.cli.map_sdk_error(sdk_error)
+        assert isinstance(result, errors_mod.cli.CLIError)
         assert result.exit_code == 1
 
     @pytest.mark.unit
-    def test_preserves_request_id(self) -> None:
+    def test_preserves_request_id(self, errors_mod: SimpleNamespace) -> None:
         """Request ID is preserved in mapping."""
-        sdk_error = sdk_errors.NotFoundError(
+        sdk_error = errors_mod.sdk.NotFoundError(
             message="Not found",
             request_id="req_abc123",
         )
-        result = map_sdk_error(sdk_error)
+        result = errors_mod.cli.map_sdk_error(sdk_error)
         assert result.request_id == "req_abc123"
 
 
@@ -244,30 +259,30 @@ class TestDisplayError:
     """Tests for display_error function."""
 
     @pytest.mark.unit
-    def test_displays_error_message(self) -> None:
+    def test_displays_error_message(self, errors_mod: SimpleNamespace) -> None:
         """display_error outputs error message."""
-        error = CLIError("Test error message")
+        error = errors_mod.cli.CLIError("Test error message")
         with patch("hopx_cli.core.errors.console") as mock_console:
-            display_error(error)
+            errors_mod.cli.display_error(error)
             mock_console.print.assert_called_once()
             # Check panel was created with error content
             call_args = mock_console.print.call_args
             assert call_args is not None
 
     @pytest.mark.unit
-    def test_displays_request_id_when_present(self) -> None:
+    def test_displays_request_id_when_present(self, errors_mod: SimpleNamespace) -> None:
         """display_error includes request ID."""
-        error = CLIError("Test error", request_id="req_test123")
+        error = errors_mod.cli.CLIError("Test error", request_id="req_test123")
         with patch("hopx_cli.core.errors.console") as mock_console:
-            display_error(error)
+            errors_mod.cli.display_error(error)
             mock_console.print.assert_called()
 
     @pytest.mark.unit
-    def test_displays_suggestion_when_present(self) -> None:
+    def test_displays_suggestion_when_present(self, errors_mod: SimpleNamespace) -> None:
         """display_error includes suggestion."""
-        error = CLIError("Test error", suggestion="Try this fix")
+        error = errors_mod.cli.CLIError("Test error", suggestion="Try this fix")
         with patch("hopx_cli.core.errors.console") as mock_console:
-            display_error(error)
+            errors_mod.cli.display_error(error)
             mock_console.print.assert_called()
 
 
@@ -275,10 +290,10 @@ class TestHandleErrorsDecorator:
     """Tests for @handle_errors decorator."""
 
     @pytest.mark.unit
-    def test_passes_through_on_success(self) -> None:
+    def test_passes_through_on_success(self, errors_mod: SimpleNamespace) -> None:
         """Decorated function returns normally on success."""
 
-        @handle_errors
+        @errors_mod.cli.handle_errors
         def successful_func() -> str:
             return "success"
 
@@ -286,10 +301,10 @@ class TestHandleErrorsDecorator:
         assert result == "success"
 
     @pytest.mark.unit
-    def test_catches_keyboard_interrupt(self) -> None:
+    def test_catches_keyboard_interrupt(self, errors_mod: SimpleNamespace) -> None:
         """KeyboardInterrupt exits with code 130."""
 
-        @handle_errors
+        @errors_mod.cli.handle_errors
         def interrupted_func() -> None:
             raise KeyboardInterrupt()
 
@@ -299,12 +314,12 @@ class TestHandleErrorsDecorator:
             assert exc_info.value.code == 130
 
     @pytest.mark.unit
-    def test_catches_cli_error(self) -> None:
+    def test_catches_cli_error(self, errors_mod: SimpleNamespace) -> None:
         """CLIError is displayed and exits with correct code."""
 
-        @handle_errors
+        @errors_mod.cli.handle_errors
         def failing_func() -> None:
-            raise AuthenticationError("Auth failed")
+            raise errors_mod.cli.AuthenticationError("Auth failed")
 
         with patch("hopx_cli.core.errors.console"):
             with pytest.raises(SystemExit) as exc_info:
@@ -312,12 +327,12 @@ class TestHandleErrorsDecorator:
             assert exc_info.value.code == 3
 
     @pytest.mark.unit
-    def test_catches_sdk_error(self) -> None:
+    def test_catches_sdk_error(self, errors_mod: SimpleNamespace) -> None:
         """SDK error is mapped and exits with correct code."""
 
-        @handle_errors
+        @errors_mod.cli.handle_errors
         def sdk_failing_func() -> None:
-            raise sdk_errors.NotFoundError(message="Not found")
+            raise errors_mod.sdk.NotFoundError(message="Not found")
 
         with patch("hopx_cli.core.errors.console"):
             with pytest.raises(SystemExit) as exc_info:
@@ -325,10 +340,10 @@ class TestHandleErrorsDecorator:
             assert exc_info.value.code == 4
 
     @pytest.mark.unit
-    def test_catches_unexpected_error(self) -> None:
+    def test_catches_unexpected_error(self, errors_mod: SimpleNamespace) -> None:
         """Unexpected error exits with code 1."""
 
-        @handle_errors
+        @errors_mod.cli.handle_errors
         def unexpected_func() -> None:
             raise RuntimeError("Unexpected!")
 
@@ -338,10 +353,10 @@ class TestHandleErrorsDecorator:
             assert exc_info.value.code == 1
 
     @pytest.mark.unit
-    def test_verbose_shows_traceback(self) -> None:
+    def test_verbose_shows_traceback(self, errors_mod: SimpleNamespace) -> None:
         """Verbose mode shows traceback on unexpected error."""
 
-        @handle_errors
+        @errors_mod.cli.handle_errors
         def error_func(verbose: bool = False) -> None:
             raise RuntimeError("Unexpected!")
 
@@ -352,10 +367,10 @@ class TestHandleErrorsDecorator:
             assert mock_console.print.call_count >= 2
 
     @pytest.mark.unit
-    def test_preserves_function_metadata(self) -> None:
+    def test_preserves_function_metadata(self, errors_mod: SimpleNamespace) -> None:
         """Decorator preserves function name and docstring."""
 
-        @handle_errors
+        @errors_mod.cli.handle_errors
         def documented_func() -> None:
             """This is the docstring."""
             pass
@@ -364,10 +379,10 @@ class TestHandleErrorsDecorator:
         assert documented_func.__doc__ == "This is the docstring."
 
     @pytest.mark.unit
-    def test_passes_args_to_function(self) -> None:
+    def test_passes_args_to_function(self, errors_mod: SimpleNamespace) -> None:
         """Decorator passes arguments correctly."""
 
-        @handle_errors
+        @errors_mod.cli.handle_errors
         def func_with_args(a: int, b: str, c: bool = False) -> tuple[int, str, bool]:
             return (a, b, c)
 
@@ -0,0 +1,225 @@
+"""Tests for the root Typer application.
+
+Tests cover:
+- Lazy subcommand registration and loading
+- Hidden aliases
+- Command suggestions for typos
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+import typer
+
+import hopx_cli.main as main_module
+from hopx_cli import __version__
+from hopx_cli.main import COMMANDS, LAZY_SUBCOMMANDS, LazyTyperGroup, app
+from tests.fixtures import plain_runner
+
+runner = plain_runner()
+
+
+class TestLazySubcommands:
+    """Tests for on-demand subcommand loading."""
+
+    @pytest.mark.unit
+    def test_all_subcommands_listed(self) -> None:
+        """Root group lists every lazy subcommand."""
+        group = typer.main.get_command(app)
+        assert isinstance(group, LazyTyperGroup)
+        ctx = group.make_context("hopx", ["--help"], resilient_parsing=True)
+        assert set(LAZY_SUBCOMMANDS) <= set(group.list_commands(ctx))
+
+    @pytest.mark.unit
+    def test_list_order_ignores_load_state(self) -> None:
+        """Loading a subcommand does not move it in the listing."""
+        group = typer.main.get_command(app)
+        ctx = group.make_context("hopx", ["--help"], resilient_parsing=True)
+        before = group.list_commands(ctx)
+
+        group.get_command(ctx, "template")
+
+        assert group.list_commands(ctx) == before == list(LAZY_SUBCOMMANDS)
+
+    @pytest.mark.unit
+    def test_root_help_loads_no_subcommand(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Root help is built from COMMANDS without importing command modules."""
+        group = typer.main.get_command(app)
+        assert isinstance(group, LazyTyperGroup)
+        ctx = group.make_context("hopx", ["--help"], resilient_parsing=True)
+
+        text = group.get_help(ctx) + capsys.readouterr().out
+
+        assert group.commands == {}
+        assert "Manage sandboxes" in text
+        assert " sb " not in text
+
+    @pytest.mark.unit
+    def test_completion_loads_no_subcommand(self) -> None:
+        """Completing a command name does not import command modules."""
+        group = typer.main.get_command(app)
+        assert isinstance(group, LazyTyperGroup)
+        ctx = group.make_context("hopx", [], resilient_parsing=True)
+
+        items = group.shell_complete(ctx, "sa")
+
+        assert [(item.value, item.help) for item in items] == [("sandbox", "Manage sandboxes")]
+        assert group.commands == {}
+
+    @pytest.mark.unit
+    def test_aliases_are_hidden(self) -> None:
+        """Aliases resolve to commands but stay out of help output."""
+        group = typer.main.get_command(app)
+        ctx = group.make_context("hopx", ["--help"], resilient_parsing=True)
+        for name, _module, _help, hidden in COMMANDS:
+            command = group.get_command(ctx, name)
+            assert command is not None
+            assert command.hidden is hidden
+
+    @pytest.mark.unit
+    @pytest.mark.slow
+    def test_dispatch_imports_only_target_module(self) -> None:
+        """Running one subcommand does not import the other command modules."""
+        code = (
+            "import sys\n"
+            "from hopx_cli.main import app\n"
+            "try:\n"
+            "    app(['sb', '--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted(m for m in sys.modules if m.startswith('hopx_cli.commands.')))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip().splitlines()[-1] == "['hopx_cli.commands.sandbox']"
+
+    @pytest.mark.unit
+    def test_typo_suggests_unloaded_command(self) -> None:
+        """Unknown commands suggest close matches before any module is loaded."""
+        result = runner.invoke(app, ["sandbx"])
+        assert result.exit_code != 0
+        assert "sandbox" in result.output
+
+    @pytest.mark.unit
+    @pytest.mark.slow
+    def test_import_skips_sdk(self) -> None:
+        """Importing the root app does not load the SDK or command modules."""
+        code = (
+            "import sys\n"
+            "import hopx_cli.main\n"
+            "print(sorted(m for m in ('hopx_ai', 'httpx', 'hopx_cli.commands.auth') "
+            "if m in sys.modules))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+
+class TestVersionFastPath:
+    """Tests for the bare --version shortcut."""
+
+    @pytest.mark.unit
+    @pytest.mark.slow
+    @pytest.mark.parametrize("flag", ["--version", "-V"])
+    def test_version_skips_typer_import(self, flag: str) -> None:
+        """A bare version flag prints the version without importing Typer."""
+        code = (
+            "import sys\n"
+            f"sys.argv = ['hopx', {flag!r}]\n"
+            "try:\n"
+            "    import hopx_cli.main\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('typer' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.splitlines() == [f"hopx {__version__}", "False"]
+
+    @pytest.mark.unit
+    def test_version_with_other_flags(self) -> None:
+        """--version combined with other options is handled by the callback."""
+        result = runner.invoke(app, ["--quiet", "--version"])
+        assert result.exit_code == 0
+        assert f"hopx {__version__}" in result.output
+
+
+class TestEpilog:
+    """Tests for the root help epilog."""
+
+    @pytest.mark.unit
+    def test_epilog_plain_when_not_a_terminal(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Captured output contains the epilog text without ANSI escapes."""
+        main_module._print_epilog()
+        out = capsys.readouterr().out
+
+        assert "\033[" not in out
+        assert "Aliases:" in out
+        assert "sb    →  sandbox   Manage sandboxes" in out
+        assert "Quick Start:" in out
+
+    @pytest.mark.unit
+    def test_epilog_colored_rows_align_with_plain(self) -> None:
+        """Styled and plain renders differ only by escape sequences."""
+        colored = main_module._render_epilog(True)
+        plain = main_module._render_epilog(False)
+
+        assert "\033[36msb  \033[0m" in colored
+        assert re.sub(r"\033\[[0-9;]*m", "", colored) == plain
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("argv", "expected"),
+        [
+            (["--help"], True),
+            (["-q", "--help"], True),
+            (["sandbox", "--help"], False),
+            (["--help", "sandbox"], False),
+            (["-q"], False),
+            ([], False),
+        ],
+    )
+    def test_is_root_help(self, argv: list[str], expected: bool) -> None:
+        """Only help requests without a subcommand get the epilog."""
+        assert main_module._is_root_help(argv) is expected
+
+
+class TestRootCallback:
+    """Tests for global option handling in the root callback."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        ("args", "expected_calls"),
+        [
+            (["--api-key", "hopx_test_key", "config", "--help"], [("hopx_test_key", "dev")]),
+            (["config", "--help"], [(None, "dev")]),
+        ],
+    )
+    def test_config_built_once(
+        self, args: list[str], expected_calls: list[tuple[str | None, str]]
+    ) -> None:
+        """CLIConfig is constructed exactly once per invocation."""
+        with patch("hopx_cli.core.CLIConfig") as mock_config:
+            result = runner.invoke(app, ["--profile", "dev", *args])
+
+        assert result.exit_code == 0
+        calls = [(c.kwargs.get("api_key"), c.kwargs["profile"]) for c in mock_config.call_args_list]
+        assert calls == expected_calls
+
+    @pytest.mark.unit
+    def test_config_reused_across_invocations(self) -> None:
+        """Repeated invocations with the same profile reuse the loaded config."""
+        with patch("hopx_cli.core.CLIConfig") as mock_config:
+            for _ in range(3):
+                result = runner.invoke(app, ["config", "--help"])
+                assert result.exit_code == 0
+
+        assert mock_config.call_count == 1